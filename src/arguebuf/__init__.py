@@ -11,8 +11,11 @@ from .model import (
     AtomNode,
     AtomOrSchemeNode,
     Attack,
+    CompactGraph,
     Edge,
     Graph,
+    GraphIndex,
+    GraphView,
     Metadata,
     Participant,
     Preference,
@@ -42,6 +45,9 @@ __all__ = (
     "copy",
     # classes
     "Graph",
+    "CompactGraph",
+    "GraphIndex",
+    "GraphView",
     "AtomNode",
     "SchemeNode",
     "Edge",
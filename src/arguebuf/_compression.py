@@ -0,0 +1,161 @@
+"""Transparent compression of the files read and written by the loaders and dumpers.
+
+The compression of a file is determined by its last suffix (e.g., `graph.json.gz`).
+When reading files without such a suffix, it is detected from their magic bytes.
+Zstandard requires Python 3.14 or the package `zstandard`,
+gzip and xz are always available through the standard library.
+"""
+
+import gzip
+import io
+import lzma
+import typing as t
+from enum import Enum
+from pathlib import Path, PurePath
+
+try:
+    from compression import zstd  # Python 3.14+
+except ModuleNotFoundError:
+    zstd = None
+
+try:
+    import zstandard
+except ModuleNotFoundError:
+    zstandard = None
+
+P = t.TypeVar("P", bound=PurePath)
+
+
+class Compression(Enum):
+    GZIP = ".gz"
+    XZ = ".xz"
+    ZSTD = ".zst"
+
+
+SUFFIXES = {compression.value: compression for compression in Compression}
+
+PROTOBUF_SUFFIXES = (".pb", ".binpb")
+"""Suffixes of files containing a graph in the binary protobuf format."""
+
+MAGIC_BYTES = {
+    b"\x1f\x8b": Compression.GZIP,
+    b"\xfd7zXZ\x00": Compression.XZ,
+    b"\x28\xb5\x2f\xfd": Compression.ZSTD,
+}
+MAGIC_SIZE = max(len(magic) for magic in MAGIC_BYTES)
+
+# gzip defaults to the slowest level, this is the default of the command line tool
+GZIP_LEVEL = 6
+
+
+def split(path: P) -> tuple[P, Compression | None]:
+    """Remove the compression suffix from `path`.
+
+    Examples:
+        >>> split(PurePath("graph.json.gz"))
+        (PurePosixPath('graph.json'), <Compression.GZIP: '.gz'>)
+        >>> split(PurePath("graph.json"))
+        (PurePosixPath('graph.json'), None)
+    """
+
+    compression = SUFFIXES.get(path.suffix)
+
+    if compression is None:
+        return path, None
+
+    return path.with_suffix(""), compression
+
+
+def strip(path: P) -> P:
+    """Remove the compression suffix from `path` (see `split`)."""
+
+    return split(path)[0]
+
+
+def split_suffix(suffix: str) -> tuple[str, Compression | None]:
+    """Split a (double) suffix like `.json.gz` into the suffix of the format and the compression."""
+
+    base, dot, last = suffix.rpartition(".")
+    compression = SUFFIXES.get(f"{dot}{last}")
+
+    if base and compression is not None:
+        return base, compression
+
+    return suffix, None
+
+
+def detect(data: bytes) -> Compression | None:
+    """Get the compression of a file starting with `data`."""
+
+    for magic, compression in MAGIC_BYTES.items():
+        if data.startswith(magic):
+            return compression
+
+    return None
+
+
+def default() -> Compression:
+    """Zstandard if it is available, gzip otherwise."""
+
+    return Compression.ZSTD if zstd or zstandard else Compression.GZIP
+
+
+def open_file(
+    path: Path,
+    mode: t.Literal["rb", "rt", "wb", "wt"],
+    encoding: str | None = None,
+) -> t.IO[t.Any]:
+    """Open a file that may be compressed.
+
+    When reading, files without a compression suffix are checked for magic bytes.
+    """
+
+    compression = split(path)[1]
+
+    if compression is None and mode[0] == "r":
+        fp = path.open("rb")
+        compression = detect(fp.peek(MAGIC_SIZE)[:MAGIC_SIZE])
+
+        if compression is None:
+            return fp if mode == "rb" else io.TextIOWrapper(fp, encoding)
+
+        fp.close()
+
+    if compression is None:
+        return path.open(mode, encoding=encoding)
+
+    return _open(path, compression, mode, encoding)
+
+
+def wrap(
+    obj: t.BinaryIO, compression: Compression, mode: t.Literal["rb", "wb"]
+) -> t.BinaryIO:
+    """Decompress or compress the binary stream `obj`.
+
+    Closing the returned stream does not close `obj`.
+    """
+
+    return t.cast(t.BinaryIO, _open(obj, compression, mode))
+
+
+def _open(
+    file: Path | t.BinaryIO,
+    compression: Compression,
+    mode: str,
+    encoding: str | None = None,
+) -> t.IO[t.Any]:
+    if compression == Compression.GZIP:
+        return gzip.open(file, mode, compresslevel=GZIP_LEVEL, encoding=encoding)
+
+    if compression == Compression.XZ:
+        return lzma.open(file, mode, encoding=encoding)
+
+    if zstd is not None:
+        return zstd.open(file, mode, encoding=encoding)  # type: ignore
+
+    if zstandard is not None:
+        return zstandard.open(file, mode, encoding=encoding, closefd=False)  # type: ignore
+
+    raise ModuleNotFoundError(
+        "Zstandard compressed files require Python 3.14 or 'zstandard' to be installed."
+    )
@@ -0,0 +1,119 @@
+"""Binary container storing many graphs in a single file.
+
+All integers are little-endian, offsets are relative to the start of the file.
+
+```
+header   magic (8 bytes) | version (u32) | reserved (u32)
+records  one varint-delimited `graph_pb2.Graph` per case
+strings  count (u64) | offsets (u64 × count + 1) | UTF-8 data
+index    count (u64)
+         record offsets (u64 × count + 1)
+         reference offsets (u64 × count + 1) | references (u32 × total)
+         name offsets (u64 × count + 1) | UTF-8 names
+trailer  strings offset (u64) | index offset (u64) | magic (8 bytes)
+```
+
+The records can be read with any protobuf library supporting delimited messages,
+but the strings listed in `string_fields` are moved into the shared string table.
+For every case, the index stores one reference per string field in the order of `string_fields`:
+`0` if the value is kept in the record and `i + 1` if it is the `i`-th string of the table.
+"""
+
+import struct
+import typing as t
+
+from arg_services.graph.v1 import graph_pb2
+
+MAGIC = b"AGCORPUS"
+VERSION = 1
+
+HEADER = struct.Struct("<8sII")
+TRAILER = struct.Struct("<QQ8s")
+COUNT = struct.Struct("<Q")
+
+RESOURCE_FIELDS = ("text", "title", "source")
+PARTICIPANT_FIELDS = ("name", "username", "email", "url", "location", "description")
+
+StringField = tuple[t.Any, str | int]
+"""Message and field name or repeated field and position of a shared string."""
+
+
+def string_fields(g: graph_pb2.Graph) -> t.Iterator[StringField]:
+    """Get the fields whose values are stored in the shared string table.
+
+    The elements are visited in the order of their ids,
+    so the order does not depend on the protobuf implementation.
+    """
+
+    for key in sorted(g.resources):
+        resource = g.resources[key]
+
+        for field in RESOURCE_FIELDS:
+            yield resource, field
+
+    for key in sorted(g.participants):
+        participant = g.participants[key]
+
+        for field in PARTICIPANT_FIELDS:
+            yield participant, field
+
+    for key in sorted(g.nodes):
+        node = g.nodes[key]
+
+        if node.WhichOneof("type") == "scheme":
+            descriptors = node.scheme.premise_descriptors
+
+            for i in range(len(descriptors)):
+                yield descriptors, i
+
+
+def get_string(field: StringField) -> str:
+    obj, key = field
+
+    return obj[key] if isinstance(key, int) else getattr(obj, key)
+
+
+def set_string(field: StringField, value: str) -> None:
+    obj, key = field
+
+    if isinstance(key, int):
+        obj[key] = value
+    else:
+        setattr(obj, key, value)
+
+
+def encode_varint(value: int) -> bytes:
+    data = bytearray()
+
+    while value > 0x7F:
+        data.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    data.append(value)
+
+    return bytes(data)
+
+
+def decode_varint(data: t.Any, offset: int) -> tuple[int, int]:
+    """Decode the varint at `offset` and return it together with the offset after it."""
+
+    value = 0
+    shift = 0
+
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+
+        if byte < 0x80:
+            return value, offset
+
+        shift += 7
+
+
+def encode_offsets(offsets: t.Sequence[int]) -> bytes:
+    return struct.pack(f"<{len(offsets)}Q", *offsets)
+
+
+def decode_offsets(data: t.Any, offset: int, count: int) -> tuple[int, ...]:
+    return struct.unpack_from(f"<{count}Q", data, offset)
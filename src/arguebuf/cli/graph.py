@@ -1,4 +1,5 @@
 import shutil
+from collections import Counter
 from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Optional
@@ -6,6 +7,7 @@ from typing import Optional
 import typer
 
 import arguebuf as ag
+from arguebuf import _compression
 
 from . import model
 from .translator import Translator
@@ -111,7 +113,7 @@ def render(
                 g = ag.load.file(path_pair.source)
 
                 if strip_scheme_nodes:
-                    g.strip_scheme_nodes()
+                    g = g.atom_projection()
 
                 gv = ag.dump.graphviz(
                     g,
@@ -149,15 +151,22 @@ def convert(
     start: int = 1,
     text_folder: Optional[Path] = None,
     text_suffix: str = ".txt",
+    output_suffix: str = ".json",
+    compress: bool = False,
 ) -> None:
     if not output_folder:
         output_folder = input_folder
 
+    if compress:
+        output_suffix += _compression.default().value
+
     if clean:
         shutil.rmtree(output_folder)
         output_folder.mkdir()
 
-    paths = model.PathPair.create(input_folder, output_folder, input_glob, ".json")
+    paths = model.PathPair.create(
+        input_folder, output_folder, input_glob, output_suffix
+    )
     bar: Iterable[model.PathPair]
 
     with typer.progressbar(
@@ -170,8 +179,8 @@ def convert(
                 text_file = None
 
                 if text_folder:
-                    text_file = text_folder / path_pair.source.relative_to(
-                        input_folder
+                    text_file = text_folder / _compression.strip(
+                        path_pair.source.relative_to(input_folder)
                     ).with_suffix(text_suffix)
 
                 graph = ag.load.file(path_pair.source, text_file=text_file)
@@ -182,18 +191,79 @@ def convert(
 
 
 @cli.command()
-def statistics(
+def pack(
     input_folder: Path,
     input_glob: str,
-):
+    output_file: Path,
+) -> None:
     files = sorted(input_folder.glob(input_glob))
+    bar: Iterable[tuple[Path, ag.Graph]]
+
+    with (
+        ag.dump.CorpusWriter(output_file) as writer,
+        typer.progressbar(
+            ag.load.iter_files((file, None) for file in files),
+            length=len(files),
+            show_pos=True,
+        ) as bar,
+    ):
+        for path, graph in bar:
+            # Named after the relative path without suffix, so `unpack` restores the folder
+            name = _compression.strip(path.relative_to(input_folder)).with_suffix("")
+            writer.add(graph, name.as_posix())
+
+
+@cli.command()
+def unpack(
+    input_file: Path,
+    output_folder: Path,
+    output_format: ag.dump.Format = ag.dump.Format.ARGUEBUF,
+    output_suffix: str = ".json",
+    overwrite: bool = False,
+    compress: bool = False,
+) -> None:
+    bar: Iterable[str]
+
+    if compress:
+        output_suffix += _compression.default().value
+
+    with (
+        ag.load.Corpus(input_file) as corpus,
+        typer.progressbar(corpus, show_pos=True) as bar,
+    ):
+        for name in bar:
+            target = output_folder / f"{name}{output_suffix}"
 
-    graphs = [ag.load.file(file) for file in files]
-    atom_nodes = [len(graph.atom_nodes) for graph in graphs]
-    scheme_nodes = [len(graph.scheme_nodes) for graph in graphs]
-    edges = [len(graph.edges) for graph in graphs]
+            if overwrite or not target.exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                ag.dump.file(corpus[name], target, ag.dump.Config(format=output_format))
 
-    total_graphs = len(graphs)
+
+@cli.command()
+def statistics(
+    input_folder: Path,
+    input_glob: str,
+):
+    atom_nodes: list[int] = []
+    scheme_nodes: list[int] = []
+    edges: list[int] = []
+    depths: list[int] = []
+    participants = 0
+    major_claims = 0
+    schemes: Counter[str] = Counter()
+
+    # Only the summaries are computed, the graphs are never built
+    for file in sorted(input_folder.glob(input_glob)):
+        summary = ag.load.summary(file)
+        atom_nodes.append(summary.atom_nodes)
+        scheme_nodes.append(summary.scheme_nodes)
+        edges.append(summary.edges)
+        depths.append(summary.depth)
+        participants += summary.participants
+        major_claims += summary.major_claim
+        schemes.update(summary.schemes)
+
+    total_graphs = len(atom_nodes)
     total_atom_nodes = sum(atom_nodes)
     total_scheme_nodes = sum(scheme_nodes)
     total_edges = sum(edges)
@@ -204,16 +274,26 @@ def statistics(
 Total Atom Nodes: {total_atom_nodes}
 Total Scheme Nodes: {total_scheme_nodes}
 Total Edges: {total_edges}
+Total Participants: {participants}
+Graphs with Major Claim: {major_claims}
 
 Atom Nodes per Graph: {total_atom_nodes / total_graphs}
 Scheme Nodes per Graph: {total_scheme_nodes / total_graphs}
 Edges per Graph: {total_edges / total_graphs}
+Depth per Graph: {sum(depths) / total_graphs}
 
 Max. Atom Nodes: {max(atom_nodes)}
 Max. Scheme Nodes: {max(scheme_nodes)}
 Max. Edges: {max(edges)}
+Max. Depth: {max(depths)}
 
 Min. Atom Nodes: {min(atom_nodes)}
 Min. Scheme Nodes: {min(scheme_nodes)}
-Min. Edges: {min(edges)}"""
+Min. Edges: {min(edges)}
+Min. Depth: {min(depths)}
+
+Schemes:"""
     )
+
+    for label, count in schemes.most_common():
+        typer.echo(f"  {label}: {count}")
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from arguebuf import _compression
+
 
 @dataclass
 class PathPair:
@@ -37,7 +39,7 @@ class PathPair:
             files_out: list[Path] = []
 
             for file_in in files_in:
-                file_out = path_out / file_in.relative_to(path_in)
+                file_out = path_out / _compression.strip(file_in.relative_to(path_in))
                 file_out = file_out.with_suffix(output_suffix)
                 file_out.parent.mkdir(parents=True, exist_ok=True)
 
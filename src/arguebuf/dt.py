@@ -1,19 +1,178 @@
+import datetime
+import functools
+import re
+import time
+import typing as t
+
 import pendulum
 from google.protobuf import timestamp_pb2
 
 
+class FormattedTimestamp(t.NamedTuple):
+    """Unparsed date string together with its pendulum format."""
+
+    text: str
+    format: str
+
+
+# Floats are POSIX timestamps generated by `now()` (local timezone),
+# integers are nanoseconds since the epoch read from protobuf messages (UTC).
+RawDateTime = pendulum.DateTime | float | int | FormattedTimestamp
+
+
+def now() -> float:
+    """Get the current point in time without constructing a `pendulum.DateTime`.
+
+    Use `materialize` to convert it into one when needed.
+    """
+
+    return time.time()
+
+
+def materialize(value: RawDateTime) -> pendulum.DateTime:
+    """Convert a raw timestamp into a `pendulum.DateTime`."""
+
+    if isinstance(value, pendulum.DateTime):
+        return value
+
+    if isinstance(value, FormattedTimestamp):
+        return _parse_format(value.text, value.format)
+
+    if isinstance(value, int):
+        proto = timestamp_pb2.Timestamp()
+        proto.FromNanoseconds(value)
+
+        return pendulum.instance(proto.ToDatetime())
+
+    return pendulum.from_timestamp(value, tz=pendulum.local_timezone())
+
+
+# Elements of a graph are often created within the same second
+# and `pendulum.DateTime` objects are immutable, so parsed strings can be shared.
+@functools.lru_cache(maxsize=1024)
+def _parse_format(text: str, format: str) -> pendulum.DateTime:
+    return pendulum.from_format(text, format)
+
+
 def from_format(text: str | None, format: str) -> pendulum.DateTime | None:
     return pendulum.from_format(text, format) if text else None
 
 
-def to_format(dt: pendulum.DateTime | None, format: str) -> str:
-    return dt.format(format) if dt else ""
+def lazy_from_format(text: str | None, format: str) -> FormattedTimestamp | None:
+    """Same as `from_format`, but defer parsing until the value is materialized."""
+
+    return FormattedTimestamp(text, format) if text else None
+
+
+def to_format(dt: RawDateTime | None, format: str) -> str:
+    if dt is None:
+        return ""
+
+    # Pass the original string through if it already has the requested format
+    if isinstance(dt, FormattedTimestamp) and dt.format == format:
+        return dt.text
+
+    return materialize(dt).format(format)
 
 
 def from_protobuf(dt: timestamp_pb2.Timestamp) -> pendulum.DateTime:
     return pendulum.instance(dt.ToDatetime()) if dt else pendulum.now()
 
 
-def to_protobuf(dt: pendulum.DateTime | None, obj: timestamp_pb2.Timestamp) -> None:
-    if dt:
-        obj.FromDatetime(dt)
+def lazy_from_protobuf(dt: timestamp_pb2.Timestamp) -> int:
+    """Same as `from_protobuf`, but defer the conversion until materialized."""
+
+    return dt.ToNanoseconds()
+
+
+def to_protobuf(dt: RawDateTime | None, obj: timestamp_pb2.Timestamp) -> None:
+    if isinstance(dt, int):
+        obj.FromNanoseconds(dt)
+    elif isinstance(dt, float):
+        obj.FromMicroseconds(round(dt * 1_000_000))
+    elif dt is not None:
+        obj.FromDatetime(materialize(dt))
+
+
+_JSON_TIMESTAMP = re.compile(
+    r"([0-9]{4})-([0-9]{2})-([0-9]{2})T([0-9]{2}):([0-9]{2}):([0-9]{2})(?:\.([0-9]{1,9}))?Z"
+)
+_EPOCH = datetime.datetime(1970, 1, 1)
+_SECONDS_MIN = -62135596800
+_SECONDS_MAX = 253402300799
+_NANOS_PER_SECOND = 1_000_000_000
+
+
+@functools.lru_cache(maxsize=4096)
+def lazy_from_json(text: str) -> int:
+    """Parse a timestamp of the protobuf JSON format into nanoseconds since the epoch.
+
+    The result is the same as calling `lazy_from_protobuf` on a `Timestamp`
+    parsed with `FromJsonString`, but the common UTC format is parsed directly.
+
+    Raises:
+        ValueError: If `text` is not a valid timestamp.
+    """
+
+    if match := _JSON_TIMESTAMP.fullmatch(text):
+        year, month, day, hour, minute, second, fraction = match.groups()
+
+        try:
+            delta = (
+                datetime.datetime(
+                    int(year), int(month), int(day), int(hour), int(minute), int(second)
+                )
+                - _EPOCH
+            )
+        except ValueError:
+            pass
+        else:
+            seconds = delta.days * 86400 + delta.seconds
+            # Same rounding as `FromJsonString`
+            nanos = round(float("0." + fraction) * 1e9) if fraction else 0
+
+            if _SECONDS_MIN <= seconds <= _SECONDS_MAX:
+                return seconds * _NANOS_PER_SECOND + nanos
+
+    proto = timestamp_pb2.Timestamp()
+    proto.FromJsonString(text)
+
+    return proto.ToNanoseconds()
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def to_json(dt: RawDateTime) -> str:
+    """Format a timestamp like `Timestamp.ToJsonString` after calling `to_protobuf`.
+
+    Raises:
+        ValueError: If the timestamp is out of the range supported by protobuf.
+    """
+
+    if isinstance(dt, int):
+        nanoseconds = dt
+    elif isinstance(dt, float):
+        nanoseconds = round(dt * 1_000_000) * 1000
+    else:
+        proto = timestamp_pb2.Timestamp()
+        to_protobuf(dt, proto)
+
+        return proto.ToJsonString()
+
+    seconds, nanos = divmod(nanoseconds, _NANOS_PER_SECOND)
+
+    if not _SECONDS_MIN <= seconds <= _SECONDS_MAX:
+        proto = timestamp_pb2.Timestamp()
+        proto.FromNanoseconds(nanoseconds)
+
+        return proto.ToJsonString()
+
+    text = (_EPOCH + datetime.timedelta(seconds=seconds)).isoformat()
+
+    if nanos == 0:
+        return f"{text}Z"
+    if nanos % 1_000_000 == 0:
+        return f"{text}.{nanos // 1_000_000:03d}Z"
+    if nanos % 1000 == 0:
+        return f"{text}.{nanos // 1000:06d}Z"
+
+    return f"{text}.{nanos:09d}Z"
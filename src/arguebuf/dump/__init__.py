@@ -1,5 +1,10 @@
+from arguebuf.json_backend import JsonBackend
+
 from ._config import Config, Format
 from ._dump_aif import dump_aif as aif
+from ._dump_arguebuf import dump_arguebuf as arguebuf
+from ._dump_corpus import CorpusWriter
+from ._dump_corpus import dump_corpus as corpus
 from ._dump_d2 import dump_d2 as d2
 from ._dump_dict import dump_dict as dict
 from ._dump_graphviz import dump_graphviz as graphviz
@@ -20,9 +25,13 @@ __all__ = (
     "aif",
     "xaif",
     "protobuf",
+    "arguebuf",
     "dict",
     "json",
     "io",
+    "corpus",
     "Config",
     "Format",
+    "CorpusWriter",
+    "JsonBackend",
 )
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum
 
+from arguebuf.json_backend import JsonBackend
+
 __all__ = ("Format", "Config")
 
 
@@ -14,6 +16,7 @@ class Format(str, Enum):
 class Config:
     format: Format = Format.ARGUEBUF
     prettify: bool = True
+    json_backend: JsonBackend = JsonBackend.STDLIB
 
 
 DefaultConfig = Config()
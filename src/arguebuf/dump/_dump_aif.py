@@ -30,7 +30,7 @@ def _dump_scheme(obj: SchemeNode) -> aif_schema.Node:
 
     return {
         "nodeID": obj.id,
-        "timestamp": dt.to_format(obj.metadata.updated, aif_schema.DATE_FORMAT),
+        "timestamp": dt.to_format(obj.metadata._updated, aif_schema.DATE_FORMAT),
         "text": obj.scheme.value if obj.scheme else NO_SCHEME_LABEL,
         "type": scheme2aif[type(obj.scheme)] if obj.scheme else "",
     }
@@ -40,7 +40,7 @@ def _dump_atom(obj: AtomNode) -> aif_schema.Node:
     """Export AtomNode object into AIF Node object."""
     return {
         "nodeID": obj.id,
-        "timestamp": dt.to_format(obj.metadata.updated, aif_schema.DATE_FORMAT),
+        "timestamp": dt.to_format(obj.metadata._updated, aif_schema.DATE_FORMAT),
         "text": obj.plain_text,
         "type": "I",
     }
@@ -0,0 +1,242 @@
+import functools
+import importlib.metadata
+import typing as t
+
+from google.protobuf.json_format import MessageToDict
+
+from arguebuf import dt
+from arguebuf.model import Graph
+from arguebuf.model.analyst import Analyst
+from arguebuf.model.edge import Edge
+from arguebuf.model.metadata import Metadata
+from arguebuf.model.node import AbstractNode, AtomNode, SchemeNode
+from arguebuf.model.participant import Participant
+from arguebuf.model.reference import Reference
+from arguebuf.model.resource import Resource
+from arguebuf.model.scheme import Attack, Preference, Rephrase, Support
+from arguebuf.model.userdata import Userdata, userdata_to_json
+from arguebuf.model.utils import protobuf_map_order, protobuf_string
+
+from ._dump_protobuf import dump_protobuf
+
+__all__ = ("dump_arguebuf",)
+
+# Same names as in `arguebuf.model.scheme.support2protobuf` etc.
+_SCHEME_FIELDS: dict[type, tuple[str, str]] = {
+    Support: ("support", "SUPPORT"),
+    Attack: ("attack", "ATTACK"),
+    Preference: ("preference", "PREFERENCE"),
+    Rephrase: ("rephrase", "REPHRASE"),
+}
+
+_UINT32_MAX = 2**32 - 1
+
+
+@functools.cache
+def _library_version() -> str:
+    try:
+        return importlib.metadata.version("arg_services")
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+def dump_arguebuf(graph: Graph) -> dict[str, t.Any]:
+    """Export a graph to the JSON representation of the arguebuf format.
+
+    The result is identical to `MessageToDict(dump_protobuf(graph))`,
+    but the dict is created directly instead of constructing protobuf messages first.
+    Graphs containing values that cannot be stored in protobuf messages
+    are converted via protobuf to raise the same errors.
+    """
+
+    try:
+        return _graph(graph)
+    except (TypeError, ValueError):
+        return MessageToDict(dump_protobuf(graph))
+
+
+def _graph(obj: Graph) -> dict[str, t.Any]:
+    # Field order and omitted defaults follow `MessageToDict`
+    g: dict[str, t.Any] = {}
+
+    if nodes := obj._nodes:
+        g["nodes"] = {key: _node(nodes[key]) for key in protobuf_map_order(nodes)}
+
+    if edges := obj._edges:
+        g["edges"] = {key: _edge(edges[key]) for key in protobuf_map_order(edges)}
+
+    if resources := obj._resources:
+        g["resources"] = {
+            key: _resource(resources[key]) for key in protobuf_map_order(resources)
+        }
+
+    if participants := obj._participants:
+        g["participants"] = {
+            key: _participant(participants[key])
+            for key in protobuf_map_order(participants)
+        }
+
+    if analysts := obj._analysts:
+        g["analysts"] = {
+            key: _analyst(analysts[key]) for key in protobuf_map_order(analysts)
+        }
+
+    if obj._major_claim:
+        g["majorClaim"] = protobuf_string(obj._major_claim.id)
+
+    g["schemaVersion"] = 1
+
+    if version := _library_version():
+        g["libraryVersion"] = version
+
+    g["metadata"] = _metadata(obj.metadata)
+    _add_userdata(g, obj.userdata)
+
+    return g
+
+
+def _node(obj: AbstractNode) -> dict[str, t.Any]:
+    if isinstance(obj, AtomNode):
+        node = {"atom": _atom(obj)}
+    elif isinstance(obj, SchemeNode):
+        node = {"scheme": _scheme(obj)}
+    else:
+        raise TypeError("Node type not supported")
+
+    node["metadata"] = _metadata(obj.metadata)
+    _add_userdata(node, obj.userdata)
+
+    return node
+
+
+def _atom(obj: AtomNode) -> dict[str, t.Any]:
+    atom: dict[str, t.Any] = {}
+
+    if text := obj.plain_text:
+        atom["text"] = protobuf_string(text)
+
+    if reference := obj.reference:
+        atom["reference"] = _reference(reference)
+
+    if participant := obj.participant:
+        atom["participant"] = protobuf_string(participant.id)
+
+    return atom
+
+
+def _scheme(obj: SchemeNode) -> dict[str, t.Any]:
+    scheme: dict[str, t.Any] = {}
+
+    for scheme_type, (field, prefix) in _SCHEME_FIELDS.items():
+        if isinstance(obj.scheme, scheme_type):
+            scheme[field] = f"{prefix}_{obj.scheme.name}"
+            break
+
+    if premise_descriptors := obj.premise_descriptors:
+        scheme["premiseDescriptors"] = [
+            protobuf_string(descriptor) for descriptor in premise_descriptors
+        ]
+
+    return scheme
+
+
+def _edge(obj: Edge) -> dict[str, t.Any]:
+    edge: dict[str, t.Any] = {}
+
+    if source := obj.source.id:
+        edge["source"] = protobuf_string(source)
+
+    if target := obj.target.id:
+        edge["target"] = protobuf_string(target)
+
+    edge["metadata"] = _metadata(obj.metadata)
+    _add_userdata(edge, obj.userdata)
+
+    return edge
+
+
+def _metadata(obj: Metadata) -> dict[str, t.Any]:
+    metadata: dict[str, t.Any] = {}
+
+    # Pass the raw values to avoid constructing pendulum objects
+    if obj._created is not None:
+        metadata["created"] = dt.to_json(obj._created)
+
+    if obj._updated is not None:
+        metadata["updated"] = dt.to_json(obj._updated)
+
+    return metadata
+
+
+def _reference(obj: Reference) -> dict[str, t.Any]:
+    reference: dict[str, t.Any] = {}
+
+    if resource := obj._resource:
+        reference["resource"] = protobuf_string(resource.id)
+
+    if offset := obj.offset:
+        if type(offset) is not int or not 0 <= offset <= _UINT32_MAX:
+            raise TypeError(f"Unexpected offset '{offset!r}'.")
+
+        reference["offset"] = offset
+
+    if text := obj.plain_text:
+        reference["text"] = protobuf_string(text)
+
+    return reference
+
+
+def _resource(obj: Resource) -> dict[str, t.Any]:
+    resource: dict[str, t.Any] = {}
+
+    if text := obj.plain_text:
+        resource["text"] = protobuf_string(text)
+
+    if title := obj.title:
+        resource["title"] = protobuf_string(title)
+
+    if source := obj.source:
+        resource["source"] = protobuf_string(source)
+
+    if obj.timestamp is not None:
+        resource["timestamp"] = dt.to_json(obj.timestamp)
+
+    resource["metadata"] = _metadata(obj.metadata)
+    _add_userdata(resource, obj.userdata)
+
+    return resource
+
+
+def _participant(obj: Participant) -> dict[str, t.Any]:
+    participant: dict[str, t.Any] = {}
+
+    if name := obj.name:
+        participant["name"] = protobuf_string(name)
+
+    # Optional fields are always set, even if they are empty
+    participant["username"] = protobuf_string(obj.username or "")
+    participant["email"] = protobuf_string(obj.email or "")
+    participant["url"] = protobuf_string(obj.url or "")
+    participant["location"] = protobuf_string(obj.location or "")
+    participant["description"] = protobuf_string(obj.description or "")
+    participant["metadata"] = _metadata(obj.metadata)
+    _add_userdata(participant, obj.userdata)
+
+    return participant
+
+
+def _analyst(obj: Analyst) -> dict[str, t.Any]:
+    analyst: dict[str, t.Any] = {}
+
+    if name := obj.name:
+        analyst["name"] = protobuf_string(name)
+
+    analyst["email"] = protobuf_string(obj.email or "")
+    _add_userdata(analyst, obj.userdata)
+
+    return analyst
+
+
+def _add_userdata(obj: dict[str, t.Any], userdata: Userdata) -> None:
+    if userdata:
+        obj["userdata"] = userdata_to_json(userdata)
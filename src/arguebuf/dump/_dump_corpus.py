@@ -0,0 +1,163 @@
+import array
+import struct
+import typing as t
+from pathlib import Path
+from types import TracebackType
+
+from arg_services.graph.v1 import graph_pb2
+
+from arguebuf import _corpus
+from arguebuf.model import Graph
+
+from ._dump_protobuf import dump_protobuf
+
+__all__ = ("CorpusWriter", "dump_corpus")
+
+
+class CorpusWriter:
+    """Write graphs into a single corpus file that can be read via `arguebuf.load.Corpus`.
+
+    The graphs are appended as binary protobuf records while strings that are often repeated
+    (texts and metadata of resources and participants as well as premise descriptors)
+    are stored only once in a shared string table.
+    The index of all cases is written when the writer is closed.
+
+    Examples:
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from arguebuf import Graph, AtomNode, dump, load
+        >>> path = Path(tempfile.mkdtemp()) / "corpus.agc"
+        >>> with dump.CorpusWriter(path) as writer:
+        ...     g = Graph()
+        ...     g.add_node(AtomNode("Claim"))
+        ...     writer.add(g, "folder/case")
+        >>> with load.Corpus(path) as corpus:
+        ...     list(corpus), corpus["folder/case"].name
+        (['folder/case'], 'case')
+    """
+
+    path: Path
+    _file: t.BinaryIO
+    _names: dict[str, None]
+    _record_offsets: list[int]
+    _reference_offsets: list[int]
+    _references: array.array
+    _strings: dict[str, int]
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._file = self.path.open("wb")
+        self._file.write(_corpus.HEADER.pack(_corpus.MAGIC, _corpus.VERSION, 0))
+        self._names = {}
+        self._record_offsets = []
+        self._reference_offsets = [0]
+        self._references = array.array("I")
+        self._strings = {}
+
+    def __enter__(self) -> t.Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, graph: Graph, name: str | None = None) -> None:
+        """Append a graph as the case `name` (defaults to the name of the graph).
+
+        Raises:
+            ValueError: If the name is missing or has already been added.
+        """
+
+        self.add_protobuf(dump_protobuf(graph), name or graph.name)
+
+    def add_protobuf(self, graph: graph_pb2.Graph, name: str | None) -> None:
+        """Same as `add`, but for a graph that has already been converted to protobuf.
+
+        Note that the shared strings are removed from `graph`.
+        """
+
+        if not name:
+            raise ValueError("The cases of a corpus need a name.")
+
+        if name in self._names:
+            raise ValueError(f"The corpus already contains a case named '{name}'.")
+
+        if self._file.closed:
+            raise ValueError("The corpus has already been closed.")
+
+        for field in _corpus.string_fields(graph):
+            value = _corpus.get_string(field)
+
+            if value:
+                index = self._strings.setdefault(value, len(self._strings))
+                self._references.append(index + 1)
+                _corpus.set_string(field, "")
+            else:
+                self._references.append(0)
+
+        data = graph.SerializeToString()
+
+        self._names[name] = None
+        self._record_offsets.append(self._file.tell())
+        self._reference_offsets.append(len(self._references))
+        self._file.write(_corpus.encode_varint(len(data)))
+        self._file.write(data)
+
+    def close(self) -> None:
+        """Write the string table and the index and close the file."""
+
+        if self._file.closed:
+            return
+
+        fp = self._file
+        strings_offset = fp.tell()
+        self._record_offsets.append(strings_offset)
+        self._write_strings(list(self._strings))
+
+        index_offset = fp.tell()
+        fp.write(_corpus.COUNT.pack(len(self._names)))
+        fp.write(_corpus.encode_offsets(self._record_offsets))
+        fp.write(_corpus.encode_offsets(self._reference_offsets))
+
+        fp.write(struct.pack(f"<{len(self._references)}I", *self._references))
+        self._write_strings(list(self._names), with_count=False)
+        fp.write(_corpus.TRAILER.pack(strings_offset, index_offset, _corpus.MAGIC))
+        fp.close()
+
+    def _write_strings(self, strings: list[str], with_count: bool = True) -> None:
+        data = [string.encode() for string in strings]
+        offsets = [0]
+
+        for item in data:
+            offsets.append(offsets[-1] + len(item))
+
+        if with_count:
+            self._file.write(_corpus.COUNT.pack(len(data)))
+
+        self._file.write(_corpus.encode_offsets(offsets))
+        self._file.write(b"".join(data))
+
+
+def dump_corpus(
+    graphs: t.Mapping[str, Graph] | t.Iterable[Graph], path: Path | str
+) -> None:
+    """Write graphs into a single corpus file (see `CorpusWriter`).
+
+    If a mapping is given, its keys are used as the names of the cases,
+    otherwise the names of the graphs are used.
+    """
+
+    with CorpusWriter(path) as writer:
+        if isinstance(graphs, t.Mapping):
+            for name, graph in graphs.items():
+                writer.add(graph, name)
+        else:
+            for graph in graphs:
+                writer.add(graph)
@@ -1,13 +1,45 @@
 import typing as t
 
+from arguebuf import _compression
 from arguebuf.model import Graph
 
-from ._config import Config, DefaultConfig
+from ._config import Config, DefaultConfig, Format
 from ._dump_json import dump_json
+from ._dump_protobuf import dump_protobuf
 
 __all__ = ("dump_io",)
 
 
-def dump_io(graph: Graph, obj: t.TextIO, config: Config = DefaultConfig) -> None:
-    """Export structure of Graph instance to IO argument graph format."""
-    dump_json(graph, obj, config)
+def dump_io(
+    graph: Graph,
+    obj: t.TextIO | t.BinaryIO,
+    config: Config = DefaultConfig,
+    suffix: str = ".json",
+) -> None:
+    """Export structure of Graph instance to IO argument graph format.
+
+    If `suffix` is `.pb` or `.binpb`, the graph is written in the binary protobuf format
+    and `obj` has to be opened in binary mode.
+    Otherwise, it is written as JSON and `obj` may be opened in text or binary mode.
+    A double suffix like `.json.gz` compresses the graph, `obj` has to be opened in binary mode then.
+    """
+
+    suffix, compression = _compression.split_suffix(suffix)
+
+    if compression is not None:
+        with _compression.wrap(t.cast(t.BinaryIO, obj), compression, "wb") as fp:
+            dump_io(graph, fp, config, suffix)
+
+        return
+
+    if suffix in _compression.PROTOBUF_SUFFIXES:
+        if config.format != Format.ARGUEBUF:
+            raise ValueError(
+                f"The format '{config.format.value}' cannot be written as binary"
+                " protobuf, only 'arguebuf' is supported."
+            )
+
+        t.cast(t.BinaryIO, obj).write(dump_protobuf(graph).SerializeToString())
+
+    else:
+        dump_json(graph, obj, config)
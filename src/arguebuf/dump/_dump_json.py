@@ -1,6 +1,7 @@
+import io
 import typing as t
-from json import dump as pyjson_dump
 
+from arguebuf import json_backend
 from arguebuf.model import Graph
 
 from ._config import Config, DefaultConfig
@@ -9,11 +10,18 @@ from ._dump_dict import dump_dict
 __all__ = ("dump_json",)
 
 
-def dump_json(graph: Graph, obj: t.TextIO, config: Config = DefaultConfig) -> None:
-    """Export structure of Graph instance to JSON argument graph format."""
-    pyjson_dump(
-        dump_dict(graph, config),
-        obj,
-        ensure_ascii=False,
-        indent=2 if config.prettify else None,
+def dump_json(
+    graph: Graph, obj: t.TextIO | t.BinaryIO, config: Config = DefaultConfig
+) -> None:
+    """Export structure of Graph instance to JSON argument graph format.
+
+    Files opened in binary mode are written without encoding the document again.
+    """
+    data = json_backend.dumps(
+        dump_dict(graph, config), config.prettify, config.json_backend
     )
+
+    if isinstance(obj, io.TextIOBase):
+        obj.write(data.decode())
+    else:
+        t.cast(t.BinaryIO, obj).write(data)
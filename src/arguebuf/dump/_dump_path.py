@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from arguebuf import _compression
 from arguebuf.model import Graph
 
 from ._config import Config, DefaultConfig
@@ -9,14 +10,26 @@ __all__ = ("dump_file",)
 
 
 def dump_file(graph: Graph, path: Path | str, config: Config = DefaultConfig) -> None:
-    """Export structure of Graph instance into structure of File/Folder format."""
+    """Export structure of Graph instance into structure of File/Folder format.
+
+    Paths ending with `.pb` or `.binpb` are written in the binary protobuf format,
+    all others as JSON.
+    An additional suffix `.gz`, `.xz` or `.zst` (e.g., `graph.json.gz`) compresses the file.
+    """
     if isinstance(path, str):
         path = Path(path)
 
     if path.is_dir():
         path = path / f"{graph.name}.json"
-    elif not path.suffix:
-        path = path.with_suffix(".json")
 
-    with path.open("w", encoding="utf-8") as file:
-        dump_io(graph, file, config)
+    stripped, compression = _compression.split(path)
+
+    if not stripped.suffix:
+        path = stripped.with_suffix(".json")
+
+        if compression is not None:
+            path = path.with_name(f"{path.name}{compression.value}")
+
+    # JSON documents are serialized to bytes, so they are written in binary mode as well
+    with _compression.open_file(path, "wb") as file:
+        dump_io(graph, file, config, _compression.strip(path).suffix)
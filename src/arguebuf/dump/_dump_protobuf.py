@@ -134,8 +134,9 @@ def metadata_to_protobuf(obj: Metadata) -> graph_pb2.Metadata:
     # if analyst := obj._analyst:
     #     proto.analyst = analyst.id
 
-    dt.to_protobuf(obj.created, proto.created)
-    dt.to_protobuf(obj.updated, proto.updated)
+    # Pass the raw values to avoid constructing pendulum objects
+    dt.to_protobuf(obj._created, proto.created)
+    dt.to_protobuf(obj._updated, proto.updated)
 
     return proto
 
@@ -0,0 +1,89 @@
+"""Libraries used for parsing and serializing JSON files.
+
+The loaders and dumpers work on UTF-8 encoded bytes,
+so files can be read and written without decoding them first.
+"""
+
+import json
+import typing as t
+from enum import Enum
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+__all__ = ("JsonBackend", "dumps", "loads")
+
+
+class JsonBackend(str, Enum):
+    """Library used for parsing and serializing JSON.
+
+    `STDLIB` (the default) uses the standard library.
+    `ORJSON` uses `orjson`, which is considerably faster,
+    and `AUTO` uses it if it is installed and the standard library otherwise.
+    `orjson` has to be enabled explicitly because it may change the data:
+    It parses integers with more than 64 bits as floats,
+    serializes `NaN` and infinite floats as `null`
+    and formats some floats differently (e.g., `1e-7` instead of `1e-07`).
+    Documents and objects it rejects (e.g., `NaN` literals or dicts with non-string keys)
+    are handled by the standard library instead.
+    """
+
+    AUTO = "auto"
+    STDLIB = "stdlib"
+    ORJSON = "orjson"
+
+
+def loads(data: bytes | str, backend: JsonBackend = JsonBackend.STDLIB) -> t.Any:
+    """Parse a JSON document.
+
+    Raises:
+        json.JSONDecodeError: If `data` is not a valid JSON document.
+    """
+
+    if _use_orjson(backend):
+        try:
+            return orjson.loads(data)  # type: ignore
+        except orjson.JSONDecodeError:  # type: ignore
+            # Parse it again to accept the extensions of the standard library
+            # and raise its errors for invalid documents
+            pass
+
+    return json.loads(data)
+
+
+def dumps(
+    obj: t.Any, prettify: bool = True, backend: JsonBackend = JsonBackend.STDLIB
+) -> bytes:
+    """Serialize an object to a UTF-8 encoded JSON document.
+
+    Args:
+        obj: Object to serialize.
+        prettify: Indent the document by two spaces.
+        backend: Library used for serializing the object.
+    """
+
+    if _use_orjson(backend):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if prettify else 0)  # type: ignore
+        except orjson.JSONEncodeError:  # type: ignore
+            # E.g., dicts with keys that are not strings
+            pass
+
+    return json.dumps(obj, ensure_ascii=False, indent=2 if prettify else None).encode()
+
+
+def _use_orjson(backend: JsonBackend) -> bool:
+    if backend == JsonBackend.STDLIB:
+        return False
+
+    if orjson is None:
+        if backend == JsonBackend.ORJSON:
+            raise ModuleNotFoundError(
+                "The JSON backend 'orjson' requires 'orjson' to be installed."
+            )
+
+        return False
+
+    return True
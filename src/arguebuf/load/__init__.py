@@ -1,10 +1,16 @@
+from arguebuf.json_backend import JsonBackend
+
+from ._cache import Cache
 from ._config import Config
 from ._load_aif import load_aif as aif
 from ._load_aml import load_aml as aml
 from ._load_argdown import load_argdown as argdown
+from ._load_arguebuf import load_arguebuf as arguebuf
 from ._load_brat import load_brat as brat
-from ._load_casebase import CasebaseFilter
+from ._load_casebase import CasebaseFilter, CasebaseIndex, iter_casebase
 from ._load_casebase import load_casebase as casebase
+from ._load_corpus import Corpus
+from ._load_corpus import load_corpus as corpus
 from ._load_dict import load_dict as dict
 from ._load_io import load_io as io
 from ._load_json import load_json as json
@@ -12,10 +18,13 @@ from ._load_kialo import load_kialo as kialo
 from ._load_microtexts import load_microtexts as arggraph
 from ._load_microtexts import load_microtexts as microtexts
 from ._load_ova import load_ova as ova
+from ._load_path import iter_files, iter_folder
 from ._load_path import load_file as file
 from ._load_path import load_folder as folder
 from ._load_protobuf import load_protobuf as protobuf
 from ._load_sadface import load_sadface as sadface
+from ._load_summary import Summary
+from ._load_summary import load_summary as summary
 from ._load_xaif import load_xaif as xaif
 
 __all__ = (
@@ -23,8 +32,10 @@ __all__ = (
     "xaif",
     "aml",
     "argdown",
+    "arguebuf",
     "brat",
     "casebase",
+    "corpus",
     "dict",
     "io",
     "json",
@@ -34,8 +45,17 @@ __all__ = (
     "ova",
     "file",
     "folder",
+    "iter_files",
+    "iter_folder",
+    "iter_casebase",
     "protobuf",
     "sadface",
+    "summary",
     "Config",
+    "JsonBackend",
+    "Cache",
+    "Corpus",
+    "Summary",
     "CasebaseFilter",
+    "CasebaseIndex",
 )
@@ -0,0 +1,301 @@
+import contextlib
+import dataclasses
+import functools
+import hashlib
+import importlib.metadata
+import inspect
+import os
+import pickle
+import tempfile
+import typing as t
+from pathlib import Path
+
+from arguebuf import _compression
+from arguebuf.model import Graph
+
+if t.TYPE_CHECKING:
+    from ._config import Config
+
+__all__ = ("Cache",)
+
+# Increment when the pickled representation of graphs changes
+CACHE_FORMAT = 1
+
+_SUFFIX = ".pickle"
+_CHUNK_SIZE = 1 << 20
+
+
+@functools.cache
+def _library_version() -> str:
+    try:
+        return importlib.metadata.version("arguebuf")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class Cache:
+    """Persistent cache of loaded graphs stored in `directory`.
+
+    Pass it via `Config.cache` to `load.file`, `load.folder` or `load.casebase`
+    to store the loaded graphs (including the results of `Config.nlp`) in a compact binary form.
+    Subsequent calls with the same file and config then skip parsing the file.
+
+    Entries are identified by the absolute path of the file and its text file,
+    their contents (or size and modification time if `hash_content` is disabled),
+    the version of this library and the classes and functions of the config.
+    Functions like `Config.nlp` are identified by their qualified name only,
+    so change `key` when they behave differently (e.g., when using another `spacy` model).
+    Lambdas, `functools.partial` objects and functions defined inside other functions
+    have no such name, so the cache is bypassed for them unless `key` is set.
+    Once the entries take more than `max_size` bytes, the least recently used ones are removed.
+
+    The entries are unpickled when loading them, so only use directories that you trust.
+
+    Examples:
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from arguebuf import Graph, AtomNode, dump, load
+        >>> folder = Path(tempfile.mkdtemp())
+        >>> g = Graph()
+        >>> g.add_node(AtomNode("Claim"))
+        >>> dump.file(g, folder / "graph.json")
+        >>> config = load.Config(cache=load.Cache(folder / "cache"))
+        >>> len(load.file(folder / "graph.json", config=config).nodes)
+        1
+        >>> len(load.file(folder / "graph.json", config=config).nodes)
+        1
+        >>> len(config.cache)
+        1
+    """
+
+    directory: Path
+    max_size: int | None
+    hash_content: bool
+    key: str
+    _size: int | None
+
+    def __init__(
+        self,
+        directory: Path | str | None = None,
+        max_size: int | None = 1 << 30,
+        hash_content: bool = True,
+        key: str = "",
+    ):
+        """Create a cache.
+
+        Args:
+            directory: Folder containing the entries.
+                Defaults to `$ARGUEBUF_CACHE_DIR` or the folder `arguebuf` in the user's cache directory.
+            max_size: Maximum total size of all entries in bytes (`None` for no limit).
+            hash_content: Detect changes of the source files by hashing their content.
+                Otherwise, only their size and modification time are compared.
+            key: Additional string distinguishing the entries (e.g., the name of an nlp model).
+        """
+
+        if directory is None:
+            directory = os.environ.get("ARGUEBUF_CACHE_DIR") or Path(
+                os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache", "arguebuf"
+            )
+
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.hash_content = hash_content
+        self.key = key
+        self._size = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.directory)!r})"
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def __getstate__(self) -> dict[str, t.Any]:
+        # The size is only an estimate of the current process
+        return {**self.__dict__, "_size": None}
+
+    def load(
+        self,
+        file: Path,
+        text_file: Path | t.Literal[False] | None,
+        config: "Config",
+        loader: t.Callable[[Path, Path | t.Literal[False] | None, "Config"], Graph],
+    ) -> Graph:
+        """Get the graph of `file` from the cache or load it using `loader` and store it."""
+
+        if not self.key and not _stable_identity(config):
+            return loader(file, text_file, config)
+
+        entry = self.directory / f"{self._key(file, text_file, config)}{_SUFFIX}"
+
+        try:
+            with entry.open("rb") as fp:
+                graph = pickle.load(fp)
+
+        except FileNotFoundError:
+            pass
+
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Incomplete or outdated entries are replaced
+            entry.unlink(missing_ok=True)
+
+        else:
+            # The modification time of the entries is used to find the least recently used ones
+            with contextlib.suppress(OSError):
+                os.utime(entry)
+
+            return graph
+
+        graph = loader(file, text_file, config)
+        self._store(entry, graph)
+
+        return graph
+
+    def clear(self) -> None:
+        """Remove all entries."""
+
+        for entry in self._entries():
+            Path(entry.path).unlink(missing_ok=True)
+
+        self._size = 0
+
+    def _key(
+        self, file: Path, text_file: Path | t.Literal[False] | None, config: "Config"
+    ) -> str:
+        # Same as the loader, the text file is ignored if it does not exist
+        if text_file is None:
+            text_file = _compression.strip(file).with_suffix(".txt")
+
+        if text_file is not False and (text_file == file or not text_file.exists()):
+            text_file = False
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            repr(
+                (
+                    CACHE_FORMAT,
+                    _library_version(),
+                    self.key,
+                    _config_key(config),
+                    str(file.absolute()),
+                    str(text_file and text_file.absolute()),
+                )
+            ).encode()
+        )
+
+        self._fingerprint(file, digest)
+
+        if text_file:
+            self._fingerprint(text_file, digest)
+
+        return digest.hexdigest()
+
+    def _fingerprint(self, file: Path, digest: t.Any) -> None:
+        if not self.hash_content:
+            stat = file.stat()
+            digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+            return
+
+        with file.open("rb") as fp:
+            while chunk := fp.read(_CHUNK_SIZE):
+                digest.update(chunk)
+
+    def _store(self, entry: Path, graph: Graph) -> None:
+        try:
+            data = pickle.dumps(graph, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # E.g., the results of `nlp` cannot be pickled
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first, so other processes never read incomplete entries
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                fp.write(data)
+
+            os.replace(tmp, entry)
+
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        if self._size is not None:
+            self._size += len(data)
+
+        if self.max_size is not None and (
+            self._size is None or self._size > self.max_size
+        ):
+            self._evict(self.max_size)
+
+    def _evict(self, max_size: int) -> None:
+        entries: list[tuple[os.DirEntry[str], os.stat_result]] = []
+
+        for entry in self._entries():
+            # Entries may be removed by other processes at the same time
+            with contextlib.suppress(FileNotFoundError):
+                entries.append((entry, entry.stat()))
+
+        size = sum(stat.st_size for _, stat in entries)
+
+        if size > max_size:
+            entries.sort(key=lambda item: item[1].st_mtime_ns)
+
+            for entry, stat in entries:
+                if size <= max_size:
+                    break
+
+                Path(entry.path).unlink(missing_ok=True)
+                size -= stat.st_size
+
+        self._size = size
+
+    def _entries(self) -> list[os.DirEntry[str]]:
+        try:
+            with os.scandir(self.directory) as entries:
+                return [entry for entry in entries if entry.name.endswith(_SUFFIX)]
+
+        except FileNotFoundError:
+            return []
+
+
+def _config_key(config: "Config") -> tuple[tuple[str, str | None], ...]:
+    return tuple(
+        (field.name, _value_key(getattr(config, field.name)))
+        for field in dataclasses.fields(config)
+        if field.name != "cache"
+    )
+
+
+def _value_key(value: t.Any) -> str | None:
+    if value is None:
+        return None
+
+    if isinstance(value, type) or inspect.isroutine(value):
+        return _qualified_name(value)
+
+    if callable(value):
+        # Callable objects like `spacy` pipelines are identified by their class
+        return _qualified_name(type(value))
+
+    # Enums and plain values like `json_backend`
+    return repr(value)
+
+
+def _qualified_name(obj: t.Any) -> str:
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+
+def _stable_identity(config: "Config") -> bool:
+    # Whether the nlp functions can be told apart by their qualified name
+    for func in (config.nlp, config.nlp_factory):
+        if isinstance(func, functools.partial):
+            return False
+
+        qualname = getattr(func, "__qualname__", "")
+
+        if "<lambda>" in qualname or "<locals>" in qualname:
+            return False
+
+    return True
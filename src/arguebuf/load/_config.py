@@ -1,6 +1,7 @@
 import typing as t
 from dataclasses import dataclass
 
+from arguebuf.json_backend import JsonBackend
 from arguebuf.model import Graph
 from arguebuf.model.analyst import Analyst
 from arguebuf.model.edge import Edge
@@ -11,11 +12,30 @@ from arguebuf.model.reference import Reference
 from arguebuf.model.resource import Resource
 from arguebuf.model.typing import TextType
 
+from ._cache import Cache
+
 __all__ = ("Config",)
 
 
 @dataclass
 class Config(t.Generic[TextType]):
+    """Options shared by all loaders.
+
+    Attributes:
+        nlp: Function transforming all texts of atom nodes and resources
+            (e.g., a `spacy` pipeline).
+        nlp_factory: Function creating `nlp` when a file is first loaded
+            (e.g., via `load.file` or `load.folder`).
+            The result is cached per process, so when loading files in worker processes,
+            it is called once per worker
+            instead of pickling `nlp` for every file,
+            so it has to be picklable (e.g., a module-level function),
+            but the `nlp` function it returns does not.
+        cache: Store the graphs loaded from files in this cache
+            and reuse them as long as the files and the config do not change.
+        json_backend: Library used for parsing JSON files (see `JsonBackend`).
+    """
+
     nlp: t.Callable[[str], TextType] | None = None
     GraphClass: type[Graph] = Graph
     AtomNodeClass: type[AtomNode] = AtomNode
@@ -26,6 +46,9 @@ class Config(t.Generic[TextType]):
     ParticipantClass: type[Participant] = Participant
     ReferenceClass: type[Reference] = Reference
     ResourceClass: type[Resource] = Resource
+    nlp_factory: t.Callable[[], t.Callable[[str], TextType]] | None = None
+    cache: Cache | None = None
+    json_backend: JsonBackend = JsonBackend.STDLIB
 
 
 DefaultConfig = Config[str]()
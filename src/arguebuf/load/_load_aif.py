@@ -1,12 +1,11 @@
 import typing as t
-
-import pendulum
+from collections import Counter, defaultdict
 
 from arguebuf import dt
 from arguebuf.model import Graph, utils
 from arguebuf.model.edge import Edge, warn_missing_nodes
 from arguebuf.model.node import AbstractNode, AtomNode, SchemeNode
-from arguebuf.model.scheme import aif2scheme, text2scheme
+from arguebuf.model.scheme import Scheme, aif2scheme, text2scheme
 from arguebuf.schemas import aif
 
 from ._config import Config, DefaultConfig
@@ -27,6 +26,8 @@ def load_aif(
     if reconstruct_dialog:
         obj = preprocess_dialog(obj)
 
+    nodes: list[AbstractNode] = []
+
     for aif_node in obj["nodes"]:
         node = (
             atom_from_aif(aif_node, config)
@@ -35,18 +36,21 @@ def load_aif(
         )
 
         if node:
-            g.add_node(node)
+            nodes.append(node)
 
-    for aif_edge in obj["edges"]:
-        if edge := edge_from_aif(aif_edge, g.nodes, config):
-            g.add_edge(edge)
+    g.add_nodes(nodes)
+    g.add_edges(
+        edge
+        for aif_edge in obj["edges"]
+        if (edge := edge_from_aif(aif_edge, g.nodes, config))
+    )
 
     return g
 
 
 def atom_from_aif(obj: aif.Node, config: Config) -> AtomNode:
     """Generate AtomNode object from AIF Node object."""
-    timestamp = dt.from_format(obj.get("timestamp"), aif.DATE_FORMAT) or pendulum.now()
+    timestamp = dt.lazy_from_format(obj.get("timestamp"), aif.DATE_FORMAT) or dt.now()
 
     return config.AtomNodeClass(
         id=obj["nodeID"],
@@ -58,31 +62,35 @@ def atom_from_aif(obj: aif.Node, config: Config) -> AtomNode:
 def scheme_from_aif(obj: aif.Node, config: Config) -> SchemeNode | None:
     """Generate SchemeNode object from AIF Node object."""
 
-    aif_type = obj["type"]
-    aif_scheme: str = obj.get("scheme", obj["text"])
-
-    if aif_type in aif2scheme:
-        scheme = aif2scheme[t.cast(aif.SchemeType, aif_type)]
-
-        # TODO: Handle formatting like capitalization, spaces, underscores, etc.
-        # TODO: Araucaria does not use spaces between scheme names
-        # aif_scheme = re.sub("([A-Z])", r" \1", aif_scheme)
-        if scheme and (found_scheme := text2scheme[type(scheme)].get(aif_scheme)):
-            scheme = found_scheme
-
+    if obj["type"] in aif2scheme:
         timestamp = (
-            dt.from_format(obj.get("timestamp"), aif.DATE_FORMAT) or pendulum.now()
+            dt.lazy_from_format(obj.get("timestamp"), aif.DATE_FORMAT) or dt.now()
         )
 
         return config.SchemeNodeClass(
             id=obj["nodeID"],
             metadata=config.MetadataClass(timestamp, timestamp),
-            scheme=scheme,
+            scheme=scheme_type_from_aif(obj),
         )
 
     return None
 
 
+def scheme_type_from_aif(obj: aif.Node) -> Scheme | None:
+    """Get the scheme of an AIF Node object whose type is one of `aif2scheme`."""
+
+    aif_scheme: str = obj.get("scheme", obj["text"])
+    scheme = aif2scheme[t.cast(aif.SchemeType, obj["type"])]
+
+    # TODO: Handle formatting like capitalization, spaces, underscores, etc.
+    # TODO: Araucaria does not use spaces between scheme names
+    # aif_scheme = re.sub("([A-Z])", r" \1", aif_scheme)
+    if scheme and (found_scheme := text2scheme[type(scheme)].get(aif_scheme)):
+        scheme = found_scheme
+
+    return scheme
+
+
 def edge_from_aif(
     obj: aif.Edge, nodes: t.Mapping[str, AbstractNode], config: Config
 ) -> Edge | None:
@@ -111,6 +119,7 @@ def preprocess_dialog(graph: aif.Graph) -> aif.Graph:
 
     Removes unsupported dialogue nodes (L, TA, YA) while preserving
     argument structure by creating rephrase connections.
+    All lookups use maps built once, so it runs in O(N+E).
     """
     # Copy the graph
     result: aif.Graph = {
@@ -119,20 +128,23 @@ def preprocess_dialog(graph: aif.Graph) -> aif.Graph:
         "locutions": graph.get("locutions", []).copy(),
     }
 
-    # Find hanging nodes before removing dialogue nodes
-    hanging_nodes = _find_hanging_nodes(result)
+    with utils.gc_paused():
+        # Find hanging nodes before removing dialogue nodes
+        hanging_nodes = _find_hanging_nodes(result)
 
-    # Remove dialogue nodes and create bypass edges
-    result = _remove_dialogue_nodes(result)
+        # Remove dialogue nodes and create bypass edges
+        result = _remove_dialogue_nodes(result)
 
-    # Reconnect hanging nodes with rephrase nodes
-    result = _add_rephrase_connections(result, hanging_nodes, graph)
+        # Reconnect hanging nodes with rephrase nodes
+        result = _add_rephrase_connections(result, hanging_nodes, graph)
 
     return result
 
 
 def _find_hanging_nodes(graph: aif.Graph) -> set[str]:
     """Find I-nodes with exactly one incoming edge and no outgoing edges."""
+    incoming = Counter(e["toID"] for e in graph["edges"])
+    outgoing = Counter(e["fromID"] for e in graph["edges"])
     hanging = set()
 
     for node in graph["nodes"]:
@@ -140,10 +152,8 @@ def _find_hanging_nodes(graph: aif.Graph) -> set[str]:
             continue
 
         node_id = node["nodeID"]
-        incoming = sum(1 for e in graph["edges"] if e["toID"] == node_id)
-        outgoing = sum(1 for e in graph["edges"] if e["fromID"] == node_id)
 
-        if incoming == 1 and outgoing == 0:
+        if incoming[node_id] == 1 and outgoing[node_id] == 0:
             hanging.add(node_id)
 
     return hanging
@@ -156,13 +166,29 @@ def _remove_dialogue_nodes(graph: aif.Graph) -> aif.Graph:
         n["nodeID"] for n in graph["nodes"] if n["type"] in UNSUPPORTED_NODE_TYPES
     }
 
+    # The first node with a given id is used, same as searching the list
+    nodes_by_id: dict[str, aif.Node] = {}
+
+    for node in graph["nodes"]:
+        nodes_by_id.setdefault(node["nodeID"], node)
+
+    edges_to: defaultdict[str, list[aif.Edge]] = defaultdict(list)
+    edges_from: defaultdict[str, list[aif.Edge]] = defaultdict(list)
+
+    for edge in graph["edges"]:
+        edges_to[edge["toID"]].append(edge)
+        edges_from[edge["fromID"]].append(edge)
+
+    # Bypass edges are only compared with the edges of the input graph
+    existing_edges = {(e["fromID"], e["toID"]) for e in graph["edges"]}
+
     # Find edges to bypass
     new_edges = []
     edges_to_remove = set()
 
     for node_id in dialogue_nodes:
-        incoming = [e for e in graph["edges"] if e["toID"] == node_id]
-        outgoing = [e for e in graph["edges"] if e["fromID"] == node_id]
+        incoming = edges_to.get(node_id, [])
+        outgoing = edges_from.get(node_id, [])
 
         # Mark these edges for removal
         for edge in incoming + outgoing:
@@ -178,32 +204,25 @@ def _remove_dialogue_nodes(graph: aif.Graph) -> aif.Graph:
                 if from_id == to_id:
                     continue
 
-                from_node = next(
-                    (n for n in graph["nodes"] if n["nodeID"] == from_id), None
-                )
-                to_node = next(
-                    (n for n in graph["nodes"] if n["nodeID"] == to_id), None
-                )
+                from_node = nodes_by_id.get(from_id)
+                to_node = nodes_by_id.get(to_id)
 
                 if (
                     from_node
                     and to_node
                     and from_node["type"] not in UNSUPPORTED_NODE_TYPES
                     and to_node["type"] not in UNSUPPORTED_NODE_TYPES
-                ):
                     # Check if edge already exists
-                    if not any(
-                        e["fromID"] == from_id and e["toID"] == to_id
-                        for e in graph["edges"]
-                    ):
-                        new_edges.append(
-                            {
-                                "edgeID": utils.uuid(),
-                                "fromID": from_id,
-                                "toID": to_id,
-                                "formEdgeID": None,
-                            }
-                        )
+                    and (from_id, to_id) not in existing_edges
+                ):
+                    new_edges.append(
+                        {
+                            "edgeID": utils.uuid(),
+                            "fromID": from_id,
+                            "toID": to_id,
+                            "formEdgeID": None,
+                        }
+                    )
 
     # Update graph
     graph["nodes"] = [n for n in graph["nodes"] if n["nodeID"] not in dialogue_nodes]
@@ -229,6 +248,18 @@ def _add_rephrase_connections(
 
     nodes_by_id = {n["nodeID"]: n for n in original_graph["nodes"]}
 
+    # Build maps for the processed graph, the new nodes and edges are added at the end
+    processed_nodes: dict[str, aif.Node] = {}
+
+    for node in graph["nodes"]:
+        processed_nodes.setdefault(node["nodeID"], node)
+
+    # Connected pairs of nodes regardless of the direction of the edge
+    processed_pairs = {
+        (min(e["fromID"], e["toID"]), max(e["fromID"], e["toID"]))
+        for e in graph["edges"]
+    }
+
     new_nodes = []
     new_edges = []
     connections_made = set()
@@ -241,7 +272,7 @@ def _add_rephrase_connections(
 
         for i, target_id in enumerate(targets):
             # Skip if target doesn't exist in processed graph
-            if not any(n["nodeID"] == target_id for n in graph["nodes"]):
+            if target_id not in processed_nodes:
                 continue
 
             # Skip if already connected
@@ -250,16 +281,12 @@ def _add_rephrase_connections(
                 continue
 
             # Check if already connected in the processed graph
-            if any(
-                (e["fromID"] == hanging_id and e["toID"] == target_id)
-                or (e["fromID"] == target_id and e["toID"] == hanging_id)
-                for e in graph["edges"]
-            ):
+            if pair in processed_pairs:
                 continue
 
             # Create rephrase node
             rephrase_id = utils.uuid()
-            hanging_node = next(n for n in graph["nodes"] if n["nodeID"] == hanging_id)
+            hanging_node = processed_nodes[hanging_id]
             new_nodes.append(
                 {
                     "nodeID": rephrase_id,
@@ -1,8 +1,7 @@
 import typing as t
 from xml.etree import ElementTree as Tree
 
-import pendulum
-
+from arguebuf import dt
 from arguebuf.model import Graph, utils
 from arguebuf.model.edge import Edge
 from arguebuf.model.metadata import Metadata
@@ -75,17 +74,18 @@ def read_refutation(conclusion: AtomNode, g, refutation: Tree.Element, config: C
 
         if prop is not None:
             premise_node = atom_from_aml(prop, config)
-            g.add_node(premise_node)
 
             # create SchemeNode (Attack)
             scheme_node = scheme_from_aml(prop, config, refutation=True)
-            g.add_node(scheme_node)
-
-            # create edge from premise to schemeNode
-            g.add_edge(Edge(premise_node, scheme_node))
+            g.add_nodes((premise_node, scheme_node))
 
-            # create edge from schemeNode to conclusion
-            g.add_edge(Edge(scheme_node, conclusion))
+            # create edges from premise to schemeNode and from schemeNode to conclusion
+            g.add_edges(
+                (
+                    Edge(premise_node, scheme_node),
+                    Edge(scheme_node, conclusion),
+                )
+            )
 
             # read the rest of au
             # read premises and store in a list (list of Tree.Element objects)
@@ -105,17 +105,18 @@ def read_ca(conclusion: AtomNode, g: Graph, ca: Tree.Element, config: Config):
 
         if prop is not None:
             premise_node = atom_from_aml(prop, config)
-            g.add_node(premise_node)
 
             # create SchemeNode
             scheme_node = scheme_from_aml(prop, config)
-            g.add_node(scheme_node)
+            g.add_nodes((premise_node, scheme_node))
 
-            # create edge from premise to schemeNode
-            g.add_edge(config.EdgeClass(premise_node, scheme_node))
-
-            # create edge from schemeNode to conclusion
-            g.add_edge(config.EdgeClass(scheme_node, conclusion))
+            # create edges from premise to schemeNode and from schemeNode to conclusion
+            g.add_edges(
+                (
+                    config.EdgeClass(premise_node, scheme_node),
+                    config.EdgeClass(scheme_node, conclusion),
+                )
+            )
 
             # read the rest of au
             read_au(au, g, config)
@@ -129,17 +130,18 @@ def read_la(conclusion: AtomNode, g: Graph, la: Tree.Element, config: Config):
 
         if prop is not None:
             premise_node = atom_from_aml(prop, config)
-            g.add_node(premise_node)
 
             # create SchemeNode
             scheme_node = scheme_from_aml(prop, config)
-            g.add_node(scheme_node)
-
-            # create edge from premise to schemeNode
-            g.add_edge(Edge(premise_node, scheme_node))
+            g.add_nodes((premise_node, scheme_node))
 
-            # create edge from schemeNode to conclusion
-            g.add_edge(Edge(scheme_node, conclusion))
+            # create edges from premise to schemeNode and from schemeNode to conclusion
+            g.add_edges(
+                (
+                    Edge(premise_node, scheme_node),
+                    Edge(scheme_node, conclusion),
+                )
+            )
 
             # read the rest of au
             read_au(au, g, config)
@@ -174,7 +176,7 @@ def atom_from_aml(
         owners = {}
 
     # create timestamp
-    timestamp = pendulum.now()
+    timestamp = dt.now()
 
     return config.AtomNodeClass(
         id=id,
@@ -206,7 +208,7 @@ def scheme_from_aml(
         owners = {}
 
     # create timestamp
-    timestamp = pendulum.now()
+    timestamp = dt.now()
 
     # get scheme name
     scheme = None
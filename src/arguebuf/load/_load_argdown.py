@@ -1,7 +1,6 @@
 import typing as t
 
-import pendulum
-
+from arguebuf import dt
 from arguebuf.model import Graph, utils
 from arguebuf.model.edge import Edge, warn_missing_nodes
 from arguebuf.model.metadata import Metadata
@@ -23,16 +22,19 @@ def load_argdown(
     """
     g = config.GraphClass(name)
 
-    timestamp = pendulum.now()
+    timestamp = dt.now()
 
     # Every node in obj["nodes"] is a atom node
-    for argdown_node in obj["map"]["nodes"]:
-        node = atom_from_argdown(argdown_node, config.nlp, config.AtomNodeClass)
-        g.add_node(node)
+    g.add_nodes(
+        atom_from_argdown(argdown_node, config.nlp, config.AtomNodeClass)
+        for argdown_node in obj["map"]["nodes"]
+    )
+
+    edges: list[Edge] = []
 
     for argdown_edge in obj["map"]["edges"]:
         if edge := edge_from_argdown(argdown_edge, g.nodes, config.EdgeClass):
-            g.add_edge(edge)
+            edges.append(edge)
 
             if argdown_edge["relationType"] in ("attack", "contradictory"):
                 scheme = Attack.DEFAULT
@@ -44,11 +46,13 @@ def load_argdown(
                 metadata=Metadata(timestamp, timestamp),
                 scheme=scheme,
             )
-            g.add_node(scheme_node)
 
             # create edge from source to scheme_node and an edge from scheme_node to target
-            g.add_edge(Edge(edge.source, scheme_node))
-            g.add_edge(Edge(scheme_node, edge.target))
+            # (the scheme node is added together with these edges)
+            edges.append(Edge(edge.source, scheme_node))
+            edges.append(Edge(scheme_node, edge.target))
+
+    g.add_edges(edges)
 
     metadata = Metadata(timestamp, timestamp)
     g.metadata = metadata
@@ -85,7 +89,7 @@ def atom_from_argdown(
     node_class: type[AtomNode] = AtomNode,
 ) -> AtomNode:
     """Generate AtomNode object from Argdown JSON Node object."""
-    timestamp = pendulum.now()
+    timestamp = dt.now()
     return node_class(
         id=obj["id"],
         text=utils.parse(obj["labelText"], nlp),
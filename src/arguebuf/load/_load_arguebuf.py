@@ -0,0 +1,517 @@
+import typing as t
+
+from arg_services.graph.v1 import graph_pb2
+from google.protobuf import timestamp_pb2
+from google.protobuf.json_format import ParseDict
+
+from arguebuf import dt
+from arguebuf.model import Graph
+from arguebuf.model.edge import warn_missing_nodes
+from arguebuf.model.metadata import Metadata
+from arguebuf.model.node import AbstractNode, AtomNode
+from arguebuf.model.scheme import (
+    Scheme,
+    protobuf2attack,
+    protobuf2preference,
+    protobuf2rephrase,
+    protobuf2support,
+)
+from arguebuf.model.userdata import Userdata, userdata_to_json
+from arguebuf.model.utils import parse, protobuf_map_order, protobuf_string
+
+from ._config import Config, DefaultConfig
+from ._load_protobuf import load_protobuf
+
+__all__ = ("load_arguebuf",)
+
+# JSON names of the fields supported by the direct decoder,
+# all other keys (e.g., the protobuf names of fields) are handled by `ParseDict`
+_GRAPH_FIELDS = frozenset(
+    (
+        "nodes",
+        "edges",
+        "resources",
+        "participants",
+        "analysts",
+        "majorClaim",
+        "schemaVersion",
+        "libraryVersion",
+        "metadata",
+        "userdata",
+    )
+)
+_NODE_FIELDS = frozenset(("atom", "scheme", "metadata", "userdata"))
+_ATOM_FIELDS = frozenset(("text", "reference", "participant"))
+_SCHEME_FIELDS = frozenset(
+    ("support", "attack", "preference", "rephrase", "premiseDescriptors")
+)
+_EDGE_FIELDS = frozenset(("source", "target", "metadata", "userdata"))
+_METADATA_FIELDS = frozenset(("created", "updated"))
+_REFERENCE_FIELDS = frozenset(("resource", "offset", "text"))
+_RESOURCE_FIELDS = frozenset(
+    ("text", "title", "source", "timestamp", "metadata", "userdata")
+)
+_PARTICIPANT_FIELDS = frozenset(
+    (
+        "name",
+        "username",
+        "email",
+        "url",
+        "location",
+        "description",
+        "metadata",
+        "userdata",
+    )
+)
+_ANALYST_FIELDS = frozenset(("name", "email", "userdata"))
+
+_SCHEME_TYPES: dict[str, tuple[dict[str, int], t.Mapping[int, Scheme]]] = {
+    field: (
+        {
+            value.name: value.number
+            for value in graph_pb2.Scheme.DESCRIPTOR.fields_by_name[
+                field
+            ].enum_type.values
+        },
+        schemes,
+    )
+    for field, schemes in (
+        ("support", protobuf2support),
+        ("attack", protobuf2attack),
+        ("preference", protobuf2preference),
+        ("rephrase", protobuf2rephrase),
+    )
+}
+
+_UINT32_MAX = 2**32 - 1
+_INT32_MIN = -(2**31)
+_INT32_MAX = 2**31 - 1
+
+_RawMetadata = tuple[int, int]
+
+
+class _Atom(t.NamedTuple):
+    id: str
+    text: str
+    reference: tuple[str, int, str] | None
+    participant: str
+    metadata: _RawMetadata
+    userdata: Userdata
+
+
+class _Scheme(t.NamedTuple):
+    id: str
+    scheme: Scheme | None
+    premise_descriptors: list[str]
+    metadata: _RawMetadata
+    userdata: Userdata
+
+
+class _Edge(t.NamedTuple):
+    id: str
+    source: str
+    target: str
+    metadata: _RawMetadata
+    userdata: Userdata
+
+
+class _Resource(t.NamedTuple):
+    id: str
+    text: str
+    title: str
+    source: str
+    timestamp: int | None
+    metadata: _RawMetadata
+    userdata: Userdata
+
+
+class _Participant(t.NamedTuple):
+    id: str
+    fields: tuple[str, str, str, str, str, str]
+    metadata: _RawMetadata
+    userdata: Userdata
+
+
+class _Analyst(t.NamedTuple):
+    id: str
+    name: str
+    email: str
+    userdata: Userdata
+
+
+class _Graph(t.NamedTuple):
+    resources: list[_Resource]
+    participants: list[_Participant]
+    analysts: list[_Analyst]
+    nodes: list[_Atom | _Scheme]
+    edges: list[_Edge]
+    major_claim: str
+    userdata: Userdata
+    metadata: _RawMetadata
+    library_version: str
+    schema_version: int
+
+
+def load_arguebuf(
+    obj: t.Mapping[str, t.Any],
+    name: str | None = None,
+    config: Config = DefaultConfig,
+) -> Graph:
+    """Generate Graph structure from the JSON representation of the arguebuf format.
+
+    The result is identical to `load_protobuf(ParseDict(obj, graph_pb2.Graph()))`,
+    but the graph is created directly instead of constructing protobuf messages first.
+    Objects that cannot be decoded directly (e.g., fields named like in the `.proto` file or invalid values)
+    are parsed via protobuf to raise the same errors.
+    """
+
+    try:
+        graph = _graph(obj)
+    except (TypeError, ValueError, OverflowError):
+        return load_protobuf(ParseDict(obj, graph_pb2.Graph()), name, config)
+
+    return _build(graph, name, config)
+
+
+def _build(obj: _Graph, name: str | None, config: Config) -> Graph:
+    # Same order of operations as `load_protobuf`
+    g = config.GraphClass(name)
+
+    for resource in obj.resources:
+        timestamp = timestamp_pb2.Timestamp()
+
+        if resource.timestamp is not None:
+            timestamp.FromNanoseconds(resource.timestamp)
+
+        g.add_resource(
+            config.ResourceClass(
+                parse(resource.text, config.nlp),
+                resource.title,
+                resource.source,
+                dt.from_protobuf(timestamp),
+                _metadata(resource.metadata, config),
+                resource.userdata,
+                resource.id,
+            )
+        )
+
+    for participant in obj.participants:
+        g.add_participant(
+            config.ParticipantClass(
+                *participant.fields,
+                _metadata(participant.metadata, config),
+                participant.userdata,
+                participant.id,
+            )
+        )
+
+    for analyst in obj.analysts:
+        g.add_analyst(
+            config.AnalystClass(
+                analyst.name, analyst.email, analyst.userdata, analyst.id
+            )
+        )
+
+    resources = g.resources
+    participants = g.participants
+    nodes: list[AbstractNode] = []
+
+    for node in obj.nodes:
+        if isinstance(node, _Atom):
+            text = parse(node.text, config.nlp)
+            reference = None
+
+            if node.reference is not None:
+                resource, offset, reference_text = node.reference
+                reference = (
+                    config.ReferenceClass(
+                        resources[resource], offset, parse(reference_text, config.nlp)
+                    )
+                    if resource
+                    else config.ReferenceClass(
+                        None, None, parse(reference_text, config.nlp)
+                    )
+                )
+
+            nodes.append(
+                config.AtomNodeClass(
+                    text,
+                    reference,
+                    participants.get(node.participant),
+                    _metadata(node.metadata, config),
+                    node.userdata,
+                    id=node.id,
+                )
+            )
+        else:
+            nodes.append(
+                config.SchemeNodeClass(
+                    node.scheme,
+                    node.premise_descriptors,
+                    _metadata(node.metadata, config),
+                    node.userdata,
+                    id=node.id,
+                )
+            )
+
+    g.add_nodes(nodes)
+
+    graph_nodes = g.nodes
+    edges = []
+
+    for edge in obj.edges:
+        if edge.source in graph_nodes and edge.target in graph_nodes:
+            edges.append(
+                config.EdgeClass(
+                    graph_nodes[edge.source],
+                    graph_nodes[edge.target],
+                    _metadata(edge.metadata, config),
+                    edge.userdata,
+                    id=edge.id,
+                )
+            )
+        else:
+            warn_missing_nodes(edge.id, edge.source, edge.target)
+
+    g.add_edges(edges)
+
+    major_claim = graph_nodes[obj.major_claim] if obj.major_claim else None
+
+    if major_claim and isinstance(major_claim, AtomNode):
+        g._major_claim = major_claim
+
+    g.userdata = obj.userdata
+    g.metadata = _metadata(obj.metadata, config)
+    g.library_version = obj.library_version
+    g.schema_version = obj.schema_version
+
+    return g
+
+
+def _metadata(obj: _RawMetadata, config: Config) -> Metadata:
+    created, updated = obj
+
+    return config.MetadataClass(created, created if created == updated else updated)
+
+
+# The following functions only validate and normalize the JSON object.
+# They raise `TypeError` or `ValueError` for everything that `ParseDict` should handle.
+
+
+def _graph(obj: t.Any) -> _Graph:
+    _check_fields(obj, _GRAPH_FIELDS)
+
+    return _Graph(
+        [
+            _resource(key, value)
+            for key, value in _map(obj.get("resources"), _RESOURCE_FIELDS)
+        ],
+        [
+            _participant(key, value)
+            for key, value in _map(obj.get("participants"), _PARTICIPANT_FIELDS)
+        ],
+        [
+            _analyst(key, value)
+            for key, value in _map(obj.get("analysts"), _ANALYST_FIELDS)
+        ],
+        [
+            node
+            for key, value in _map(obj.get("nodes"), _NODE_FIELDS)
+            if (node := _node(key, value)) is not None
+        ],
+        [_edge(key, value) for key, value in _map(obj.get("edges"), _EDGE_FIELDS)],
+        _string(obj.get("majorClaim")),
+        _userdata(obj.get("userdata")),
+        _raw_metadata(obj.get("metadata")),
+        _string(obj.get("libraryVersion")),
+        _int32(obj.get("schemaVersion", 0)),
+    )
+
+
+def _node(id: str, obj: dict[str, t.Any]) -> _Atom | _Scheme | None:
+    atom = obj.get("atom")
+    scheme = obj.get("scheme")
+
+    if atom is not None and scheme is not None:
+        raise ValueError("Multiple values for the node type.")
+
+    if atom is not None:
+        _check_fields(atom, _ATOM_FIELDS)
+        reference = atom.get("reference")
+
+        return _Atom(
+            id,
+            _string(atom.get("text")),
+            _reference(reference) if reference is not None else None,
+            _string(atom.get("participant")),
+            _raw_metadata(obj.get("metadata")),
+            _userdata(obj.get("userdata")),
+        )
+
+    if scheme is not None:
+        _check_fields(scheme, _SCHEME_FIELDS)
+
+        return _Scheme(
+            id,
+            _scheme_type(scheme),
+            _strings(scheme.get("premiseDescriptors")),
+            _raw_metadata(obj.get("metadata")),
+            _userdata(obj.get("userdata")),
+        )
+
+    # Same as `load_protobuf`, nodes without a type are skipped
+    return None
+
+
+def _scheme_type(obj: dict[str, t.Any]) -> Scheme | None:
+    result = None
+
+    for field, (values, schemes) in _SCHEME_TYPES.items():
+        if field in obj:
+            if result is not None:
+                raise ValueError("Multiple values for the scheme type.")
+
+            value = obj[field]
+
+            # `ParseDict` also accepts the numbers of enum values
+            if type(value) is not str or value not in values:
+                raise ValueError(f"Unexpected {field} value '{value!r}'.")
+
+            result = schemes[values[value]]
+
+    return result
+
+
+def _reference(obj: t.Any) -> tuple[str, int, str] | None:
+    _check_fields(obj, _REFERENCE_FIELDS)
+    offset = obj.get("offset", 0)
+
+    if type(offset) is not int or not 0 <= offset <= _UINT32_MAX:
+        raise ValueError(f"Unexpected offset '{offset!r}'.")
+
+    resource = _string(obj.get("resource"))
+    text = _string(obj.get("text"))
+
+    # References without text are ignored by `load_protobuf`
+    return (resource, offset, text) if text else None
+
+
+def _edge(id: str, obj: dict[str, t.Any]) -> _Edge:
+    return _Edge(
+        id,
+        _string(obj.get("source")),
+        _string(obj.get("target")),
+        _raw_metadata(obj.get("metadata")),
+        _userdata(obj.get("userdata")),
+    )
+
+
+def _resource(id: str, obj: dict[str, t.Any]) -> _Resource:
+    timestamp = obj.get("timestamp")
+
+    return _Resource(
+        id,
+        _string(obj.get("text")),
+        _string(obj.get("title")),
+        _string(obj.get("source")),
+        _timestamp(timestamp) if timestamp is not None else None,
+        _raw_metadata(obj.get("metadata")),
+        _userdata(obj.get("userdata")),
+    )
+
+
+def _participant(id: str, obj: dict[str, t.Any]) -> _Participant:
+    return _Participant(
+        id,
+        (
+            _string(obj.get("name")),
+            _string(obj.get("username")),
+            _string(obj.get("email")),
+            _string(obj.get("url")),
+            _string(obj.get("location")),
+            _string(obj.get("description")),
+        ),
+        _raw_metadata(obj.get("metadata")),
+        _userdata(obj.get("userdata")),
+    )
+
+
+def _analyst(id: str, obj: dict[str, t.Any]) -> _Analyst:
+    return _Analyst(
+        id,
+        _string(obj.get("name")),
+        _string(obj.get("email")),
+        _userdata(obj.get("userdata")),
+    )
+
+
+def _raw_metadata(obj: t.Any) -> _RawMetadata:
+    if obj is None:
+        return 0, 0
+
+    _check_fields(obj, _METADATA_FIELDS)
+    created = obj.get("created")
+    updated = obj.get("updated")
+
+    return (
+        _timestamp(created) if created is not None else 0,
+        _timestamp(updated) if updated is not None else 0,
+    )
+
+
+def _timestamp(obj: t.Any) -> int:
+    if type(obj) is not str:
+        raise TypeError(f"Unexpected timestamp '{obj!r}'.")
+
+    return dt.lazy_from_json(obj)
+
+
+def _userdata(obj: t.Any) -> Userdata:
+    # `ParseDict` only accepts lists for `ListValue`
+    return userdata_to_json(obj, (list,)) if obj is not None else {}
+
+
+def _map(obj: t.Any, fields: frozenset[str]) -> list[tuple[str, dict[str, t.Any]]]:
+    if obj is None:
+        return []
+
+    if type(obj) is not dict:
+        raise TypeError(f"Unexpected map '{obj!r}'.")
+
+    for value in obj.values():
+        _check_fields(value, fields)
+
+    return [(key, obj[key]) for key in protobuf_map_order(map(protobuf_string, obj))]
+
+
+def _check_fields(obj: t.Any, fields: frozenset[str]) -> None:
+    if type(obj) is not dict:
+        raise TypeError(f"Unexpected message '{obj!r}'.")
+
+    if not fields.issuperset(obj):
+        raise ValueError(f"Unexpected fields '{set(obj) - fields}'.")
+
+    # Explicit null values clear fields in `ParseDict`
+    if None in obj.values():
+        raise ValueError("Unexpected null value.")
+
+
+def _string(obj: t.Any) -> str:
+    return protobuf_string(obj) if obj is not None else ""
+
+
+def _strings(obj: t.Any) -> list[str]:
+    if obj is None:
+        return []
+
+    if type(obj) is not list:
+        raise TypeError(f"Unexpected list '{obj!r}'.")
+
+    return [protobuf_string(item) for item in obj]
+
+
+def _int32(obj: t.Any) -> int:
+    if type(obj) is not int or not _INT32_MIN <= obj <= _INT32_MAX:
+        raise ValueError(f"Unexpected integer '{obj!r}'.")
+
+    return obj
@@ -2,6 +2,8 @@ import csv
 import typing as t
 
 from arguebuf.model import Graph, utils
+from arguebuf.model.edge import Edge
+from arguebuf.model.node import AbstractNode
 from arguebuf.model.scheme import Attack, Support
 
 from ._config import Config, DefaultConfig
@@ -20,8 +22,8 @@ def load_brat(
 
     atom_nodes = {}
     mc = config.AtomNodeClass(utils.parse("", config.nlp))
-    g.add_node(mc)
-    g._major_claim = mc
+    nodes: list[AbstractNode] = [mc]
+    edges: list[Edge] = []
 
     for row in reader:
         userdata = row[1].split()
@@ -31,7 +33,7 @@ def load_brat(
                 mc.text = utils.parse(f"{mc.plain_text}. {row[2]}", config.nlp)
             else:
                 atom = config.AtomNodeClass(utils.parse(row[2], config.nlp))
-                g.add_node(atom)
+                nodes.append(atom)
                 atom_nodes[row[0]] = atom
 
         elif row[0].startswith("A") or row[0].startswith("R"):
@@ -49,9 +51,13 @@ def load_brat(
                 target = atom_nodes[userdata[2].split(":")[1]]
 
             scheme = config.SchemeNodeClass(scheme_type)
-            g.add_node(scheme)
+            nodes.append(scheme)
+
+            edges.append(config.EdgeClass(source, scheme))
+            edges.append(config.EdgeClass(scheme, target))
 
-            g.add_edge(config.EdgeClass(source, scheme))
-            g.add_edge(config.EdgeClass(scheme, target))
+    g.add_nodes(nodes)
+    g.add_edges(edges)
+    g._major_claim = mc
 
     return g
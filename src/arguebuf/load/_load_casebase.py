@@ -1,17 +1,21 @@
+import fnmatch
+import os
 import re
 import typing as t
 from collections.abc import Iterable
+from concurrent.futures import Executor
 from dataclasses import dataclass
-from pathlib import Path
+from pathlib import Path, PurePath
 
 from arg_services.cbr.v1beta.model_pb2 import CasebaseFilter as CasebaseFilterProto
 
+from arguebuf import _compression
 from arguebuf.model import Graph
 
 from ._config import Config, DefaultConfig
-from ._load_path import load_file, load_folder
+from ._load_path import ErrorHandler, FileTask, iter_files
 
-__all__ = ("CasebaseFilter", "load_casebase")
+__all__ = ("CasebaseFilter", "CasebaseIndex", "iter_casebase", "load_casebase")
 
 format2glob = {
     "aif": "*.json",
@@ -108,6 +112,226 @@ def convert_filters(
     ]
 
 
+class CasebaseIndex:
+    """Index of the folders of a casebase and the files they contain.
+
+    The folders below `basepath` matching `glob` are found in a single pass using `os.scandir`
+    and their names are parsed into `FilesystemFilter`s once.
+    The files of a folder are listed the first time they are requested,
+    so folders that are excluded are never descended into.
+    Text files next to a graph (e.g., `graph.txt` for `graph.json`) are recorded as well,
+    which saves checking for their existence when loading the graph.
+    """
+
+    basepath: Path
+    glob: str
+    folders: dict[Path, FilesystemFilter]
+    _names: dict[Path, dict[tuple[str, ...], None]]
+    _files: dict[tuple[Path, str], list[FileTask]]
+    _mtimes: dict[str, int]
+
+    def __init__(self, basepath: Path | str = ".", glob: str = "*/*"):
+        self.basepath = Path(basepath)
+        self.glob = glob
+        self._names = {}
+        self._files = {}
+        self._mtimes = {}
+        self.folders = {
+            folder: FilesystemFilter.from_path(folder)
+            for folder in self._find_folders()
+        }
+
+    @property
+    def stale(self) -> bool:
+        """Whether a directory has been modified since it has been scanned."""
+
+        try:
+            return any(
+                os.stat(directory).st_mtime_ns != mtime
+                for directory, mtime in self._mtimes.items()
+            )
+        except FileNotFoundError:
+            return True
+
+    def files(self, folder: Path, pattern: str = "*") -> list[FileTask]:
+        """Get all files inside `folder` (recursively) whose name matches `pattern`.
+
+        Compressed files match if their name without the compression suffix does (see `arguebuf.load.file`).
+
+        The files are sorted and paired with their text file (`False` if there is none).
+        """
+
+        key = (folder, pattern)
+
+        try:
+            return self._files[key]
+        except KeyError:
+            pass
+
+        names = self._names.get(folder)
+
+        if names is None:
+            names = self._names[folder] = self._list_files(folder)
+
+        match = re.compile(fnmatch.translate(pattern)).match
+        files: list[FileTask] = []
+
+        for parts in names:
+            name = parts[-1]
+
+            # Compressed files like `graph.json.gz` match the pattern of their format
+            if match(name) or match(_compression.strip(PurePath(name)).name):
+                text_parts = (*parts[:-1], _text_filename(name))
+                text_file = (
+                    folder.joinpath(*text_parts)
+                    if text_parts != parts and text_parts in names
+                    else False
+                )
+                files.append((folder.joinpath(*parts), text_file))
+
+        self._files[key] = files
+
+        return files
+
+    def select(
+        self,
+        include: t.Iterable[CasebaseFilter],
+        exclude: t.Iterable[CasebaseFilter] = (),
+        strict_equal: bool = False,
+    ) -> list[FileTask]:
+        """Get the files of all folders matching one of the `include` filters.
+
+        Files are excluded if one of the `exclude` filters matches them,
+        folders are excluded if one of the `exclude` filters without `cases` matches them.
+        """
+
+        exclude = list(exclude)
+        folder_exclude = [filter for filter in exclude if filter.cases is None]
+        case_exclude = [filter for filter in exclude if filter.cases is not None]
+        files: dict[Path, Path | t.Literal[False] | None] = {}
+
+        for user_filter in include:
+            for folder, filesystem_filter in self.folders.items():
+                if not _folder_matches(
+                    user_filter, filesystem_filter, strict_equal
+                ) or any(
+                    _folder_matches(filter, filesystem_filter, False)
+                    for filter in folder_exclude
+                ):
+                    continue
+
+                excluded_cases = [
+                    filter.cases
+                    for filter in case_exclude
+                    if _folder_matches(filter, filesystem_filter, False)
+                ]
+
+                for file, text_file in self.files(folder, filesystem_filter.glob):
+                    if user_filter.cases is not None or excluded_cases:
+                        case = str(file.relative_to(folder))
+
+                        if (
+                            user_filter.cases is not None
+                            and not user_filter.cases.match(case)
+                        ) or any(pattern.match(case) for pattern in excluded_cases):
+                            continue
+
+                    files.setdefault(file, text_file)
+
+        return list(files.items())
+
+    def _list_files(self, folder: Path) -> dict[tuple[str, ...], None]:
+        # Relative paths of all files as tuples of their parts, sorted like `Path` objects
+        names: list[tuple[str, ...]] = []
+        directories: list[tuple[str, ...]] = [()]
+
+        while directories:
+            parts = directories.pop()
+
+            for entry in self._scandir(folder.joinpath(*parts)):
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append((*parts, entry.name))
+                else:
+                    names.append((*parts, entry.name))
+
+        names.sort()
+
+        return dict.fromkeys(names)
+
+    def _find_folders(self) -> list[Path]:
+        folders = [self.basepath]
+
+        for part in self.glob.split("/"):
+            if part == "**":
+                folders = sorted(
+                    {
+                        subfolder
+                        for folder in folders
+                        for subfolder in self._walk(folder)
+                    }
+                )
+                continue
+
+            folders = sorted(
+                Path(entry.path)
+                for folder in folders
+                for entry in self._scandir(folder)
+                if entry.is_dir()
+                and not entry.name.startswith(".")
+                and fnmatch.fnmatchcase(entry.name, part)
+            )
+
+        return folders
+
+    def _walk(self, folder: Path) -> list[Path]:
+        # `folder` and all its subfolders, symlinks are not followed to avoid cycles
+        folders = [folder]
+        pending = [folder]
+
+        while pending:
+            for entry in self._scandir(pending.pop()):
+                if entry.is_dir(follow_symlinks=False) and entry.name[0] != ".":
+                    subfolder = Path(entry.path)
+                    folders.append(subfolder)
+                    pending.append(subfolder)
+
+        return folders
+
+    def _scandir(self, directory: Path) -> list[os.DirEntry[str]]:
+        # The modification time is retrieved first, so changes during the scan are detected
+        try:
+            self._mtimes[str(directory)] = os.stat(directory).st_mtime_ns
+
+            with os.scandir(directory) as entries:
+                return list(entries)
+
+        except (FileNotFoundError, NotADirectoryError):
+            # Treated as empty, the index is stale until the directory exists
+            self._mtimes[str(directory)] = -1
+            return []
+
+
+# Indexes of the most recently loaded casebases, reused as long as they are not stale
+_INDEX_CACHE_SIZE = 8
+_indexes: dict[tuple[str, Path, str], CasebaseIndex] = {}
+
+
+def _get_index(basepath: Path, glob: str) -> CasebaseIndex:
+    key = (os.getcwd(), basepath, glob)
+    # Reinserting moves the index to the end, the first one is the least recently used
+    index = _indexes.pop(key, None)
+
+    if index is None or index.stale:
+        index = CasebaseIndex(basepath, glob)
+
+    _indexes[key] = index
+
+    if len(_indexes) > _INDEX_CACHE_SIZE:
+        del _indexes[next(iter(_indexes))]
+
+    return index
+
+
 def load_casebase(
     include: CasebaseFilterType | t.Iterable[CasebaseFilterType],
     exclude: CasebaseFilterType | t.Iterable[CasebaseFilterType] | None = None,
@@ -115,51 +339,81 @@ def load_casebase(
     glob: str = "*/*",
     config: Config = DefaultConfig,
     strict_equal: bool = False,
-):
-    graphs: dict[Path, Graph] = {}
+    jobs: int | None = None,
+    executor: Executor | None = None,
+    on_error: ErrorHandler | None = None,
+    index: CasebaseIndex | None = None,
+) -> dict[Path, Graph]:
+    """Load all graphs of a casebase matching the `include` filters.
+
+    The files of all matching folders are collected first,
+    so they can be parsed in parallel by passing `jobs` or `executor`
+    (see `arguebuf.load.folder`).
+    The folders of `basepath` are indexed once and the index is reused
+    by later calls until the directory tree changes
+    (only the indexes of the few most recently loaded casebases are kept).
+    A `CasebaseIndex` can also be passed explicitly via `index`
+    (in this case, `basepath` and `glob` are ignored).
+    """
+
+    return dict(
+        iter_casebase(
+            include,
+            exclude,
+            basepath,
+            glob,
+            config,
+            strict_equal,
+            jobs,
+            executor,
+            on_error,
+            index=index,
+        )
+    )
+
 
-    if not isinstance(basepath, Path):
-        basepath = Path(basepath)
+def iter_casebase(
+    include: CasebaseFilterType | t.Iterable[CasebaseFilterType],
+    exclude: CasebaseFilterType | t.Iterable[CasebaseFilterType] | None = None,
+    basepath: Path | str = ".",
+    glob: str = "*/*",
+    config: Config = DefaultConfig,
+    strict_equal: bool = False,
+    jobs: int | None = None,
+    executor: Executor | None = None,
+    on_error: ErrorHandler | None = None,
+    prefetch: int | None = None,
+    index: CasebaseIndex | None = None,
+) -> t.Iterator[tuple[Path, Graph]]:
+    """Lazily load all graphs of a casebase matching the `include` filters.
 
-    include = convert_filters(include)
-    exclude = convert_filters(exclude)
+    Same as `arguebuf.load.casebase`, but the graphs are yielded one at a time
+    in the same order (see `arguebuf.load.iter_files`).
+    """
 
-    # TODO: exclude currently not applied
+    if index is None:
+        index = _get_index(Path(basepath), glob)
 
-    for filter in include:
-        for path in sorted(basepath.glob(glob)):
-            if (
-                path.is_dir()
-                and filter.name.match(path.parent.name)
-                and not path.parent.name.startswith(".")
-                and not path.name.startswith(".")
-            ):
-                graphs |= _from_casebase_single(filter, path, config, strict_equal)
+    tasks = index.select(
+        convert_filters(include), convert_filters(exclude), strict_equal
+    )
 
-    return graphs
+    return iter_files(tasks, config, jobs, executor, on_error, prefetch)
 
 
-def _from_casebase_single(
+def _folder_matches(
     user_filter: CasebaseFilter,
-    path: Path,
-    config: Config,
+    filesystem_filter: FilesystemFilter,
     strict_equal: bool,
-):
-    filesystem_filter = FilesystemFilter.from_path(path)
+) -> bool:
+    if not user_filter.name.match(filesystem_filter.name):
+        return False
 
-    if (strict_equal and user_filter == filesystem_filter) or (
-        not strict_equal and user_filter >= filesystem_filter
-    ):
-        glob = f"**/{filesystem_filter.glob}"
+    if strict_equal:
+        return user_filter == filesystem_filter
 
-        if user_filter.cases is not None:
-            return {
-                file: load_file(file, config=config)
-                for file in sorted(path.glob(glob))
-                if file.is_file()
-                and user_filter.cases.match(str(file.relative_to(path)))
-            }
+    return user_filter >= filesystem_filter
 
-        return load_folder(path, glob, config=config)
 
-    return {}
+def _text_filename(filename: str) -> str:
+    return _compression.strip(PurePath(filename)).with_suffix(".txt").name
@@ -0,0 +1,180 @@
+import itertools
+import mmap
+import struct
+import typing as t
+from collections import abc
+from pathlib import Path
+from types import TracebackType
+
+from arg_services.graph.v1 import graph_pb2
+
+from arguebuf import _corpus
+from arguebuf.model import Graph
+
+from ._config import Config, DefaultConfig
+from ._load_protobuf import load_protobuf
+
+__all__ = ("Corpus", "load_corpus")
+
+
+class Corpus(abc.Mapping[str, Graph]):
+    """Read-only mapping of the cases of a corpus file written by `arguebuf.dump.CorpusWriter`.
+
+    The file is memory-mapped and only its index is read when opening it,
+    so accessing a single case only reads this case and the strings it references.
+    The graphs are loaded on every access and named after the last part of their case name.
+
+    Examples:
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from arguebuf import Graph, AtomNode, dump, load
+        >>> path = Path(tempfile.mkdtemp()) / "corpus.agc"
+        >>> g = Graph("case")
+        >>> g.add_node(AtomNode("Claim"))
+        >>> dump.corpus([g], path)
+        >>> corpus = load.Corpus(path)
+        >>> len(corpus), len(corpus["case"].nodes)
+        (1, 1)
+        >>> corpus.close()
+    """
+
+    path: Path
+    config: Config
+    _mmap: mmap.mmap
+    _cases: dict[str, int]
+    _record_offsets: tuple[int, ...]
+    _reference_offsets: tuple[int, ...]
+    _references_start: int
+    _string_offsets_start: int
+    _string_data_start: int
+    _strings: dict[int, str]
+
+    def __init__(self, path: Path | str, config: Config = DefaultConfig):
+        self.path = Path(path)
+        self.config = config
+
+        with self.path.open("rb") as fp:
+            try:
+                self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise ValueError(f"'{self.path}' is not a corpus file.") from e
+
+        try:
+            self._read_index()
+        except (ValueError, struct.error) as e:
+            self._mmap.close()
+            raise ValueError(f"'{self.path}' is not a valid corpus file.") from e
+
+        self._strings = {}
+
+    def __enter__(self) -> t.Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.path)!r})"
+
+    def __len__(self) -> int:
+        return len(self._cases)
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._cases)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._cases
+
+    def __getitem__(self, name: str) -> Graph:
+        return load_protobuf(self.protobuf(name), name.rsplit("/", 1)[-1], self.config)
+
+    def protobuf(self, name: str) -> graph_pb2.Graph:
+        """Get the case `name` as a protobuf message including all shared strings."""
+
+        position = self._cases[name]
+        data = self._mmap
+        length, start = _corpus.decode_varint(data, self._record_offsets[position])
+        graph = graph_pb2.Graph.FromString(data[start : start + length])
+
+        first = self._reference_offsets[position]
+        last = self._reference_offsets[position + 1]
+        references = struct.unpack_from(
+            f"<{last - first}I", data, self._references_start + 4 * first
+        )
+
+        for field, reference in zip(
+            _corpus.string_fields(graph), references, strict=True
+        ):
+            if reference:
+                _corpus.set_string(field, self._string(reference - 1))
+
+        return graph
+
+    def close(self) -> None:
+        """Close the memory-mapped file."""
+
+        self._mmap.close()
+
+    def _read_index(self) -> None:
+        data = self._mmap
+        magic, version, _ = _corpus.HEADER.unpack_from(data, 0)
+        strings_offset, index_offset, trailer_magic = _corpus.TRAILER.unpack_from(
+            data, len(data) - _corpus.TRAILER.size
+        )
+
+        if magic != _corpus.MAGIC or trailer_magic != _corpus.MAGIC:
+            raise ValueError("Invalid magic bytes.")
+
+        if version != _corpus.VERSION:
+            raise ValueError(f"Unsupported version {version}.")
+
+        (string_count,) = _corpus.COUNT.unpack_from(data, strings_offset)
+        self._string_offsets_start = strings_offset + _corpus.COUNT.size
+        self._string_data_start = self._string_offsets_start + 8 * (string_count + 1)
+
+        (count,) = _corpus.COUNT.unpack_from(data, index_offset)
+        offset = index_offset + _corpus.COUNT.size
+        self._record_offsets = _corpus.decode_offsets(data, offset, count + 1)
+        offset += 8 * (count + 1)
+        self._reference_offsets = _corpus.decode_offsets(data, offset, count + 1)
+        offset += 8 * (count + 1)
+        self._references_start = offset
+        offset += 4 * self._reference_offsets[-1]
+
+        name_offsets = _corpus.decode_offsets(data, offset, count + 1)
+        offset += 8 * (count + 1)
+        names = data[offset : offset + name_offsets[-1]]
+
+        self._cases = {
+            names[start:end].decode(): position
+            for position, (start, end) in enumerate(itertools.pairwise(name_offsets))
+        }
+
+    def _string(self, index: int) -> str:
+        # Strings are shared between cases, so they are decoded only once
+        try:
+            return self._strings[index]
+        except KeyError:
+            pass
+
+        start, end = struct.unpack_from(
+            "<QQ", self._mmap, self._string_offsets_start + 8 * index
+        )
+        value = self._mmap[
+            self._string_data_start + start : self._string_data_start + end
+        ].decode()
+        self._strings[index] = value
+
+        return value
+
+
+def load_corpus(path: Path | str, config: Config = DefaultConfig) -> dict[str, Graph]:
+    """Load all cases of a corpus file (see `Corpus`)."""
+
+    with Corpus(path, config) as corpus:
+        return dict(corpus.items())
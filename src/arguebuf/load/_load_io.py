@@ -1,5 +1,9 @@
+import io
 import typing as t
 
+from arg_services.graph.v1 import graph_pb2
+
+from arguebuf import _compression
 from arguebuf.model import Graph
 
 from ._config import Config, DefaultConfig
@@ -7,26 +11,50 @@ from ._load_aml import load_aml
 from ._load_brat import load_brat
 from ._load_json import load_json
 from ._load_microtexts import load_microtexts
+from ._load_protobuf import load_protobuf
 from ._load_text import load_text
 
-__all__ = ("load_io",)
+__all__ = ("TEXT_SUFFIXES", "load_io")
+
+TEXT_SUFFIXES = (".ann", ".txt", ".aml", ".xml")
+"""Suffixes of files that have to be opened in text mode, all others are parsed as JSON."""
 
 
 def load_io(
-    obj: t.TextIO,
+    obj: t.TextIO | t.BinaryIO,
     suffix: str,
     name: str | None = None,
     config: Config = DefaultConfig,
 ) -> Graph:
-    """Generate Graph structure from IO argument graph file(Link?)."""
+    """Generate Graph structure from IO argument graph file(Link?).
+
+    Files with a protobuf suffix (`.pb` or `.binpb`) have to be opened in binary mode,
+    files with a suffix from `TEXT_SUFFIXES` in text mode.
+    JSON files may be opened in either mode, binary mode saves decoding them.
+    Compressed streams are indicated by a double suffix like `.json.gz`
+    and have to be opened in binary mode.
+    """
+
+    suffix, compression = _compression.split_suffix(suffix)
+
+    if compression is not None:
+        obj = _compression.wrap(t.cast(t.BinaryIO, obj), compression, "rb")
+
+        if suffix in TEXT_SUFFIXES:
+            obj = io.TextIOWrapper(obj, encoding="utf-8")
+
+    if suffix in _compression.PROTOBUF_SUFFIXES:
+        return load_protobuf(
+            graph_pb2.Graph.FromString(t.cast(t.BinaryIO, obj).read()), name, config
+        )
 
     if suffix == ".ann":
-        return load_brat(obj, name, config)
+        return load_brat(t.cast(t.TextIO, obj), name, config)
     if suffix == ".txt":
-        return load_text(obj, name, config)
+        return load_text(t.cast(t.TextIO, obj), name, config)
     if suffix == ".aml":
-        return load_aml(obj, name, config)
+        return load_aml(t.cast(t.TextIO, obj), name, config)
     if suffix == ".xml":
-        return load_microtexts(obj, name, config)
+        return load_microtexts(t.cast(t.TextIO, obj), name, config)
 
     return load_json(obj, name, config)
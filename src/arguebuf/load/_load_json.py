@@ -1,6 +1,6 @@
-import json
 import typing as t
 
+from arguebuf import json_backend
 from arguebuf.model import Graph
 
 from ._config import Config, DefaultConfig
@@ -10,9 +10,12 @@ __all__ = ("load_json",)
 
 
 def load_json(
-    obj: t.TextIO,
+    obj: t.TextIO | t.BinaryIO,
     name: str | None = None,
     config: Config = DefaultConfig,
 ) -> Graph:
-    """Generate Graph structure from JSON argument graph file(Link?)."""
-    return load_dict(json.load(obj), name, config)
+    """Generate Graph structure from JSON argument graph file(Link?).
+
+    Files opened in binary mode are parsed without decoding them first.
+    """
+    return load_dict(json_backend.loads(obj.read(), config.json_backend), name, config)
@@ -1,103 +1,116 @@
+import operator
 import re
 import typing as t
 
 from arguebuf.model import Graph, utils
-from arguebuf.model.node import AtomNode, Attack, Rephrase, Support
+from arguebuf.model.edge import Edge
+from arguebuf.model.node import AbstractNode, AtomNode, Attack, Rephrase, Support
 
 from ._config import Config, DefaultConfig
 
 __all__ = ("load_kialo",)
 
 
+# Example: 1.1. Pro: Gold is better than silver.
+# Pattern: {ID}.{ID}. {STANCE (OPTIONAL)}: {TEXT}
+_CLAIM_PATTERN = re.compile(r"^(1\.(?:\d+\.)+) (?:(Con|Pro): )?(.*)", re.MULTILINE)
+_MAJOR_CLAIM_PATTERN = re.compile(r"^((?:\d+\.)+) (.*)")
+_REFERENCE_PATTERN = re.compile(r"-> See ((?:\d+\.)+)")
+_ESCAPE_PATTERN = re.compile(r"\\([\[\]\(\)])")
+_LINK_PATTERN = re.compile(r"\[(.*?)\]\(.*?\)")
+# Equivalent to the template r"\1", but without expanding it for every match
+_FIRST_GROUP = operator.itemgetter(1)
+
+
 def load_kialo(
     obj: t.TextIO,
     name: str | None = None,
     config: Config = DefaultConfig,
 ) -> Graph:
-    if name_match := re.search(r"Discussion Title: (.*)", obj.readline()):
+    """Generate Graph structure from a Kialo export (a `.txt` file).
+
+    The export is read at once and the claims are found in a single pass,
+    their texts are sliced from the lines between two claims.
+    """
+    title_line, empty_line, mc_line, data = (*obj.read().split("\n", 3), "", "", "")[:4]
+
+    if name_match := re.search(r"Discussion Title: (.*)", title_line):
         name = name_match[1]
 
     # After the title, an empty line should follow
-    assert obj.readline().strip() == ""
+    assert empty_line.strip() == ""
 
     g = config.GraphClass(name)
-
-    # Example: 1.1. Pro: Gold is better than silver.
-    # Pattern: {ID}.{ID}. {STANCE (OPTIONAL)}: {TEXT}
-    pattern = re.compile(r"^(1\.(?:\d+\.)+) (?:(Con|Pro): )?(.*)")
-    current_line = obj.readline()
-    next_line = obj.readline()
-
-    mc_match = re.search(r"^((?:\d+\.)+) (.*)", current_line)
+    mc_match = _MAJOR_CLAIM_PATTERN.search(mc_line)
 
     if not mc_match:
         raise ValueError("The major claim is not present in the third line!")
 
-    mc_id = mc_match[1]
-    mc_text = mc_match[2]
+    claims = list(_CLAIM_PATTERN.finditer(data))
+    # The lines following a claim up to the next one belong to its text
+    bounds = [claim.start() for claim in claims]
+    bounds.append(len(data))
+
+    mc_text = _claim_text(mc_match[2], data[: bounds[0]])
+    mc = _kialo_atom_node(mc_match[1], mc_text, config.nlp, config.AtomNodeClass)
+    atom_nodes: dict[str, AtomNode] = {mc.id: mc}
+    nodes: list[AbstractNode] = [mc]
+    edges: list[Edge] = []
+
+    for current_match, end in zip(claims, bounds[1:], strict=True):
+        source_id = current_match[1]
+        source_id_parts = source_id[:-1].split(".")
+        # level = len(source_id_parts)
+        stance = current_match[2]
+        # The text of a node is allowed to span multiple lines.
+        # The line break ending the claim is skipped.
+        text = _claim_text(current_match[3], data[current_match.end() + 1 : end])
+
+        assert source_id
+        assert text
+
+        if id_ref_match := _REFERENCE_PATTERN.match(text):
+            id_ref = id_ref_match[1]
+            source = atom_nodes[id_ref]
+        else:
+            source = _kialo_atom_node(source_id, text, config.nlp, config.AtomNodeClass)
+            atom_nodes[source.id] = source
+            nodes.append(source)
+
+        if stance:
+            stance = stance.lower()
+            scheme = config.SchemeNodeClass(
+                Attack.DEFAULT if stance == "con" else Support.DEFAULT,
+                id=f"{source_id}scheme",
+            )
+        else:
+            scheme = config.SchemeNodeClass(Rephrase.DEFAULT, id=f"{source_id}scheme")
+
+        target_id = ".".join(source_id_parts[:-1] + [""])
+        target = atom_nodes[target_id]
+
+        nodes.append(scheme)
+        edges.append(config.EdgeClass(source, scheme, id=f"{source.id}->{scheme.id}"))
+        edges.append(config.EdgeClass(scheme, target, id=f"{scheme.id}->{target.id}"))
+
+    g.add_nodes(nodes)
+    g.add_edges(edges)
+    g.major_claim = mc
 
-    # See in the following while loop for explanation of this block
-    while next_line and not pattern.search(next_line):
-        mc_text = f"{mc_text}\n{next_line.strip()}"
-        next_line = obj.readline()
+    return g
 
-    mc = _kialo_atom_node(mc_id, mc_text, config.nlp, config.AtomNodeClass)
-    g.add_node(mc)
-    g.major_claim = mc
 
-    current_line = next_line
-    next_line = obj.readline()
-
-    while current_line:
-        if current_match := pattern.search(current_line):
-            source_id = current_match[1]
-            source_id_parts = source_id[:-1].split(".")
-            # level = len(source_id_parts)
-            stance = current_match[2]
-            text = current_match[3]
-
-            # The text of a node is allowed to span multiple lines.
-            # Thus, we need to look ahead to concatenate the complete text.
-            # As long as the pattern is not found in the next line,
-            # we assume that the text belongs to the previous statement.
-            while next_line and not pattern.search(next_line):
-                text = f"{text}\n{next_line.strip()}"
-                next_line = obj.readline()
-
-            assert source_id
-            assert text
-
-            if id_ref_match := re.search(r"^-> See ((?:\d+\.)+)", text):
-                id_ref = id_ref_match[1]
-                source = g.atom_nodes[id_ref]
-            else:
-                source = _kialo_atom_node(
-                    source_id, text, config.nlp, config.AtomNodeClass
-                )
-                g.add_node(source)
-
-            if stance:
-                stance = stance.lower()
-                scheme = config.SchemeNodeClass(
-                    Attack.DEFAULT if stance == "con" else Support.DEFAULT,
-                    id=f"{source_id}scheme",
-                )
-            else:
-                scheme = config.SchemeNodeClass(
-                    Rephrase.DEFAULT, id=f"{source_id}scheme"
-                )
-
-            target_id = ".".join(source_id_parts[:-1] + [""])
-            target = g.atom_nodes[target_id]
-
-            g.add_node(scheme)
-            g.add_edge(config.EdgeClass(source, scheme, id=f"{source.id}->{scheme.id}"))
-            g.add_edge(config.EdgeClass(scheme, target, id=f"{scheme.id}->{target.id}"))
-
-            current_line = next_line
-            next_line = obj.readline()
+def _claim_text(text: str, lines: str) -> str:
+    # Each following line is stripped and appended on a new line
+    if not lines:
+        return text
 
-    return g
+    parts = lines.split("\n")
+
+    if lines.endswith("\n"):
+        parts.pop()
+
+    return "\n".join([text, *(line.strip() for line in parts)])
 
 
 def _kialo_atom_node(
@@ -107,14 +120,12 @@ def _kialo_atom_node(
     atom_class: type[AtomNode],
 ) -> AtomNode:
     # Remove backslashes before parentheses/brackets
-    text = re.sub(r"\\([\[\]\(\)])", r"\1", text)
+    if "\\" in text:
+        text = _ESCAPE_PATTERN.sub(_FIRST_GROUP, text)
 
     # Remove markdown links
-    text = re.sub(
-        r"\[(.*?)\]\(.*?\)",
-        r"\1",
-        text,
-    )
+    if "[" in text:
+        text = _LINK_PATTERN.sub(_FIRST_GROUP, text)
 
     # Apply user-provided nlp function
     text = utils.parse(text, nlp)
@@ -4,7 +4,8 @@ from dataclasses import dataclass
 from lxml import etree
 
 from arguebuf.model import Graph, utils
-from arguebuf.model.node import Attack, Support
+from arguebuf.model.edge import Edge
+from arguebuf.model.node import AtomNode, Attack, SchemeNode, Support
 from arguebuf.schemas.microtexts import EdgeType
 
 from ._config import Config, DefaultConfig
@@ -74,6 +75,7 @@ def load_microtexts(
     atom_edges = transform_edges(atom_edge_tags)
     scheme_edges = transform_edges(scheme_edge_tags)
     edge_edges = transform_edges(edge_edge_tags)
+    atom_nodes: list[AtomNode] = []
 
     for adu in adu_tags:
         if isinstance(adu, etree._Element) and (adu_id := adu.get("id")):
@@ -88,11 +90,14 @@ def load_microtexts(
                 if type := adu.get("type"):
                     atom.userdata["type"] = type
 
-                g.add_node(atom)
+                atom_nodes.append(atom)
 
                 if adu_source.get("implicit"):
                     g.major_claim = atom
 
+    g.add_nodes(atom_nodes)
+    edges: list[Edge] = []
+
     for edge_id, edge in atom_edges.items():
         scheme_node = config.SchemeNodeClass(id=edge_id)
 
@@ -106,21 +111,29 @@ def load_microtexts(
         if (source_atom := g.atom_nodes.get(edge.source)) and (
             target_atom := g.atom_nodes.get(edge.target)
         ):
-            g.add_edge(config.EdgeClass(source_atom, scheme_node))
-            g.add_edge(config.EdgeClass(scheme_node, target_atom))
+            edges.append(config.EdgeClass(source_atom, scheme_node))
+            edges.append(config.EdgeClass(scheme_node, target_atom))
+
+    g.add_edges(edges)
+    edges = []
+    # Undercuts may also target schemes that are created in this loop
+    scheme_nodes: dict[str, SchemeNode] = dict(g.scheme_nodes)
 
     for edge_id, edge in edge_edges.items():
-        if (target_scheme := g.scheme_nodes.get(edge.target)) and (
+        if (target_scheme := scheme_nodes.get(edge.target)) and (
             atom_node := g.atom_nodes.get(edge.source)
         ):
             source_scheme = config.SchemeNodeClass(id=edge_id, scheme=Attack.DEFAULT)
-            g.add_edge(config.EdgeClass(atom_node, source_scheme))
-            g.add_edge(config.EdgeClass(source_scheme, target_scheme))
-
-    for edge in scheme_edges.values():
-        if (scheme_node := g.scheme_nodes.get(edge.target)) and (
-            atom_node := g.atom_nodes.get(edge.source)
-        ):
-            g.add_edge(config.EdgeClass(atom_node, scheme_node))
+            scheme_nodes[edge_id] = source_scheme
+            edges.append(config.EdgeClass(atom_node, source_scheme))
+            edges.append(config.EdgeClass(source_scheme, target_scheme))
+
+    g.add_edges(edges)
+    g.add_edges(
+        config.EdgeClass(atom_node, scheme_node)
+        for edge in scheme_edges.values()
+        if (scheme_node := g.scheme_nodes.get(edge.target))
+        and (atom_node := g.atom_nodes.get(edge.source))
+    )
 
     return g
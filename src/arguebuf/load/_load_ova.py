@@ -1,6 +1,5 @@
 import typing as t
 
-import pendulum
 from lxml import html
 
 from arguebuf import dt
@@ -45,6 +44,8 @@ def load_ova(
     if analyst_name := obj["analysis"].get("annotatorName"):
         g.add_analyst(Analyst(name=analyst_name))
 
+    nodes: list[AbstractNode] = []
+
     for ova_node in obj["nodes"]:
         node = (
             atom_from_ova(ova_node, config)
@@ -53,14 +54,17 @@ def load_ova(
         )
 
         if node:
-            g.add_node(node)
+            nodes.append(node)
 
         if ova_node.get("major_claim") and isinstance(node, AtomNode):
             g._major_claim = node
 
-    for ova_edge in obj["edges"]:
-        if edge := edge_from_ova(ova_edge, g.nodes, config):
-            g.add_edge(edge)
+    g.add_nodes(nodes)
+    g.add_edges(
+        edge
+        for ova_edge in obj["edges"]
+        if (edge := edge_from_ova(ova_edge, g.nodes, config))
+    )
 
     if (analysis := obj.get("analysis")) and (raw_text := analysis.get("txt")):
         _inject_original_text(raw_text, g._atom_nodes, resource, config)
@@ -75,32 +79,37 @@ def _inject_original_text(
     config: Config,
 ) -> None:
     doc = html.fromstring(f"<html><head></head><body>{raw_text}</body></html>")
-    text = ""
     body = doc.find("body")
 
-    if body is not None:
-        for elem in body.iter():
-            # Span elements need special handling
-            if elem.tag == "span":
-                # The id is prefixed with 'node', e.g. 'node5'.
-                node_key = str(elem.attrib["id"]).replace("node", "")
-                if node := nodes.get(node_key):
-                    node._reference = config.ReferenceClass(
-                        resource, len(text), utils.parse(elem.text, config.nlp)
-                    )
+    if body is None:
+        return
+
+    # Only the length of the text is needed for the offsets of the references,
+    # so the text itself is never built
+    offset = 0
+
+    for elem in body.iter():
+        # Span elements need special handling
+        if elem.tag == "span":
+            # The id is prefixed with 'node', e.g. 'node5'.
+            node_key = str(elem.attrib["id"]).replace("node", "")
+            if node := nodes.get(node_key):
+                node._reference = config.ReferenceClass(
+                    resource, offset, utils.parse(elem.text, config.nlp)
+                )
 
-                if elem.text:
-                    text += elem.text
+            if elem.text:
+                offset += len(elem.text)
 
-            elif elem.tag == "br":
-                text += "\n"
+        elif elem.tag == "br":
+            offset += 1
 
-            elif elem.text:
-                text += elem.text
+        elif elem.text:
+            offset += len(elem.text)
 
-            # Text after a tag should always be added to the overall text
-            if elem.tail:
-                text += elem.tail
+        # Text after a tag should always be added to the overall text
+        if elem.tail:
+            offset += len(elem.tail)
 
 
 def edge_from_ova(
@@ -109,7 +118,7 @@ def edge_from_ova(
     """Generate Edge object from OVA Edge format."""
     source_id = str(obj["from"]["id"])
     target_id = str(obj["to"]["id"])
-    date = dt.from_format(obj.get("date"), ova.DATE_FORMAT) or pendulum.now()
+    date = dt.lazy_from_format(obj.get("date"), ova.DATE_FORMAT) or dt.now()
 
     if source_id in nodes and target_id in nodes:
         return config.EdgeClass(
@@ -142,7 +151,7 @@ def scheme_from_ova(obj: ova.Node, config: Config) -> SchemeNode | None:
             if not description.lower().startswith("s_conclusion")
         ]
 
-        timestamp = dt.from_format(obj.get("date"), ova.DATE_FORMAT) or pendulum.now()
+        timestamp = dt.lazy_from_format(obj.get("date"), ova.DATE_FORMAT) or dt.now()
 
         return config.SchemeNodeClass(
             id=str(obj["id"]),
@@ -156,7 +165,7 @@ def scheme_from_ova(obj: ova.Node, config: Config) -> SchemeNode | None:
 
 def atom_from_ova(obj: ova.Node, config: Config) -> AtomNode:
     """Generate AtomNode object from OVA Node object."""
-    timestamp = dt.from_format(obj.get("date"), ova.DATE_FORMAT) or pendulum.now()
+    timestamp = dt.lazy_from_format(obj.get("date"), ova.DATE_FORMAT) or dt.now()
 
     return config.AtomNodeClass(
         id=str(obj["id"]),
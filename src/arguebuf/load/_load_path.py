@@ -1,33 +1,85 @@
+import dataclasses
+import itertools
+import os
+import typing as t
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from pathlib import Path
 
+from arguebuf import _compression
 from arguebuf.model import Graph
 from arguebuf.model.resource import Resource
 
 from ._config import Config, DefaultConfig
-from ._load_io import load_io
+from ._load_io import TEXT_SUFFIXES, load_io
 
-__all__ = ("load_file", "load_folder")
+__all__ = ("ErrorHandler", "iter_files", "iter_folder", "load_file", "load_folder")
+
+FileTask = tuple[Path, Path | t.Literal[False] | None]
+"""File to be loaded together with its text file (see `load_file`)."""
+
+ErrorHandler = t.Callable[[Path, Exception], None]
+"""Called with the path of a file that could not be loaded and the raised exception."""
+
+# Functions created by `Config.nlp_factory`, cached once per (worker) process
+_nlp_cache: dict[t.Callable[[], t.Any], t.Callable[[str], t.Any]] = {}
 
 
 def load_file(
     file: Path | str,
-    text_file: Path | str | None = None,
+    text_file: Path | str | t.Literal[False] | None = None,
     config: Config = DefaultConfig,
 ) -> Graph:
-    """Generate Graph structure from a File."""
+    """Generate Graph structure from a File.
+
+    If no `text_file` is given, a file with the suffix `.txt` next to `file` is used if it exists.
+    Pass `False` to skip this lookup.
+    Files compressed with gzip (`.gz`), xz (`.xz`) or Zstandard (`.zst`) are decompressed on the fly,
+    they are recognized by their suffix (e.g., `graph.json.gz`) or their magic bytes.
+    If `config.cache` is set, the graph is retrieved from the cache if possible.
+    """
     if isinstance(file, str):
         file = Path(file)
 
-    with file.open("r", encoding="utf-8") as fp:
-        graph = load_io(fp, file.suffix, file.stem, config)
+    if isinstance(text_file, str):
+        text_file = Path(text_file)
+
+    if config.cache is not None:
+        return config.cache.load(file, text_file, config, _load_file)
+
+    return _load_file(file, text_file, config)
+
+
+def _load_file(
+    file: Path, text_file: Path | t.Literal[False] | None, config: Config
+) -> Graph:
+    config = _resolve_nlp(config)
+    # The format is determined by the suffix in front of a compression suffix like `.gz`
+    path = _compression.strip(file)
+
+    if path.suffix in TEXT_SUFFIXES:
+        with _compression.open_file(file, "rt", "utf-8") as fp:
+            graph = load_io(fp, path.suffix, path.stem, config)
+    else:
+        # Binary protobuf and JSON files are parsed without decoding them
+        with _compression.open_file(file, "rb") as fp:
+            graph = load_io(fp, path.suffix, path.stem, config)
+
+    if text_file is False:
+        return graph
 
     if not text_file:
-        text_file = file.with_suffix(".txt")
-    elif isinstance(text_file, str):
-        text_file = Path(text_file)
+        text_file = path.with_suffix(".txt")
 
     if text_file.exists() and text_file != file:
-        text = text_file.read_text()
+        with _compression.open_file(text_file, "rt") as fp:
+            text = fp.read()
+
         graph.add_resource(Resource(text))
 
     return graph
@@ -39,6 +91,9 @@ def load_folder(
     text_folder: Path | str | None = None,
     text_suffix: str = ".txt",
     config: Config = DefaultConfig,
+    jobs: int | None = None,
+    executor: Executor | None = None,
+    on_error: ErrorHandler | None = None,
 ) -> dict[Path, Graph]:
     """Load all graphs matching the specified `pattern` in `path`.
 
@@ -54,9 +109,57 @@ def load_folder(
         nlp: Optionally pass a function to transforms all texts of atom nodes and resources to arbitrary Python objects.
             Useful when using `spacy` to generate embeddings.
             In this case, you can load a model with `spacy.load(...)` and pass the resulting `nlp` function via this parameter.
+        jobs: Number of worker processes used to parse the files (see `iter_files`).
+        executor: Existing executor used to parse the files.
+        on_error: Report files that cannot be loaded to this function instead of raising.
 
     Returns:
         Dictionary containing all found file paths as well as the loaded graphs.
+        The paths are sorted and files that could not be loaded are omitted.
+    """
+
+    return dict(
+        iter_folder(
+            folder, pattern, text_folder, text_suffix, config, jobs, executor, on_error
+        )
+    )
+
+
+def iter_folder(
+    folder: Path | str,
+    pattern: str,
+    text_folder: Path | str | None = None,
+    text_suffix: str = ".txt",
+    config: Config = DefaultConfig,
+    jobs: int | None = None,
+    executor: Executor | None = None,
+    on_error: ErrorHandler | None = None,
+    prefetch: int | None = None,
+) -> t.Iterator[tuple[Path, Graph]]:
+    """Lazily load all graphs matching the specified `pattern` in `path`.
+
+    Same as `load_folder`, but the graphs are yielded one at a time in the same order,
+    so they do not have to be kept in memory together.
+
+    Args:
+        path: Folder containing the graphs to be loaded.
+        pattern: Unix glob pattern to filter the available files.
+            Recursive matching can be achieved by prepending `**/` to any pattern.
+            For instance, all `json` files of a folder can be retrieved with `**/*.json`.
+            Supports the following wildcards: <https://docs.python.org/3/library/fnmatch.html#module-fnmatch>
+        atom_class: Allows to override the class used for atom nodes in case a specialized subclass has been created. Defaults to `AtomNode`.
+        scheme_class: Allows to override the class used for scheme nodes in case a specialized subclass has been created. Defaults to `SchemeNode`.
+        edge_class: Allows to override the class used for edges in case a specialized subclass has been created. Defaults to `Edge`.
+        nlp: Optionally pass a function to transforms all texts of atom nodes and resources to arbitrary Python objects.
+            Useful when using `spacy` to generate embeddings.
+            In this case, you can load a model with `spacy.load(...)` and pass the resulting `nlp` function via this parameter.
+        jobs: Number of worker processes used to parse the files (see `iter_files`).
+        executor: Existing executor used to parse the files.
+        on_error: Report files that cannot be loaded to this function instead of raising.
+        prefetch: Maximum number of graphs loaded ahead (see `iter_files`).
+
+    Yields:
+        Sorted file paths together with the loaded graphs.
     """
 
     if isinstance(folder, str):
@@ -65,14 +168,117 @@ def load_folder(
     if isinstance(text_folder, str):
         text_folder = Path(text_folder)
 
-    graphs: dict[Path, Graph] = {}
+    tasks: list[FileTask] = []
 
     for file in sorted(folder.glob(pattern)):
         text_file = None
 
         if text_folder:
-            text_file = text_folder / file.relative_to(folder).with_suffix(text_suffix)
+            text_file = text_folder / _compression.strip(
+                file.relative_to(folder)
+            ).with_suffix(text_suffix)
+
+        tasks.append((file, text_file))
+
+    return iter_files(tasks, config, jobs, executor, on_error, prefetch)
+
+
+def iter_files(
+    tasks: t.Iterable[FileTask],
+    config: Config = DefaultConfig,
+    jobs: int | None = None,
+    executor: Executor | None = None,
+    on_error: ErrorHandler | None = None,
+    prefetch: int | None = None,
+) -> t.Iterator[tuple[Path, Graph]]:
+    """Lazily load the given files in order, optionally using a pool of workers.
+
+    Args:
+        tasks: Files to load together with their (optional) text files.
+        config: Passed to `load_file`.
+        jobs: Number of worker processes used to parse the files.
+            By default, the files are loaded sequentially in the current process.
+        executor: Existing executor used to parse the files (takes precedence over `jobs`).
+        on_error: If given, files that cannot be loaded are reported to this function
+            and skipped. Otherwise, the first error is raised.
+        prefetch: Maximum number of files loaded ahead of the consumer.
+            Without `jobs` or `executor`, the files are read ahead by a background thread.
+            Defaults to twice the number of workers when using a pool.
+
+    Yields:
+        Paths of the loaded files together with their graphs.
+    """
+
+    if executor is None and (jobs is None or jobs <= 1) and not prefetch:
+        for file, text_file in tasks:
+            try:
+                graph = load_file(file, text_file, config)
+            except Exception as e:
+                if on_error is None:
+                    raise
+
+                on_error(file, e)
+            else:
+                yield file, graph
+
+        return
+
+    if config.nlp_factory is not None:
+        # Each worker creates its own function, it is not pickled
+        config = dataclasses.replace(config, nlp=None)
+
+    own_executor = executor is None
+
+    if executor is None:
+        executor = (
+            ProcessPoolExecutor(max_workers=jobs)
+            if jobs is not None and jobs > 1
+            else ThreadPoolExecutor(max_workers=1)
+        )
+
+    if not prefetch:
+        prefetch = 2 * (jobs or os.cpu_count() or 1)
+
+    remaining = iter(tasks)
+    pending: deque[tuple[Path, Future[Graph]]] = deque()
+
+    def submit(count: int) -> None:
+        for file, text_file in itertools.islice(remaining, count):
+            pending.append((file, executor.submit(load_file, file, text_file, config)))
+
+    try:
+        submit(prefetch)
+
+        while pending:
+            file, future = pending.popleft()
+            # Keep the workers busy while the consumer processes the graph
+            submit(1)
+
+            try:
+                graph = future.result()
+            except Exception as e:
+                if on_error is None:
+                    raise
+
+                on_error(file, e)
+            else:
+                yield file, graph
+
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def _resolve_nlp(config: Config) -> Config:
+    if config.nlp is not None or config.nlp_factory is None:
+        return config
 
-        graphs[file] = load_file(file, text_file, config)
+    try:
+        nlp = _nlp_cache[config.nlp_factory]
+    except KeyError:
+        nlp = _nlp_cache[config.nlp_factory] = config.nlp_factory()
 
-    return graphs
+    return dataclasses.replace(config, nlp=nlp)
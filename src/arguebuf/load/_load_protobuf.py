@@ -12,6 +12,7 @@ from arguebuf.model.participant import Participant
 from arguebuf.model.reference import Reference
 from arguebuf.model.resource import Resource
 from arguebuf.model.scheme import (
+    Scheme,
     protobuf2attack,
     protobuf2preference,
     protobuf2rephrase,
@@ -69,18 +70,23 @@ def load_protobuf(
             )
         )
 
+    nodes: list[AbstractNode] = []
+
     for node_id, node in obj.nodes.items():
         if node.WhichOneof("type") == "atom":
-            g.add_node(
+            nodes.append(
                 atom_from_protobuf(node_id, node, g.resources, g.participants, config)
             )
         elif node.WhichOneof("type") == "scheme":
-            g.add_node(scheme_from_protobuf(node_id, node, config))
+            nodes.append(scheme_from_protobuf(node_id, node, config))
         # TODO: Raise error if node is neither scheme nor atom
 
-    for edge_id, proto_edge in obj.edges.items():
-        if edge := edge_from_protobuf(edge_id, proto_edge, g.nodes, config):
-            g.add_edge(edge)
+    g.add_nodes(nodes)
+    g.add_edges(
+        edge
+        for edge_id, proto_edge in obj.edges.items()
+        if (edge := edge_from_protobuf(edge_id, proto_edge, g.nodes, config))
+    )
 
     major_claim = g.nodes[obj.major_claim] if obj.major_claim else None
 
@@ -116,22 +122,8 @@ def atom_from_protobuf(
 def scheme_from_protobuf(id: str, obj: graph_pb2.Node, config: Config) -> SchemeNode:
     """Generate SchemeNode object from OVA Node object."""
 
-    scheme_type = obj.scheme.WhichOneof("type")
-    scheme = None
-
-    if scheme_type is None:
-        scheme = None
-    elif scheme_type == "support":
-        scheme = protobuf2support[obj.scheme.support]
-    elif scheme_type == "attack":
-        scheme = protobuf2attack[obj.scheme.attack]
-    elif scheme_type == "rephrase":
-        scheme = protobuf2rephrase[obj.scheme.rephrase]
-    elif scheme_type == "preference":
-        scheme = protobuf2preference[obj.scheme.preference]
-
     return config.SchemeNodeClass(
-        scheme,
+        scheme_type_from_protobuf(obj.scheme),
         list(obj.scheme.premise_descriptors),
         metadata_from_protobuf(obj.metadata, config),
         MessageToDict(obj.userdata),
@@ -139,6 +131,23 @@ def scheme_from_protobuf(id: str, obj: graph_pb2.Node, config: Config) -> Scheme
     )
 
 
+def scheme_type_from_protobuf(obj: graph_pb2.Scheme) -> Scheme | None:
+    """Get the scheme of a PROTOBUF Scheme object."""
+
+    scheme_type = obj.WhichOneof("type")
+
+    if scheme_type == "support":
+        return protobuf2support[obj.support]
+    if scheme_type == "attack":
+        return protobuf2attack[obj.attack]
+    if scheme_type == "rephrase":
+        return protobuf2rephrase[obj.rephrase]
+    if scheme_type == "preference":
+        return protobuf2preference[obj.preference]
+
+    return None
+
+
 def edge_from_protobuf(
     id: str,
     obj: graph_pb2.Edge,
@@ -161,9 +170,12 @@ def edge_from_protobuf(
 
 
 def metadata_from_protobuf(obj: graph_pb2.Metadata, config: Config) -> Metadata:
+    created = dt.lazy_from_protobuf(obj.created)
+    updated = dt.lazy_from_protobuf(obj.updated)
+
     return config.MetadataClass(
-        dt.from_protobuf(obj.created),
-        dt.from_protobuf(obj.updated),
+        created,
+        created if created == updated else updated,
         # analysts[obj.analyst]
     )
 
@@ -1,7 +1,5 @@
 import typing as t
 
-import pendulum
-
 from arguebuf import dt
 from arguebuf.model import Graph, utils
 from arguebuf.model.edge import Edge, warn_missing_nodes
@@ -31,6 +29,8 @@ def load_sadface(
     """
     g = config.GraphClass(name)
 
+    nodes: list[AbstractNode] = []
+
     for sadface_node in obj["nodes"]:
         node = (
             atom_from_sadface(sadface_node, config)
@@ -39,16 +39,23 @@ def load_sadface(
         )
 
         if node:
-            g.add_node(node)
+            nodes.append(node)
 
-    for sadface_edge in obj["edges"]:
-        if edge := edge_from_sadface(sadface_edge, g.nodes, config):
-            g.add_edge(edge)
+    g.add_nodes(nodes)
+    g.add_edges(
+        edge
+        for sadface_edge in obj["edges"]
+        if (edge := edge_from_sadface(sadface_edge, g.nodes, config))
+    )
 
     # create
     # object
-    created = dt.from_format(obj["metadata"]["core"]["created"], sadface.DATE_FORMAT)
-    updated = dt.from_format(obj["metadata"]["core"]["edited"], sadface.DATE_FORMAT)
+    created = dt.lazy_from_format(
+        obj["metadata"]["core"]["created"], sadface.DATE_FORMAT
+    )
+    updated = dt.lazy_from_format(
+        obj["metadata"]["core"]["edited"], sadface.DATE_FORMAT
+    )
     metadata = config.MetadataClass(created, updated)
     g.metadata = metadata
 
@@ -72,7 +79,7 @@ def load_sadface(
 
 def atom_from_sadface(obj: sadface.Node, config: Config) -> AtomNode:
     """Generate AtomNode object from SADFace Node object."""
-    timestamp = pendulum.now()
+    timestamp = dt.now()
     return config.AtomNodeClass(
         id=obj["id"],
         text=utils.parse(obj["text"], config.nlp),
@@ -94,7 +101,7 @@ def scheme_from_sadface(obj: sadface.Node, config: Config) -> SchemeNode:
     elif obj["name"] == "preference":
         name = Preference.DEFAULT
 
-    timestamp = pendulum.now()
+    timestamp = dt.now()
 
     return config.SchemeNodeClass(
         id=obj["id"],
@@ -0,0 +1,241 @@
+import dataclasses
+import typing as t
+from collections import Counter, defaultdict, deque
+from pathlib import Path
+
+from arg_services.graph.v1 import graph_pb2
+
+from arguebuf import _compression, json_backend
+from arguebuf.model import Graph
+from arguebuf.model.node import scheme_label
+from arguebuf.model.scheme import Scheme, aif2scheme
+from arguebuf.schemas import aif
+
+from ._config import Config, DefaultConfig
+from ._load_aif import scheme_type_from_aif
+from ._load_arguebuf import _scheme_type
+from ._load_dict import load_dict
+from ._load_io import TEXT_SUFFIXES, load_io
+from ._load_protobuf import scheme_type_from_protobuf
+
+__all__ = ("Summary", "load_summary")
+
+
+@dataclasses.dataclass
+class Summary:
+    """Statistics of a graph that can be computed without loading it (see `load_summary`).
+
+    Attributes:
+        name: Name of the graph.
+        atom_nodes: Number of atom nodes.
+        scheme_nodes: Number of scheme nodes.
+        edges: Number of edges.
+        participants: Number of participants.
+        major_claim: Whether a major claim is set.
+        schemes: Number of scheme nodes per label (see `arguebuf.SchemeNode.label`).
+        depth: Maximum depth of the atom nodes, i.e. the length of the shortest path
+            to a root (see `arguebuf.GraphIndex.depths`).
+        mean_depth: Mean depth of the atom nodes.
+    """
+
+    name: str | None
+    atom_nodes: int
+    scheme_nodes: int
+    edges: int
+    participants: int
+    major_claim: bool
+    schemes: Counter[str]
+    depth: int
+    mean_depth: float
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "Summary":
+        """Summarize a graph that has already been loaded."""
+
+        return _summary(
+            graph.name,
+            graph.atom_nodes.keys(),
+            {key: node.scheme for key, node in graph.scheme_nodes.items()},
+            ((edge.source.id, edge.target.id) for edge in graph.edges.values()),
+            len(graph.participants),
+            graph.major_claim is not None,
+        )
+
+
+def load_summary(file: Path | str, config: Config = DefaultConfig) -> Summary:
+    """Summarize the graph stored in `file` while building as few objects as possible.
+
+    For arguebuf JSON, binary protobuf and AIF files, the summary is computed from the parsed document
+    without creating nodes, edges, texts or metadata (`config.nlp` is not applied).
+    All other formats are loaded as a graph first (see `arguebuf.load.file`).
+    Same as `arguebuf.load.file`, the graph is named after the file.
+
+    Examples:
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from arguebuf import Graph, AtomNode, SchemeNode, Edge, Support, dump, load
+        >>> g = Graph()
+        >>> claim, premise = AtomNode("Claim"), AtomNode("Premise")
+        >>> scheme = SchemeNode(Support.DEFAULT)
+        >>> g.add_edges([Edge(premise, scheme), Edge(scheme, claim)])
+        >>> g.major_claim = claim
+        >>> path = Path(tempfile.mkdtemp()) / "graph.json"
+        >>> dump.file(g, path)
+        >>> summary = load.summary(path)
+        >>> summary.name, summary.atom_nodes, summary.scheme_nodes, summary.edges
+        ('graph', 2, 1, 2)
+        >>> summary.schemes
+        Counter({'Support': 1})
+        >>> summary.major_claim, summary.depth, summary.mean_depth
+        (True, 2, 1.0)
+    """
+
+    if isinstance(file, str):
+        file = Path(file)
+
+    path = _compression.strip(file)
+    suffix = path.suffix
+    name = path.stem
+
+    # Texts are not part of the summary
+    config = dataclasses.replace(config, nlp=None, nlp_factory=None)
+
+    if suffix in TEXT_SUFFIXES:
+        with _compression.open_file(file, "rt", "utf-8") as fp:
+            return Summary.from_graph(load_io(fp, suffix, name, config))
+
+    with _compression.open_file(file, "rb") as fp:
+        data = fp.read()
+
+    if suffix in _compression.PROTOBUF_SUFFIXES:
+        return _protobuf_summary(graph_pb2.Graph.FromString(data), name)
+
+    obj = json_backend.loads(data, config.json_backend)
+
+    try:
+        if "analysis" not in obj:
+            if "locutions" in obj:
+                return _aif_summary(obj, name)
+
+            return _arguebuf_summary(obj, name)
+
+    except (AttributeError, KeyError, TypeError, ValueError):
+        # Let the loader report invalid documents
+        pass
+
+    return Summary.from_graph(load_dict(obj, name, config))
+
+
+def _protobuf_summary(obj: graph_pb2.Graph, name: str | None) -> Summary:
+    atoms: list[str] = []
+    schemes: dict[str, Scheme | None] = {}
+
+    for key, node in obj.nodes.items():
+        node_type = node.WhichOneof("type")
+
+        if node_type == "atom":
+            atoms.append(key)
+        elif node_type == "scheme":
+            schemes[key] = scheme_type_from_protobuf(node.scheme)
+
+    return _summary(
+        name,
+        atoms,
+        schemes,
+        ((edge.source, edge.target) for edge in obj.edges.values()),
+        len(obj.participants),
+        obj.major_claim in atoms,
+    )
+
+
+def _arguebuf_summary(obj: t.Mapping[str, t.Any], name: str | None) -> Summary:
+    atoms: list[str] = []
+    schemes: dict[str, Scheme | None] = {}
+
+    for key, node in obj.get("nodes", {}).items():
+        if "atom" in node:
+            atoms.append(key)
+        elif "scheme" in node:
+            schemes[key] = _scheme_type(node["scheme"])
+
+    return _summary(
+        name,
+        atoms,
+        schemes,
+        (
+            (edge.get("source"), edge.get("target"))
+            for edge in obj.get("edges", {}).values()
+        ),
+        len(obj.get("participants", {})),
+        obj.get("majorClaim") in atoms,
+    )
+
+
+def _aif_summary(obj: aif.Graph, name: str | None) -> Summary:
+    atoms: list[str] = []
+    schemes: dict[str, Scheme | None] = {}
+
+    for node in obj["nodes"]:
+        if node["type"] == "I":
+            atoms.append(node["nodeID"])
+        elif node["type"] in aif2scheme:
+            schemes[node["nodeID"]] = scheme_type_from_aif(node)
+
+    return _summary(
+        name,
+        atoms,
+        schemes,
+        ((edge.get("fromID"), edge.get("toID")) for edge in obj["edges"]),
+        0,
+        False,
+    )
+
+
+def _summary(
+    name: str | None,
+    atoms: t.Collection[str],
+    schemes: t.Mapping[str, Scheme | None],
+    edges: t.Iterable[tuple[str | None, str | None]],
+    participants: int,
+    major_claim: bool,
+) -> Summary:
+    atom_set = set(atoms)
+    children: defaultdict[str, list[str]] = defaultdict(list)
+    parents: set[str] = set()
+    edge_count = 0
+
+    for source, target in edges:
+        # Same as the loaders, edges between unknown nodes are skipped
+        if (source in atom_set or source in schemes) and (
+            target in atom_set or target in schemes
+        ):
+            children[target].append(source)
+            parents.add(source)
+            edge_count += 1
+
+    # Same as `GraphIndex.depths`, roots are nodes without outgoing edges
+    depths = {node: 0 for node in (*atom_set, *schemes) if node not in parents}
+    queue = deque(depths)
+
+    while queue:
+        node = queue.popleft()
+        depth = depths[node] + 1
+
+        for child in children[node]:
+            if child not in depths:
+                depths[child] = depth
+                queue.append(child)
+
+    atom_depths = [depths[atom] for atom in atom_set if atom in depths]
+
+    return Summary(
+        name,
+        len(atom_set),
+        len(schemes),
+        edge_count,
+        participants,
+        major_claim,
+        Counter(scheme_label(scheme) for scheme in schemes.values()),
+        max(atom_depths, default=0),
+        sum(atom_depths) / len(atom_depths) if atom_depths else 0.0,
+    )
@@ -1,7 +1,6 @@
 import typing as t
 
-import pendulum
-
+from arguebuf import dt
 from arguebuf.model import Graph, utils
 from arguebuf.model.edge import Edge, warn_missing_nodes
 from arguebuf.model.node import AbstractNode, AtomNode, SchemeNode
@@ -23,6 +22,8 @@ def load_xaif(
     g = config.GraphClass(name)
     aif_graph = obj["AIF"]
 
+    nodes: list[AbstractNode] = []
+
     for aif_node in aif_graph["nodes"]:
         node = (
             atom_from_xaif(aif_node, config)
@@ -31,11 +32,14 @@ def load_xaif(
         )
 
         if node:
-            g.add_node(node)
+            nodes.append(node)
 
-    for aif_edge in aif_graph["edges"]:
-        if edge := edge_from_xaif(aif_edge, g.nodes, config):
-            g.add_edge(edge)
+    g.add_nodes(nodes)
+    g.add_edges(
+        edge
+        for aif_edge in aif_graph["edges"]
+        if (edge := edge_from_xaif(aif_edge, g.nodes, config))
+    )
 
     return g
 
@@ -55,7 +59,7 @@ def scheme_from_xaif(obj: xaif.AifNode, config: Config) -> SchemeNode | None:
         if scheme and (found_scheme := text2scheme[type(scheme)].get(aif_scheme)):
             scheme = found_scheme
 
-        timestamp = pendulum.now()
+        timestamp = dt.now()
 
         return config.SchemeNodeClass(
             id=obj["nodeID"],
@@ -68,7 +72,7 @@ def scheme_from_xaif(obj: xaif.AifNode, config: Config) -> SchemeNode | None:
 
 def atom_from_xaif(obj: xaif.AifNode, config: Config) -> AtomNode:
     """Generate AtomNode object from xAif Node object."""
-    timestamp = pendulum.now()
+    timestamp = dt.now()
 
     return config.AtomNodeClass(
         id=obj["nodeID"],
@@ -1,7 +1,9 @@
 from . import (
     analyst,
+    compact,
     edge,
     graph,
+    index,
     metadata,
     node,
     participant,
@@ -9,10 +11,13 @@ from . import (
     resource,
     scheme,
     userdata,
+    view,
 )
 from .analyst import Analyst
+from .compact import CompactGraph
 from .edge import Edge
 from .graph import Graph
+from .index import GraphIndex
 from .metadata import Metadata
 from .node import AbstractNode, AtomNode, AtomOrSchemeNode, NodeType, SchemeNode
 from .participant import Participant
@@ -21,12 +26,15 @@ from .resource import Resource
 from .scheme import Attack, Preference, Rephrase, Scheme, Support
 from .userdata import Userdata
 from .utils import uuid
+from .view import GraphView
 
 __all__ = (
     # submodules
     "analyst",
+    "compact",
     "edge",
     "graph",
+    "index",
     "metadata",
     "node",
     "participant",
@@ -34,10 +42,14 @@ __all__ = (
     "resource",
     "scheme",
     "userdata",
+    "view",
     # functions
     "uuid",
     # classes
     "Graph",
+    "CompactGraph",
+    "GraphIndex",
+    "GraphView",
     "AtomNode",
     "SchemeNode",
     "Edge",
@@ -0,0 +1,233 @@
+"""Flat, columnar state of graphs used for pickling.
+
+Instead of pickling every node and edge as a separate object,
+the slot values of all elements sharing a class are stored as columns
+(including the `__dict__` of subclasses without `__slots__`).
+References between elements are replaced by ids
+and the timestamps of their metadata are stored as raw values.
+This keeps the pickled data small and allows creating all elements
+with the garbage collector paused when unpickling.
+"""
+
+import functools
+import typing as t
+
+from arguebuf.model import utils
+from arguebuf.model.edge import Edge
+from arguebuf.model.metadata import Metadata
+
+if t.TYPE_CHECKING:
+    from arguebuf.model.graph import Graph
+
+# Slots that are encoded specially or recomputed when unpickling
+_METADATA = "metadata"
+_ENDPOINTS = ("_source", "_target")
+_HASH = "_hash"
+
+Column = tuple[str, t.Any]
+Table = tuple[type, int, tuple[Column, ...]]
+
+
+def graph_state(g: "Graph") -> tuple[t.Any, ...]:
+    nodes = list(g._nodes.values())
+    edges = list(g._edges.values())
+
+    return (
+        g.name,
+        g.metadata,
+        g.userdata,
+        g.library_version,
+        g.schema_version,
+        tuple(g._resources.values()),
+        tuple(g._participants.values()),
+        tuple(g._analysts.values()),
+        _encode(nodes),
+        _encode(edges),
+        g._major_claim.id if g._major_claim else None,
+        extra_state(g),
+    )
+
+
+def restore_graph(cls: type["Graph"], state: tuple[t.Any, ...]) -> "Graph":
+    (
+        name,
+        metadata,
+        userdata,
+        library_version,
+        schema_version,
+        resources,
+        participants,
+        analysts,
+        node_tables,
+        edge_tables,
+        major_claim,
+        extra,
+    ) = state
+
+    g = cls(name)
+    g.metadata = metadata
+    g.userdata = userdata
+    g.library_version = library_version
+    g.schema_version = schema_version
+
+    g._resources._store.update((resource.id, resource) for resource in resources)
+    g._participants._store.update(
+        (participant.id, participant) for participant in participants
+    )
+    g._analysts._store.update((analyst.id, analyst) for analyst in analysts)
+
+    with utils.gc_paused():
+        nodes = _decode(node_tables, {})
+        node_ids = {node.id: node for node in nodes}
+        edges = _decode(edge_tables, node_ids)
+
+        for edge in edges:
+            edge._hash = hash((edge._id, edge._source, edge._target))
+
+        g._add_nodes(nodes)
+        g._add_edges(edges)
+
+    if major_claim is not None:
+        g._major_claim = g._atom_nodes[major_claim]
+
+    g._version += 1
+    restore_extra_state(g, extra)
+
+    return g
+
+
+def extra_state(g: "Graph") -> tuple[Column, ...]:
+    """Get the attributes that subclasses of `Graph` add outside of this library.
+
+    The attributes of the graph classes of this library are either part of the state
+    or rebuilt from the elements (e.g., the adjacency arrays of `CompactGraph`).
+    """
+
+    return tuple(
+        (name, value)
+        for name in _extra_names(type(g))
+        if (value := getattr(g, name, utils.UNSET_SLOT)) is not utils.UNSET_SLOT
+    )
+
+
+def restore_extra_state(g: "Graph", state: tuple[Column, ...]) -> None:
+    """Inverse of `extra_state`."""
+
+    for name, value in state:
+        setattr(g, name, value)
+
+
+@functools.cache
+def _extra_names(cls: type) -> tuple[str, ...]:
+    names: list[str] = []
+
+    for base in reversed(cls.__mro__):
+        if base.__module__.partition(".")[0] == "arguebuf":
+            continue
+
+        slots = base.__dict__.get("__slots__", ())
+
+        if isinstance(slots, str):
+            slots = (slots,)
+
+        names.extend(name for name in slots if name not in ("__dict__", "__weakref__"))
+
+    if cls.__dictoffset__:
+        names.append("__dict__")
+
+    return tuple(names)
+
+
+def _encode(objs: list[t.Any]) -> tuple[bytes | list[int], tuple[Table, ...]]:
+    """Group the objects by class and store their slot values as columns.
+
+    The position of the table of each object is stored separately,
+    so the original order can be restored.
+    """
+
+    classes: dict[type, int] = {}
+    groups: list[list[t.Any]] = []
+    positions: list[int] = []
+
+    for obj in objs:
+        position = classes.setdefault(type(obj), len(classes))
+
+        if position == len(groups):
+            groups.append([])
+
+        groups[position].append(obj)
+        positions.append(position)
+
+    tables = tuple(
+        (cls, len(group), _encode_columns(cls, group))
+        for cls, group in zip(classes, groups)
+    )
+
+    # Usually there are only a few classes, so one byte per object suffices
+    order = bytes(positions) if len(classes) <= 256 else positions
+
+    return order, tables
+
+
+def _encode_columns(cls: type, objs: list[t.Any]) -> tuple[Column, ...]:
+    columns: list[Column] = []
+
+    for name in utils.state_names(cls):
+        if name == _HASH and issubclass(cls, Edge):
+            continue
+
+        values = [getattr(obj, name, utils.UNSET_SLOT) for obj in objs]
+
+        if name in _ENDPOINTS and issubclass(cls, Edge):
+            columns.append((name, [node.id for node in values]))
+        elif name == _METADATA and all(type(value) is Metadata for value in values):
+            columns.append(
+                (
+                    name,
+                    (
+                        [value._created for value in values],
+                        [value._updated for value in values],
+                    ),
+                )
+            )
+        else:
+            columns.append((name, (values,)))
+
+    return tuple(columns)
+
+
+def _decode(
+    encoded: tuple[bytes | list[int], tuple[Table, ...]],
+    nodes: dict[str, t.Any],
+) -> list[t.Any]:
+    order, tables = encoded
+    groups = [iter(_decode_table(table, nodes)) for table in tables]
+
+    return [next(groups[position]) for position in order]
+
+
+def _decode_table(table: Table, nodes: dict[str, t.Any]) -> list[t.Any]:
+    cls, size, columns = table
+    objs = [object.__new__(cls) for _ in range(size)]
+
+    for name, column in columns:
+        if name in _ENDPOINTS and issubclass(cls, Edge):
+            values: t.Iterable[t.Any] = map(nodes.__getitem__, column)
+        elif name == _METADATA and len(column) == 2:
+            values = map(_restore_metadata, *column)
+        else:
+            (values,) = column
+
+        for obj, value in zip(objs, values):
+            if value is not utils.UNSET_SLOT:
+                setattr(obj, name, value)
+
+    return objs
+
+
+def _restore_metadata(created: t.Any, updated: t.Any) -> Metadata:
+    metadata = object.__new__(Metadata)
+    metadata._created = created
+    metadata._updated = updated
+
+    return metadata
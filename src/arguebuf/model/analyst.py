@@ -5,6 +5,8 @@ __all__ = ("Analyst",)
 
 
 class Analyst:
+    __slots__ = ("_id", "email", "name", "userdata")
+
     name: str | None
     email: str | None
     userdata: Userdata
@@ -25,3 +27,6 @@ class Analyst:
     @property
     def id(self) -> str:
         return self._id
+
+    def __reduce__(self):
+        return utils.reduce_slots(self)
@@ -0,0 +1,309 @@
+import typing as t
+from array import array
+
+from arguebuf.model.edge import Edge
+from arguebuf.model.graph import Graph
+from arguebuf.model.node import AbstractNode
+from arguebuf.model.typing import TextType
+from arguebuf.model.utils import TupleSet
+
+__all__ = ("CompactGraph",)
+
+_SLOT_TYPE = "q"
+_MIN_COMPACTION = 64
+
+
+def _csr(keys: array, size: int) -> tuple[array, array]:
+    """Build a compressed sparse row index.
+
+    Args:
+        keys: Row of every entry (e.g., the source slot of every edge).
+        size: Number of rows.
+
+    Returns:
+        Tuple of offsets (length `size + 1`) and the entry positions grouped by row.
+    """
+
+    offsets = array(_SLOT_TYPE, bytes(8 * (size + 1)))
+
+    for key in keys:
+        offsets[key + 1] += 1
+
+    for row in range(size):
+        offsets[row + 1] += offsets[row]
+
+    positions = offsets[:-1]
+    index = array(_SLOT_TYPE, bytes(8 * len(keys)))
+
+    for entry, key in enumerate(keys):
+        index[positions[key]] = entry
+        positions[key] += 1
+
+    return offsets, index
+
+
+class CompactGraph(Graph[TextType]):
+    """Graph with an integer-indexed, array-backed adjacency storage.
+
+    Every node and edge is assigned a dense integer slot.
+    The adjacency lists are kept in typed arrays using the
+    compressed sparse row (CSR) layout instead of one set per node and relation.
+    Elements added after the last compaction are kept in a small append buffer
+    and removed elements are marked as deleted.
+    As soon as the buffer and the deleted elements outnumber the indexed edges,
+    the arrays are rebuilt in a single linear pass during the next query.
+
+    The public API is identical to `Graph`.
+    Neighbor queries return read-only sets ordered by insertion.
+    To use this engine for loading graphs, pass it via `arguebuf.load.Config`:
+    `ag.load.file(path, config=ag.load.Config(GraphClass=ag.CompactGraph))`.
+
+    Examples:
+        >>> from arguebuf.model import AtomNode, SchemeNode
+        >>> g = CompactGraph()
+        >>> n1 = AtomNode("Premise")
+        >>> n2 = SchemeNode()
+        >>> n3 = AtomNode("Claim")
+        >>> g.add_edge(Edge(n1, n2))
+        >>> g.add_edge(Edge(n2, n3))
+        >>> g.outgoing_atom_nodes(n1) == {n3}
+        True
+        >>> g.remove_node(n2)
+        >>> len(g.outgoing_nodes(n1))
+        0
+    """
+
+    __slots__ = (
+        "_budget",
+        "_edge_slots",
+        "_edge_sources",
+        "_edge_targets",
+        "_garbage",
+        "_incoming_index",
+        "_incoming_offsets",
+        "_indexed_edges",
+        "_node_slots",
+        "_outgoing_index",
+        "_outgoing_offsets",
+        "_pending",
+        "_pending_incoming",
+        "_pending_outgoing",
+        "_slot_edges",
+        "_slot_nodes",
+        "_unindexed",
+    )
+
+    _node_slots: dict[str, int]
+    _slot_nodes: list[AbstractNode | None]
+    _edge_slots: dict[str, int]
+    _slot_edges: list[Edge | None]
+    _edge_sources: array
+    _edge_targets: array
+    _incoming_offsets: array
+    _incoming_index: array
+    _outgoing_offsets: array
+    _outgoing_index: array
+    _pending_incoming: dict[int, list[int]]
+    _pending_outgoing: dict[int, list[int]]
+    _indexed_edges: int
+    _pending: int
+    _unindexed: int
+    _garbage: int
+    _budget: int
+
+    def __init__(self, name: str | None = None):
+        self._node_slots = {}
+        self._slot_nodes = []
+        self._edge_slots = {}
+        self._slot_edges = []
+        self._edge_sources = array(_SLOT_TYPE)
+        self._edge_targets = array(_SLOT_TYPE)
+        self._incoming_offsets = array(_SLOT_TYPE, [0])
+        self._incoming_index = array(_SLOT_TYPE)
+        self._outgoing_offsets = array(_SLOT_TYPE, [0])
+        self._outgoing_index = array(_SLOT_TYPE)
+        self._pending_incoming = {}
+        self._pending_outgoing = {}
+        self._indexed_edges = 0
+        self._pending = 0
+        self._unindexed = 0
+        self._garbage = 0
+        self._budget = _MIN_COMPACTION
+
+        super().__init__(name)
+
+    def incoming_nodes(self, node: str | AbstractNode) -> t.AbstractSet[AbstractNode]:
+        return self._neighbor_nodes(node, incoming=True)
+
+    def outgoing_nodes(self, node: str | AbstractNode) -> t.AbstractSet[AbstractNode]:
+        return self._neighbor_nodes(node, incoming=False)
+
+    def incoming_edges(self, node: str | AbstractNode) -> t.AbstractSet[Edge]:
+        slots = self._neighbor_edges(node, incoming=True)
+        edges = self._slot_edges
+
+        return TupleSet([edges[slot] for slot in slots])  # type: ignore
+
+    def outgoing_edges(self, node: str | AbstractNode) -> t.AbstractSet[Edge]:
+        slots = self._neighbor_edges(node, incoming=False)
+        edges = self._slot_edges
+
+        return TupleSet([edges[slot] for slot in slots])  # type: ignore
+
+    child_nodes = incoming_nodes
+    parent_nodes = outgoing_nodes
+
+    def _neighbor_nodes(
+        self, node: str | AbstractNode, incoming: bool
+    ) -> TupleSet[AbstractNode]:
+        slots = self._neighbor_edges(node, incoming)
+        endpoints = self._edge_sources if incoming else self._edge_targets
+        nodes = self._slot_nodes
+
+        # Parallel edges would lead to duplicate nodes
+        if len(slots) > 1:
+            unique_slots = dict.fromkeys([endpoints[slot] for slot in slots])
+            return TupleSet([nodes[slot] for slot in unique_slots])  # type: ignore
+
+        return TupleSet([nodes[endpoints[slot]] for slot in slots])  # type: ignore
+
+    def _neighbor_edges(self, node: str | AbstractNode, incoming: bool) -> list[int]:
+        if self._unindexed or self._pending + self._garbage > self._budget:
+            self.compact()
+
+        slot = self._node_slots[node if isinstance(node, str) else node.id]
+
+        if incoming:
+            offsets, index = self._incoming_offsets, self._incoming_index
+            pending = self._pending_incoming
+        else:
+            offsets, index = self._outgoing_offsets, self._outgoing_index
+            pending = self._pending_outgoing
+
+        slots: list[int] = (
+            index[offsets[slot] : offsets[slot + 1]].tolist()
+            if slot + 1 < len(offsets)
+            else []
+        )
+
+        if self._garbage:
+            edges = self._slot_edges
+            slots = [edge for edge in slots if edges[edge] is not None]
+
+        if pending and (buffered := pending.get(slot)):
+            slots.extend(buffered)
+
+        return slots
+
+    def compact(self) -> None:
+        """Renumber all elements and rebuild the adjacency arrays in linear time.
+
+        Called automatically when necessary, but can be used to free memory
+        after removing many elements.
+        """
+
+        nodes = [node for node in self._slot_nodes if node is not None]
+        remap = array(_SLOT_TYPE, [-1]) * len(self._slot_nodes)
+        new_slot = 0
+
+        for old_slot, node in enumerate(self._slot_nodes):
+            if node is not None:
+                remap[old_slot] = new_slot
+                new_slot += 1
+
+        edge_slots = [
+            slot for slot, edge in enumerate(self._slot_edges) if edge is not None
+        ]
+        edges = [self._slot_edges[slot] for slot in edge_slots]
+        sources = array(
+            _SLOT_TYPE, [remap[self._edge_sources[slot]] for slot in edge_slots]
+        )
+        targets = array(
+            _SLOT_TYPE, [remap[self._edge_targets[slot]] for slot in edge_slots]
+        )
+
+        self._slot_nodes = nodes  # type: ignore
+        self._node_slots = {node.id: slot for slot, node in enumerate(nodes)}
+        self._slot_edges = edges  # type: ignore
+        self._edge_slots = {edge.id: slot for slot, edge in enumerate(edges)}  # type: ignore
+        self._edge_sources = sources
+        self._edge_targets = targets
+        self._incoming_offsets, self._incoming_index = _csr(targets, len(nodes))
+        self._outgoing_offsets, self._outgoing_index = _csr(sources, len(nodes))
+        self._pending_incoming = {}
+        self._pending_outgoing = {}
+        self._indexed_edges = len(edges)
+        self._pending = 0
+        self._unindexed = 0
+        self._garbage = 0
+        # Doubling the budget keeps the amortized cost of compactions constant
+        self._budget = max(_MIN_COMPACTION, len(edges))
+
+    def _link_node(self, node: AbstractNode) -> None:
+        self._node_slots[node.id] = len(self._slot_nodes)
+        self._slot_nodes.append(node)
+
+    def _unlink_node(self, node: AbstractNode) -> None:
+        slot = self._node_slots.pop(node.id)
+        self._slot_nodes[slot] = None
+        self._garbage += 1
+
+    def _link_edge(self, edge: Edge) -> None:
+        slot = len(self._slot_edges)
+        source = self._node_slots[edge.source.id]
+        target = self._node_slots[edge.target.id]
+
+        self._edge_slots[edge.id] = slot
+        self._slot_edges.append(edge)
+        self._edge_sources.append(source)
+        self._edge_targets.append(target)
+        self._pending_outgoing.setdefault(source, []).append(slot)
+        self._pending_incoming.setdefault(target, []).append(slot)
+        self._pending += 1
+
+    def _unlink_edge(self, edge: Edge) -> None:
+        if self._unindexed:
+            self.compact()
+
+        slot = self._edge_slots.pop(edge.id)
+
+        if slot >= self._indexed_edges:
+            self._pending_outgoing[self._edge_sources[slot]].remove(slot)
+            self._pending_incoming[self._edge_targets[slot]].remove(slot)
+            self._pending -= 1
+
+        self._slot_edges[slot] = None
+        self._garbage += 1
+
+    def _link_nodes(self, nodes: list[AbstractNode]) -> None:
+        start = len(self._slot_nodes)
+        self._node_slots.update(
+            (node.id, slot) for slot, node in enumerate(nodes, start)
+        )
+        self._slot_nodes.extend(nodes)
+
+    def _link_edges(self, edges: list[Edge]) -> None:
+        start = len(self._slot_edges)
+        node_slots = self._node_slots
+        sources = array(_SLOT_TYPE, [node_slots[edge.source.id] for edge in edges])
+        targets = array(_SLOT_TYPE, [node_slots[edge.target.id] for edge in edges])
+
+        self._edge_slots.update(
+            (edge.id, slot) for slot, edge in enumerate(edges, start)
+        )
+        self._slot_edges.extend(edges)
+        self._edge_sources.extend(sources)
+        self._edge_targets.extend(targets)
+
+        # Large batches are indexed in a single pass during the next query
+        if self._unindexed or len(edges) + self._pending + self._garbage > self._budget:
+            self._unindexed += len(edges)
+            return
+
+        self._pending += len(edges)
+
+        for slot, source, target in zip(
+            range(start, len(self._slot_edges)), sources, targets
+        ):
+            self._pending_outgoing.setdefault(source, []).append(slot)
+            self._pending_incoming.setdefault(target, []).append(slot)
@@ -1,4 +1,5 @@
 import logging
+import typing as t
 
 from arguebuf.model import utils
 from arguebuf.model.metadata import Metadata
@@ -23,6 +24,7 @@ class Edge:
     """Edge in AIF format. Connection from one Node object to another Node object."""
 
     __slots__ = (
+        "_hash",
         "_id",
         "_source",
         "_target",
@@ -33,6 +35,7 @@ class Edge:
     _id: str
     _source: AbstractNode
     _target: AbstractNode
+    _hash: int
     metadata: Metadata
     userdata: Userdata
 
@@ -50,6 +53,8 @@ class Edge:
         self._id = id or utils.uuid()
         self._source = source
         self._target = target
+        # Id, source, and target are read-only, so the hash can be computed once
+        self._hash = hash((self._id, source, target))
         self.metadata = metadata or Metadata()
         self.userdata = userdata or {}
 
@@ -59,17 +64,25 @@ class Edge:
         pass
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if other is None or not isinstance(other, Edge):
             return False
 
         return (
-            self.id == other.id
-            and self.source == other.source
-            and self.target == other.target
+            self._hash == other._hash
+            and self._id == other._id
+            and self._source == other._source
+            and self._target == other._target
         )
 
     def __hash__(self) -> int:
-        return hash((self.id, self.source, self.target))
+        return self._hash
+
+    def __reduce__(self):
+        # String hashes differ between processes, so the hash is recomputed
+        return _unpickle_edge, utils.reduce_slots(self)[1]
 
     def __str__(self) -> str:
         return str(self.id)
@@ -93,3 +106,10 @@ class Edge:
     def target(self) -> AbstractNode:
         """Gives the 'To'-Node."""
         return self._target
+
+
+def _unpickle_edge(cls: type[Edge], values: tuple[t.Any, ...]) -> Edge:
+    edge = utils.restore_slots(cls, values)
+    edge._hash = hash((edge._id, edge._source, edge._target))
+
+    return edge
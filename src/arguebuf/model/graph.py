@@ -1,8 +1,9 @@
+import copy
 import itertools
 import logging
 import typing as t
 
-from arguebuf.model import utils
+from arguebuf.model import _state, utils
 from arguebuf.model.analyst import Analyst
 from arguebuf.model.edge import Edge
 from arguebuf.model.metadata import Metadata
@@ -10,11 +11,17 @@ from arguebuf.model.node import AbstractNode, AtomNode, SchemeNode
 from arguebuf.model.participant import Participant
 from arguebuf.model.resource import Resource
 from arguebuf.model.typing import TextType
-from arguebuf.model.userdata import Userdata
+from arguebuf.model.userdata import Userdata, copy_userdata
 from arguebuf.model.utils import ImmutableDict, ImmutableSet
+from arguebuf.model.view import GraphView
+
+if t.TYPE_CHECKING:
+    from arguebuf.model.index import GraphIndex
 
 log = logging.getLogger(__name__)
 
+_T = t.TypeVar("_T")
+
 __all__ = ("Graph",)
 
 
@@ -40,6 +47,9 @@ class Graph(t.Generic[TextType]):
         "_resources",
         "_participants",
         "_analysts",
+        "_version",
+        "_cache",
+        "_cache_version",
         "metadata",
         "userdata",
         "library_version",
@@ -59,6 +69,9 @@ class Graph(t.Generic[TextType]):
     _participants: ImmutableDict[str, Participant]
     _major_claim: AtomNode | None
     _analysts: ImmutableDict[str, Analyst]
+    _version: int
+    _cache: dict[t.Hashable, t.Any]
+    _cache_version: int
     library_version: str | None
     schema_version: int | None
     metadata: Metadata
@@ -87,21 +100,20 @@ class Graph(t.Generic[TextType]):
         return self._incoming_nodes[node]
 
     def incoming_atom_nodes(self, node: str | AbstractNode) -> t.AbstractSet[AtomNode]:
-        if isinstance(node, str):
-            node = self._nodes[node]
+        """Find the nearest atom nodes reachable via incoming edges.
 
-        incoming_nodes = list(self._incoming_nodes[node])
-        incoming_atom_nodes: set[AtomNode] = set()
-
-        while incoming_nodes:
-            incoming_node = incoming_nodes.pop()
+        Scheme nodes are skipped, so the result contains the atom nodes
+        that are connected to the given node via chains of scheme nodes.
+        The result is cached until the structure of the graph changes.
+        """
 
-            if isinstance(incoming_node, AtomNode):
-                incoming_atom_nodes.add(incoming_node)
-            else:
-                incoming_nodes.extend(self._incoming_nodes[incoming_node])
+        if isinstance(node, str):
+            node = self._nodes[node]
 
-        return incoming_atom_nodes
+        return self._cached(
+            ("incoming_atom_nodes", node),
+            lambda: self._atom_neighbors(node, self.incoming_nodes),
+        )
 
     def outgoing_nodes(self, node: str | AbstractNode) -> t.AbstractSet[AbstractNode]:
         if isinstance(node, str):
@@ -110,38 +122,87 @@ class Graph(t.Generic[TextType]):
         return self._outgoing_nodes[node]
 
     def outgoing_atom_nodes(self, node: str | AbstractNode) -> t.AbstractSet[AtomNode]:
+        """Find the nearest atom nodes reachable via outgoing edges.
+
+        Scheme nodes are skipped, so the result contains the atom nodes
+        that are connected to the given node via chains of scheme nodes.
+        The result is cached until the structure of the graph changes.
+        """
+
         if isinstance(node, str):
             node = self._nodes[node]
 
-        outgoing_nodes = list(self._outgoing_nodes[node])
-        outgoing_atom_nodes: set[AtomNode] = set()
+        return self._cached(
+            ("outgoing_atom_nodes", node),
+            lambda: self._atom_neighbors(node, self.outgoing_nodes),
+        )
 
-        while outgoing_nodes:
-            outgoing_node = outgoing_nodes.pop()
+    @staticmethod
+    def _atom_neighbors(
+        node: AbstractNode,
+        neighbors: t.Callable[[AbstractNode], t.AbstractSet[AbstractNode]],
+    ) -> frozenset[AtomNode]:
+        search_path = list(neighbors(node))
+        visited: set[AbstractNode] = set(search_path)
+        atom_nodes: set[AtomNode] = set()
+
+        while search_path:
+            current = search_path.pop()
 
             # If it is an Atom, just add it to our result set
-            if isinstance(outgoing_node, AtomNode):
-                outgoing_atom_nodes.add(outgoing_node)
-            # Otherwise, add the outgoing nodes of the current node to the search path
+            if isinstance(current, AtomNode):
+                atom_nodes.add(current)
+            # Otherwise, add its unvisited neighbors to the search path
             else:
-                outgoing_nodes.extend(self._outgoing_nodes[outgoing_node])
+                for neighbor in neighbors(current):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        search_path.append(neighbor)
 
-        return outgoing_atom_nodes
+        return frozenset(atom_nodes)
 
     child_nodes = incoming_nodes
     parent_nodes = outgoing_nodes
 
+    @property
+    def index(self) -> "GraphIndex":
+        """Structural index of the graph, see `arguebuf.model.index.GraphIndex`.
+
+        The index is built on first access and reused until the structure changes.
+        """
+
+        from arguebuf.model.index import GraphIndex
+
+        return self._cached("index", lambda: GraphIndex(self))
+
     def sibling_node_distances(
         self,
         node: str | AbstractNode,
         max_levels: int | None = None,
         node_type: type[AbstractNode] = AbstractNode,
     ) -> dict[AbstractNode, int]:
-        """Find all sibling nodes of a node and their distance in the graph"""
+        """Find all sibling nodes of a node and their distance in the graph
+
+        If the graph is a tree, the result is looked up in `Graph.index`.
+        """
 
         if isinstance(node, str):
             node = self._nodes[node]
 
+        index = self.index
+
+        if index.is_forest:
+            return index.sibling_node_distances(node, max_levels, node_type)
+
+        return self._search_sibling_node_distances(node, max_levels, node_type)
+
+    def _search_sibling_node_distances(
+        self,
+        node: AbstractNode,
+        max_levels: int | None,
+        node_type: type[AbstractNode],
+    ) -> dict[AbstractNode, int]:
+
         # visited: set[AbstractNode] = set()
         sibling_nodes: dict[AbstractNode, int] = {}
         parent_nodes: dict[AbstractNode, int] = {
@@ -203,8 +264,8 @@ class Graph(t.Generic[TextType]):
         return self._outgoing_edges[node]
 
     def scheme_between(self, premise: AtomNode, claim: AtomNode) -> SchemeNode | None:
-        candidates = set(self._outgoing_nodes[premise]).intersection(
-            self._incoming_nodes[claim]
+        candidates = set(self.outgoing_nodes(premise)).intersection(
+            self.incoming_nodes(claim)
         )
 
         if len(candidates) == 1:
@@ -245,22 +306,28 @@ class Graph(t.Generic[TextType]):
         return None
 
     @property
-    def root_nodes(self) -> set[AtomNode]:
+    def root_nodes(self) -> t.AbstractSet[AtomNode]:
         """Find all nodes with no outgoing edges"""
-        return {
-            node
-            for node in self.atom_nodes.values()
-            if len(self.outgoing_nodes(node)) == 0
-        }
+        return self._cached(
+            "root_nodes",
+            lambda: frozenset(
+                node
+                for node in self.atom_nodes.values()
+                if len(self.outgoing_nodes(node)) == 0
+            ),
+        )
 
     @property
-    def leaf_nodes(self) -> set[AtomNode]:
+    def leaf_nodes(self) -> t.AbstractSet[AtomNode]:
         """Find all nodes with no incoming edges"""
-        return {
-            node
-            for node in self.atom_nodes.values()
-            if len(self.incoming_nodes(node)) == 0
-        }
+        return self._cached(
+            "leaf_nodes",
+            lambda: frozenset(
+                node
+                for node in self.atom_nodes.values()
+                if len(self.incoming_nodes(node)) == 0
+            ),
+        )
 
     @property
     def participants(self) -> t.Mapping[str, Participant]:
@@ -292,6 +359,10 @@ class Graph(t.Generic[TextType]):
         self.library_version = None
         self.schema_version = None
 
+        self._version = 0
+        self._cache = {}
+        self._cache_version = 0
+
         self.__post_init__()
 
     def __post_init__(self):
@@ -300,6 +371,176 @@ class Graph(t.Generic[TextType]):
     def __repr__(self):
         return utils.class_repr(self, [self.name])
 
+    @property
+    def version(self) -> int:
+        """Structural version of the graph.
+
+        Incremented whenever a node or edge is added or removed.
+        """
+
+        return self._version
+
+    def _cached(self, key: t.Hashable, factory: t.Callable[[], _T]) -> _T:
+        """Get a derived value that is only valid for the current structure."""
+
+        if self._cache_version != self._version:
+            self._cache.clear()
+            self._cache_version = self._version
+
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = factory()
+            return value
+
+    def copy(self, deep: bool = True, copy_on_write: bool = False) -> "Graph[TextType]":
+        """Copy the graph without serializing it.
+
+        The adjacency indexes are rebuilt directly from the elements of this graph.
+        A shallow copy shares all elements with this graph,
+        so only its structure can be modified independently.
+        A deep copy also copies the elements together with their metadata and userdata,
+        but shares immutable payloads like (parsed) texts and schemes.
+        Attributes added by subclasses of `Graph` are copied the same way.
+
+        Args:
+            deep: Copy the elements of the graph.
+            copy_on_write: Copy nested userdata of a deep copy only when it is accessed
+                (see `arguebuf.model.userdata.CopyOnWriteDict`).
+
+        Examples:
+            >>> from arguebuf import Graph, AtomNode, SchemeNode, Edge
+            >>> g = Graph()
+            >>> n1, n2, n3 = AtomNode("Premise"), SchemeNode(), AtomNode("Claim")
+            >>> g.add_edges([Edge(n1, n2), Edge(n2, n3)])
+            >>> copied = g.copy()
+            >>> copied.remove_node(copied.nodes[n1.id])
+            >>> len(copied.nodes), len(g.nodes)
+            (2, 3)
+            >>> copied.nodes[n3.id] is n3, g.copy(deep=False).nodes[n3.id] is n3
+            (False, True)
+        """
+
+        return self._copy(deep, copy_on_write, {})
+
+    def _copy(
+        self, deep: bool, copy_on_write: bool, memo: dict[int, t.Any]
+    ) -> "Graph[TextType]":
+        g = self._copy_elements(deep, copy_on_write)
+        # Attributes of subclasses, shared by shallow copies and copied by deep ones
+        extra = _state.extra_state(self)
+
+        if deep and extra:
+            memo[id(self)] = g
+            extra = copy.deepcopy(extra, memo)
+
+        _state.restore_extra_state(g, extra)
+
+        return g
+
+    def _copy_elements(self, deep: bool, copy_on_write: bool) -> "Graph[TextType]":
+        if not deep:
+            g = self._derive()
+
+            with utils.gc_paused():
+                g._add_nodes(list(self._nodes.values()))
+                g._add_edges(list(self._edges.values()))
+
+            g._major_claim = self._major_claim
+            g._version += 1
+
+            return g
+
+        def copy_element(obj: _T, **overrides: t.Any) -> _T:
+            return utils.clone(
+                obj,
+                metadata=utils.clone(obj.metadata),  # type: ignore
+                userdata=copy_userdata(obj.userdata, copy_on_write),  # type: ignore
+                **overrides,
+            )
+
+        g = type(self)(self.name)
+        g.metadata = utils.clone(self.metadata)
+        g.userdata = copy_userdata(self.userdata, copy_on_write)
+        g.library_version = self.library_version
+        g.schema_version = self.schema_version
+
+        with utils.gc_paused():
+            resources = g._resources._store
+            participants = g._participants._store
+
+            for resource in self._resources.values():
+                resources[resource.id] = copy_element(resource)
+
+            for participant in self._participants.values():
+                participants[participant.id] = copy_element(participant)
+
+            for analyst in self._analysts.values():
+                g._analysts._store[analyst.id] = utils.clone(
+                    analyst, userdata=copy_userdata(analyst.userdata, copy_on_write)
+                )
+
+            nodes: dict[str, AbstractNode] = {}
+
+            for node in self._nodes.values():
+                if isinstance(node, AtomNode):
+                    reference = node.reference
+                    participant = node.participant
+
+                    if reference is not None:
+                        resource = reference.resource
+                        reference = utils.clone(
+                            reference,
+                            _resource=resource and resources.get(resource.id, resource),
+                        )
+
+                    if participant is not None:
+                        participant = participants.get(participant.id, participant)
+
+                    nodes[node.id] = copy_element(
+                        node, _reference=reference, _participant=participant
+                    )
+                elif isinstance(node, SchemeNode):
+                    nodes[node.id] = copy_element(
+                        node, premise_descriptors=list(node.premise_descriptors)
+                    )
+                else:
+                    nodes[node.id] = copy_element(node)
+
+            edges = [
+                copy_element(
+                    edge,
+                    _source=nodes[edge.source.id],
+                    _target=nodes[edge.target.id],
+                )
+                for edge in self._edges.values()
+            ]
+
+            g._add_nodes(list(nodes.values()))
+            g._add_edges(edges)
+
+        if self._major_claim is not None:
+            g._major_claim = nodes[self._major_claim.id]  # type: ignore
+
+        g._version += 1
+
+        return g
+
+    def __reduce__(self):
+        """Pickle the elements of the graph without its indexes.
+
+        The indexes are rebuilt when unpickling, which is considerably cheaper
+        than transferring them (e.g., between processes).
+        """
+
+        return _state.restore_graph, (type(self), _state.graph_state(self))
+
+    def __copy__(self) -> "Graph[TextType]":
+        return self._copy(False, False, {})
+
+    def __deepcopy__(self, memo: dict[int, t.Any]) -> "Graph[TextType]":
+        return self._copy(True, False, memo)
+
     def add_node(self, node: AbstractNode) -> None:
         """Add a node to the graph.
 
@@ -343,10 +584,69 @@ class Graph(t.Generic[TextType]):
         elif isinstance(node, SchemeNode):
             self._scheme_nodes._store[node.id] = node
 
-        self._incoming_nodes._store[node] = ImmutableSet()
-        self._incoming_edges._store[node] = ImmutableSet()
-        self._outgoing_nodes._store[node] = ImmutableSet()
-        self._outgoing_edges._store[node] = ImmutableSet()
+        self._link_node(node)
+        self._version += 1
+
+    def add_nodes(self, nodes: t.Iterable[AbstractNode]) -> None:
+        """Add multiple nodes to the graph at once.
+
+        All nodes are validated before the graph is modified
+        and the adjacency indexes are built in a single pass.
+
+        Args:
+            nodes: Node objects that are not already part of the graph.
+
+        Examples:
+            >>> g = Graph()
+            >>> g.add_nodes([AtomNode("Premise"), SchemeNode(), AtomNode("Claim")])
+            >>> len(g.nodes)
+            3
+            >>> len(g.atom_nodes)
+            2
+            >>> n = AtomNode("Duplicate")
+            >>> g.add_nodes([n, n])
+            Traceback (most recent call last):
+            ValueError: Duplicate key.
+        """
+
+        nodes = list(nodes)
+        ids: set[str] = set()
+
+        for node in nodes:
+            if not isinstance(node, AbstractNode):
+                raise TypeError(utils.type_error(type(node), AbstractNode))
+
+            if node.id in self._nodes or node.id in ids:
+                raise ValueError(utils.duplicate_key_error(self.name, node.id))
+
+            ids.add(node.id)
+
+        with utils.gc_paused():
+            self._add_nodes(nodes)
+
+        self._version += 1
+
+    def _add_nodes(self, nodes: list[AbstractNode]) -> None:
+        for node in nodes:
+            self._nodes._store[node.id] = node
+
+            if isinstance(node, AtomNode):
+                self._atom_nodes._store[node.id] = node
+
+                if node.participant and node.participant.id not in self._participants:
+                    self.add_participant(node.participant)
+
+                if (
+                    node.reference
+                    and node.reference.resource
+                    and node.reference.resource.id not in self._resources
+                ):
+                    self.add_resource(node.reference.resource)
+
+            elif isinstance(node, SchemeNode):
+                self._scheme_nodes._store[node.id] = node
+
+        self._link_nodes(nodes)
 
     def remove_node(self, node: AbstractNode) -> None:
         """Remove a node and its corresponding edges from the graph.
@@ -384,17 +684,15 @@ class Graph(t.Generic[TextType]):
         elif isinstance(node, SchemeNode):
             del self._scheme_nodes._store[node.id]
 
-        neighbor_edges = list(self._incoming_edges[node]) + list(
-            self._outgoing_edges[node]
+        neighbor_edges = list(self.incoming_edges(node)) + list(
+            self.outgoing_edges(node)
         )
 
         for edge in neighbor_edges:
             self.remove_edge(edge)
 
-        del self._incoming_nodes._store[node]
-        del self._incoming_edges._store[node]
-        del self._outgoing_nodes._store[node]
-        del self._outgoing_edges._store[node]
+        self._unlink_node(node)
+        self._version += 1
 
     def add_edge(self, edge: Edge) -> None:
         """Add an edge and its nodes (if not already added).
@@ -430,10 +728,62 @@ class Graph(t.Generic[TextType]):
         if edge.target.id not in self.nodes:
             self.add_node(edge.target)
 
-        self._outgoing_edges[edge.source]._store.add(edge)
-        self._incoming_edges[edge.target]._store.add(edge)
-        self._outgoing_nodes[edge.source]._store.add(edge.target)
-        self._incoming_nodes[edge.target]._store.add(edge.source)
+        self._link_edge(edge)
+        self._version += 1
+
+    def add_edges(self, edges: t.Iterable[Edge]) -> None:
+        """Add multiple edges and their nodes (if not already added) at once.
+
+        All edges are validated before the graph is modified
+        and the adjacency indexes are built in a single pass.
+
+        Args:
+            edges: Edge objects that are not part of the graph.
+
+        Examples:
+            >>> g = Graph()
+            >>> n1 = AtomNode("Premise")
+            >>> n2 = SchemeNode()
+            >>> n3 = AtomNode("Claim")
+            >>> g.add_edges([Edge(n1, n2), Edge(n2, n3)])
+            >>> len(g.edges)
+            2
+            >>> len(g.nodes)
+            3
+            >>> g.outgoing_atom_nodes(n1) == {n3}
+            True
+        """
+
+        edges = list(edges)
+        ids: set[str] = set()
+        missing_nodes: dict[str, AbstractNode] = {}
+
+        for edge in edges:
+            if not isinstance(edge, Edge):
+                raise TypeError(utils.type_error(type(edge), Edge))
+
+            if edge.id in self._edges or edge.id in ids:
+                raise ValueError(utils.duplicate_key_error(self.name, edge.id))
+
+            ids.add(edge.id)
+
+            for node in (edge.source, edge.target):
+                if node.id not in self._nodes:
+                    missing_nodes.setdefault(node.id, node)
+
+        with utils.gc_paused():
+            if missing_nodes:
+                self._add_nodes(list(missing_nodes.values()))
+
+            self._add_edges(edges)
+
+        self._version += 1
+
+    def _add_edges(self, edges: list[Edge]) -> None:
+        for edge in edges:
+            self._edges._store[edge.id] = edge
+
+        self._link_edges(edges)
 
     def remove_edge(self, edge: Edge) -> None:
         """Remove an edge.
@@ -465,11 +815,59 @@ class Graph(t.Generic[TextType]):
 
         del self._edges._store[edge.id]
 
+        self._unlink_edge(edge)
+        self._version += 1
+
+    # The following hooks maintain the adjacency indexes.
+    # Subclasses may override them (together with the four neighbor queries)
+    # to provide a different storage engine, see `arguebuf.model.compact`.
+
+    def _link_node(self, node: AbstractNode) -> None:
+        self._incoming_nodes._store[node] = ImmutableSet()
+        self._incoming_edges._store[node] = ImmutableSet()
+        self._outgoing_nodes._store[node] = ImmutableSet()
+        self._outgoing_edges._store[node] = ImmutableSet()
+
+    def _unlink_node(self, node: AbstractNode) -> None:
+        del self._incoming_nodes._store[node]
+        del self._incoming_edges._store[node]
+        del self._outgoing_nodes._store[node]
+        del self._outgoing_edges._store[node]
+
+    def _link_edge(self, edge: Edge) -> None:
+        self._outgoing_edges[edge.source]._store.add(edge)
+        self._incoming_edges[edge.target]._store.add(edge)
+        self._outgoing_nodes[edge.source]._store.add(edge.target)
+        self._incoming_nodes[edge.target]._store.add(edge.source)
+
+    def _unlink_edge(self, edge: Edge) -> None:
         self._outgoing_edges[edge.source]._store.remove(edge)
         self._incoming_edges[edge.target]._store.remove(edge)
         self._outgoing_nodes[edge.source]._store.remove(edge.target)
         self._incoming_nodes[edge.target]._store.remove(edge.source)
 
+    def _link_nodes(self, nodes: list[AbstractNode]) -> None:
+        for index in (
+            self._incoming_nodes,
+            self._incoming_edges,
+            self._outgoing_nodes,
+            self._outgoing_edges,
+        ):
+            index._store.update((node, ImmutableSet()) for node in nodes)
+
+    def _link_edges(self, edges: list[Edge]) -> None:
+        incoming_nodes = self._incoming_nodes._store
+        incoming_edges = self._incoming_edges._store
+        outgoing_nodes = self._outgoing_nodes._store
+        outgoing_edges = self._outgoing_edges._store
+
+        for edge in edges:
+            source, target = edge.source, edge.target
+            outgoing_edges[source]._store.add(edge)
+            incoming_edges[target]._store.add(edge)
+            outgoing_nodes[source]._store.add(target)
+            incoming_nodes[target]._store.add(source)
+
     ##What does a Resource look like?
     def add_resource(self, resource: Resource) -> None:
         """Add a resource.
@@ -642,6 +1040,50 @@ class Graph(t.Generic[TextType]):
 
         del self._analysts._store[analyst.id]
 
+    def subgraph(self, nodes: t.Iterable[str | AbstractNode]) -> GraphView[TextType]:
+        """Create a read-only view of the given nodes and the edges between them.
+
+        The view filters the indexes of this graph instead of copying them.
+        Call `GraphView.materialize` to get an independent graph.
+
+        Args:
+            nodes: Node objects or ids of nodes that are part of the graph.
+
+        Examples:
+            >>> from arguebuf import Graph, AtomNode, SchemeNode, Edge, traverse
+            >>> g = Graph()
+            >>> n1, n2, n3 = AtomNode("Premise"), SchemeNode(), AtomNode("Claim")
+            >>> g.add_edges([Edge(n1, n2), Edge(n2, n3)])
+            >>> neighborhood = traverse.iter_bfs(n3, g.incoming_nodes, max_depth=1)
+            >>> view = g.subgraph(neighborhood)
+            >>> sorted(node.id for node in view.nodes.values()) == sorted([n2.id, n3.id])
+            True
+            >>> len(view.edges)
+            1
+        """
+
+        return GraphView(self, frozenset(map(self._node, nodes)).__contains__)
+
+    def view(self, predicate: t.Callable[[AbstractNode], bool]) -> GraphView[TextType]:
+        """Create a read-only view of the nodes satisfying `predicate` and the edges between them.
+
+        The predicate is evaluated lazily whenever the view is accessed.
+
+        Examples:
+            >>> from arguebuf import Graph, AtomNode, SchemeNode, Edge, Attack
+            >>> g = Graph()
+            >>> n1, n2, n3 = AtomNode("Premise"), SchemeNode(Attack.DEFAULT), AtomNode("Claim")
+            >>> g.add_edges([Edge(n1, n2), Edge(n2, n3)])
+            >>> view = g.view(lambda node: isinstance(node, AtomNode))
+            >>> len(view.nodes), len(view.edges)
+            (2, 0)
+        """
+
+        return GraphView(self, predicate)
+
+    def _node(self, node: str | AbstractNode) -> AbstractNode:
+        return self._nodes[node] if isinstance(node, str) else node
+
     def remove_scheme_nodes(self) -> None:
         """Remove scheme nodes from graph to connect atom nodes directly
 
@@ -666,18 +1108,138 @@ class Graph(t.Generic[TextType]):
 
     strip_scheme_nodes = remove_scheme_nodes
 
+    def atom_projection(self) -> "Graph[TextType]":
+        """Create a new graph containing only the atom nodes of this graph.
+
+        Two atom nodes are connected if there is a direct edge between them
+        or if they are linked through a chain of scheme nodes.
+        Unlike `remove_scheme_nodes`, this graph is left untouched
+        and atom nodes linked by multiple chains are connected by a single edge.
+        The projection shares its nodes, resources, participants, and analysts
+        with this graph.
+
+        Examples:
+            >>> from arguebuf import Graph, AtomNode, SchemeNode, Edge
+            >>> g = Graph()
+            >>> n1, n2, n3 = AtomNode("Premise"), SchemeNode(), AtomNode("Claim")
+            >>> g.add_edges([Edge(n1, n2), Edge(n2, n3)])
+            >>> projection = g.atom_projection()
+            >>> len(projection.nodes), len(g.nodes)
+            (2, 3)
+            >>> projection.outgoing_nodes(n1) == {n3}
+            True
+        """
+
+        g = self._derive()
+        g.add_nodes(self._atom_nodes.values())
+        g._major_claim = self._major_claim
+        g.add_edges(self._project_atom_edges())
+
+        return g
+
+    def _derive(self) -> "Graph[TextType]":
+        """Create an empty graph of the same class sharing the graph-level attributes."""
+
+        g = type(self)(self.name)
+        g.metadata = self.metadata
+        g.userdata = self.userdata
+        g.library_version = self.library_version
+        g.schema_version = self.schema_version
+
+        for resource in self._resources.values():
+            g.add_resource(resource)
+
+        for participant in self._participants.values():
+            g.add_participant(participant)
+
+        for analyst in self._analysts.values():
+            g.add_analyst(analyst)
+
+        return g
+
+    def _project_atom_edges(self) -> t.Iterator[Edge]:
+        outgoing_nodes = self.outgoing_nodes
+        scheme_targets = self._scheme_atom_targets()
+
+        for atom in self._atom_nodes.values():
+            targets: dict[AtomNode, None] = {}
+            direct_targets: set[AbstractNode] = set()
+
+            for edge in self.outgoing_edges(atom):
+                if isinstance(edge.target, AtomNode):
+                    direct_targets.add(edge.target)
+                    yield edge
+
+            for neighbor in outgoing_nodes(atom):
+                if isinstance(neighbor, SchemeNode):
+                    targets.update(
+                        dict.fromkeys(
+                            self._atom_neighbors(neighbor, self.outgoing_nodes)
+                        )
+                        if scheme_targets is None
+                        else scheme_targets[neighbor]
+                    )
+
+            # Targets connected directly already have an edge
+            for target in targets:
+                if target not in direct_targets:
+                    yield Edge(atom, target)
+
+    def _scheme_atom_targets(
+        self,
+    ) -> dict[AbstractNode, dict[AtomNode, None]] | None:
+        """Find the atom nodes reachable from every scheme node in a single pass.
+
+        The targets of a scheme node are merged into its predecessors
+        during an iterative post-order traversal of the scheme nodes.
+        Returns `None` if the scheme nodes contain a cycle.
+        """
+
+        outgoing_nodes = self.outgoing_nodes
+        targets: dict[AbstractNode, dict[AtomNode, None]] = {}
+
+        for scheme in self._scheme_nodes.values():
+            if scheme in targets:
+                continue
+
+            targets[scheme] = {}
+            active = {scheme}
+            stack = [(scheme, iter(outgoing_nodes(scheme)))]
+
+            while stack:
+                node, neighbors = stack[-1]
+                node_targets = targets[node]
+
+                for neighbor in neighbors:
+                    if isinstance(neighbor, AtomNode):
+                        node_targets[neighbor] = None
+                    elif neighbor in active:
+                        return None
+                    elif neighbor in targets:
+                        node_targets.update(targets[neighbor])
+                    else:
+                        targets[neighbor] = {}
+                        active.add(neighbor)
+                        stack.append((neighbor, iter(outgoing_nodes(neighbor))))
+                        break
+                else:
+                    stack.pop()
+                    active.discard(node)
+
+                    if stack:
+                        targets[stack[-1][0]].update(node_targets)
+
+        return targets
+
     def remove_empty_scheme_branches(self) -> None:
         """Remove scheme nodes from graph where scheme is None"""
 
-        scheme_nodes = {
-            node for node in self.scheme_nodes.values() if node.scheme is None
-        }
-
-        while scheme_nodes:
-            scheme_node = scheme_nodes.pop()
+        scheme_nodes = [
+            node for node in self._scheme_nodes.values() if node.scheme is None
+        ]
 
-            if scheme_node.id in self.scheme_nodes:
-                self.remove_branch(scheme_node)
+        for node in self._branch_nodes(scheme_nodes):
+            self.remove_node(node)
 
     def remove_branch(self, element: AbstractNode | Edge | str) -> None:
         """Remove an element and all its descendants from the graph.
@@ -690,8 +1252,23 @@ class Graph(t.Generic[TextType]):
         if isinstance(element, Edge):
             element = element.source
 
-        descendants = list(self.incoming_nodes(element))
-        self.remove_node(element)
+        for node in self._branch_nodes([element]):
+            self.remove_node(node)
+
+    def _branch_nodes(self, starts: t.Iterable[AbstractNode]) -> list[AbstractNode]:
+        # Iterative search, so deep branches do not exceed the recursion limit
+        incoming_nodes = self.incoming_nodes
+        stack = list(dict.fromkeys(starts))
+        visited = set(stack)
+        branch: list[AbstractNode] = []
+
+        while stack:
+            node = stack.pop()
+            branch.append(node)
+
+            for descendant in incoming_nodes(node):
+                if descendant not in visited:
+                    visited.add(descendant)
+                    stack.append(descendant)
 
-        for descendant in descendants:
-            self.remove_branch(descendant)
+        return branch
@@ -0,0 +1,532 @@
+import itertools
+import typing as t
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+from arguebuf import traverse
+from arguebuf.model.node import AbstractNode, AtomNode
+
+if t.TYPE_CHECKING:
+    from arguebuf.model.graph import Graph
+
+__all__ = ("GraphIndex",)
+
+_POSITION_TYPE = "q"
+
+
+class GraphIndex:
+    """Precomputed structural information about a graph.
+
+    The index is built in a single O(V+E) pass and is only valid
+    as long as the structure of the graph does not change.
+    Use `Graph.index` to get an index that is rebuilt automatically when needed.
+
+    Parents are the outgoing neighbors of a node (i.e., towards the major claim),
+    children are the incoming neighbors.
+    If every node has at most one parent and no cycles are present,
+    the graph is a forest and sibling as well as distance queries
+    are answered from the index.
+    Otherwise, they fall back to searching the graph.
+
+    Examples:
+        >>> from arguebuf import Graph, AtomNode, SchemeNode, Edge, Support
+        >>> g = Graph()
+        >>> claim = AtomNode("Claim")
+        >>> premises = [AtomNode("Premise 1"), AtomNode("Premise 2")]
+        >>> schemes = [SchemeNode(Support.DEFAULT), SchemeNode(Support.DEFAULT)]
+        >>> for premise, scheme in zip(premises, schemes):
+        ...     g.add_edges([Edge(premise, scheme), Edge(scheme, claim)])
+        >>> index = g.index
+        >>> index.is_forest
+        True
+        >>> index.depths[premises[0]]
+        2
+        >>> index.sibling_node_distances(premises[0], node_type=AtomNode) == {
+        ...     premises[0]: 1, premises[1]: 2
+        ... }
+        True
+        >>> index.lowest_common_ancestor(premises[0], premises[1]) == claim
+        True
+        >>> index.tree_distance(premises[0], premises[1])
+        4
+        >>> index.node_distance(premises[0], claim)
+        2
+    """
+
+    __slots__ = (
+        "_depths",
+        "_graph",
+        "_is_forest",
+        "_level_positions",
+        "_levels",
+        "_parents",
+        "_preorder",
+        "_preorder_depths",
+        "_preorder_nodes",
+        "_sparse_table",
+        "_subtree_end",
+    )
+
+    _graph: "Graph"
+    _depths: dict[AbstractNode, int]
+    _parents: dict[AbstractNode, AbstractNode | None]
+    _is_forest: bool
+    _preorder: dict[AbstractNode, int]
+    _subtree_end: dict[AbstractNode, int]
+    _levels: list[list[AbstractNode]]
+    _level_positions: list[list[int]]
+    _preorder_nodes: list[AbstractNode]
+    _preorder_depths: array
+    _sparse_table: list[array] | None
+
+    def __init__(self, graph: "Graph") -> None:
+        self._graph = graph
+        self._parents = {}
+        self._is_forest = True
+        roots: list[AbstractNode] = []
+
+        for node in graph.nodes.values():
+            parents = graph.outgoing_nodes(node)
+
+            if not parents:
+                self._parents[node] = None
+                roots.append(node)
+            else:
+                self._parents[node] = next(iter(parents))
+
+                if len(parents) > 1:
+                    self._is_forest = False
+
+        self._depths = _shortest_depths(roots, graph.incoming_nodes)
+        self._preorder = {}
+        self._subtree_end = {}
+        self._levels = []
+        self._level_positions = []
+        self._preorder_nodes = []
+        self._preorder_depths = array(_POSITION_TYPE)
+        self._sparse_table = None
+
+        if self._is_forest:
+            self._index_forest(roots)
+
+    def _index_forest(self, roots: list[AbstractNode]) -> None:
+        """Number the nodes in preorder and group them by depth.
+
+        The descendants of a node at a given depth then form
+        a contiguous range of the corresponding level.
+        """
+
+        graph = self._graph
+        preorder = self._preorder
+        subtree_end = self._subtree_end
+        counter = 0
+        # The flag marks nodes whose subtree has been visited completely
+        stack: list[tuple[AbstractNode, int, bool]] = [
+            (root, 0, False) for root in reversed(roots)
+        ]
+
+        while stack:
+            node, depth, finished = stack.pop()
+
+            if finished:
+                subtree_end[node] = counter - 1
+                continue
+
+            preorder[node] = counter
+            counter += 1
+            self._preorder_nodes.append(node)
+            self._preorder_depths.append(depth)
+
+            if depth == len(self._levels):
+                self._levels.append([])
+                self._level_positions.append([])
+
+            self._levels[depth].append(node)
+            self._level_positions[depth].append(preorder[node])
+
+            stack.append((node, depth, True))
+            stack.extend(
+                (child, depth + 1, False) for child in graph.incoming_nodes(node)
+            )
+
+        # Nodes that cannot be reached from a root are part of a cycle
+        if len(preorder) != len(graph.nodes):
+            self._is_forest = False
+
+    @property
+    def is_forest(self) -> bool:
+        """Whether every node has at most one parent and the graph is acyclic."""
+
+        return self._is_forest
+
+    @property
+    def depths(self) -> t.Mapping[AbstractNode, int]:
+        """Length of the shortest path from every node to a root.
+
+        Roots are nodes without outgoing edges (usually the major claim).
+        Nodes that cannot reach a root (i.e., nodes in cycles) are not included.
+        """
+
+        return self._depths
+
+    def parent(self, node: AbstractNode) -> AbstractNode | None:
+        """Get the parent of a node in a forest (or one of its parents otherwise)."""
+
+        return self._parents[node]
+
+    def ancestors(self, node: AbstractNode) -> list[AbstractNode]:
+        """Get the chain of parents from `node` up to its root.
+
+        Only available for forests.
+        """
+
+        self._require_forest()
+        ancestors: list[AbstractNode] = []
+
+        while (parent := self._parents[node]) is not None:
+            ancestors.append(parent)
+            node = parent
+
+        return ancestors
+
+    def sibling_node_distances(
+        self,
+        node: str | AbstractNode,
+        max_levels: int | None = None,
+        node_type: type[AbstractNode] = AbstractNode,
+    ) -> dict[AbstractNode, int]:
+        """Find all sibling nodes of a node and their distance in the graph.
+
+        Nodes are siblings with distance `n` if they share an ancestor
+        that is `n` levels above both of them.
+        Same result as `Graph.sibling_node_distances`.
+        """
+
+        if isinstance(node, str):
+            node = self._graph.nodes[node]
+
+        if not self._is_forest:
+            return self._graph._search_sibling_node_distances(
+                node, max_levels, node_type
+            )
+
+        depth = self._depths[node]
+        positions = self._level_positions[depth]
+        level_nodes = self._levels[depth]
+        # The first level is always searched
+        levels = depth if max_levels is None else min(depth, max(max_levels, 1))
+
+        siblings: dict[AbstractNode, int] = {}
+        ancestor = node
+        start = end = bisect_left(positions, self._preorder[node])
+
+        for level in range(1, levels + 1):
+            ancestor = t.cast(AbstractNode, self._parents[ancestor])
+            new_start = bisect_left(positions, self._preorder[ancestor])
+            new_end = bisect_right(positions, self._subtree_end[ancestor])
+
+            for sibling in itertools.chain(
+                level_nodes[new_start:start], level_nodes[end:new_end]
+            ):
+                if isinstance(sibling, node_type):
+                    siblings[sibling] = level
+
+            start, end = new_start, new_end
+
+        return siblings
+
+    def all_sibling_node_distances(
+        self,
+        max_levels: int | None = None,
+        node_type: type[AbstractNode] = AbstractNode,
+    ) -> dict[AbstractNode, dict[AbstractNode, int]]:
+        """Find the siblings and their distances for every node of the graph."""
+
+        return {
+            node: self.sibling_node_distances(node, max_levels, node_type)
+            for node in self._graph.nodes.values()
+        }
+
+    def sibling_distance_matrix(
+        self,
+        max_levels: int | None = None,
+        node_type: type[AbstractNode] = AbstractNode,
+        missing: int = -1,
+    ) -> tuple[list[AbstractNode], t.Any]:
+        """Get the sibling distances of all nodes as a dense NumPy matrix.
+
+        Requires `numpy` to be installed.
+
+        Args:
+            max_levels: Only consider siblings up to this distance.
+            node_type: Only include nodes of this type as rows and columns.
+            missing: Value for pairs of nodes that are no siblings.
+
+        Returns:
+            The nodes in the order of the rows/columns and the distance matrix.
+        """
+
+        np = _import_numpy()
+        nodes = [
+            node for node in self._graph.nodes.values() if isinstance(node, node_type)
+        ]
+        positions = {node: i for i, node in enumerate(nodes)}
+        matrix = np.full((len(nodes), len(nodes)), missing, dtype=np.int32)
+
+        for row, node in enumerate(nodes):
+            for sibling, distance in self.sibling_node_distances(
+                node, max_levels, node_type
+            ).items():
+                matrix[row, positions[sibling]] = distance
+
+        return nodes, matrix
+
+    def lowest_common_ancestor(
+        self, node1: AbstractNode, node2: AbstractNode
+    ) -> AbstractNode | None:
+        """Get the deepest node that is an ancestor of (or equal to) both nodes.
+
+        Only available for forests.
+        Answered in constant time after building a sparse table on first use.
+
+        Returns:
+            The common ancestor or `None` if the nodes belong to different trees.
+        """
+
+        self._require_forest()
+
+        if node1 == node2:
+            return node1
+
+        position1, position2 = sorted((self._preorder[node1], self._preorder[node2]))
+
+        # The shallowest node between both nodes (in preorder)
+        # is a child of their lowest common ancestor.
+        # If it is a root, the nodes are part of different trees.
+        child = self._preorder_nodes[self._min_depth_position(position1 + 1, position2)]
+
+        return self._parents[child]
+
+    def tree_distance(self, node1: AbstractNode, node2: AbstractNode) -> int | None:
+        """Get the number of edges between two nodes, regardless of their direction.
+
+        For forests, the distance is computed via the lowest common ancestor.
+        Otherwise, a breadth-first search is used.
+
+        Returns:
+            The distance or `None` if the nodes are not connected.
+        """
+
+        if not self._is_forest:
+            return traverse.node_distance(node1, node2, self._neighbors)
+
+        ancestor = self.lowest_common_ancestor(node1, node2)
+
+        if ancestor is None:
+            return None
+
+        depths = self._depths
+
+        return depths[node1] + depths[node2] - 2 * depths[ancestor]
+
+    def node_distance(
+        self,
+        start_node: AbstractNode,
+        end_node: AbstractNode,
+        max_distance: int | None = None,
+        directed: bool = True,
+    ) -> int | None:
+        """Same as `traverse.node_distance` with `connections=graph.outgoing_nodes`.
+
+        For forests, a path along the outgoing edges only exists
+        if `end_node` is an ancestor of `start_node`,
+        so the distance is computed from their depths.
+        Otherwise, a breadth-first search is used.
+        """
+
+        if not self._is_forest:
+            return traverse.node_distance(
+                start_node,
+                end_node,
+                self._graph.outgoing_nodes,
+                max_distance,
+                directed,
+            )
+
+        distance = self._ancestor_distance(start_node, end_node)
+
+        if distance is None and not directed:
+            distance = self._ancestor_distance(end_node, start_node)
+
+        if (
+            distance is not None
+            and max_distance is not None
+            and distance > max_distance
+        ):
+            return None
+
+        return distance
+
+    def _neighbors(self, node: AbstractNode) -> t.Iterable[AbstractNode]:
+        return itertools.chain(
+            self._graph.incoming_nodes(node), self._graph.outgoing_nodes(node)
+        )
+
+    def _ancestor_distance(
+        self, node: AbstractNode, ancestor: AbstractNode
+    ) -> int | None:
+        position = self._preorder[node]
+
+        if self._preorder[ancestor] <= position <= self._subtree_end[ancestor]:
+            return self._depths[node] - self._depths[ancestor]
+
+        return None
+
+    def distance_matrix(
+        self,
+        node_type: type[AbstractNode] = AtomNode,
+        missing: int = -1,
+    ) -> tuple[list[AbstractNode], t.Any]:
+        """Get the pairwise `tree_distance` of all nodes as a dense NumPy matrix.
+
+        For forests, all lowest common ancestors of a row are computed at once
+        using vectorized lookups in the sparse table.
+        Requires `numpy` to be installed.
+
+        Args:
+            node_type: Only include nodes of this type as rows and columns.
+            missing: Value for pairs of nodes that are not connected.
+
+        Returns:
+            The nodes in the order of the rows/columns and the distance matrix.
+        """
+
+        np = _import_numpy()
+        nodes = [
+            node for node in self._graph.nodes.values() if isinstance(node, node_type)
+        ]
+        matrix = np.full((len(nodes), len(nodes)), missing, dtype=np.int32)
+
+        if not self._is_forest:
+            # One breadth-first search per row
+            for row, node in enumerate(nodes):
+                distances = _shortest_depths([node], self._neighbors)
+                matrix[row] = [distances.get(other, missing) for other in nodes]
+
+            return nodes, matrix
+
+        if not nodes:
+            return nodes, matrix
+
+        table = np.array(self._get_sparse_table(), dtype=np.int64)
+        preorder_depths = np.array(self._preorder_depths, dtype=np.int64)
+        # Preorder position of every node's parent, -1 for roots
+        parents = np.array(
+            [
+                -1
+                if (parent := self._parents[node]) is None
+                else self._preorder[parent]
+                for node in self._preorder_nodes
+            ],
+            dtype=np.int64,
+        )
+        # Depth of the parents with a sentinel for roots
+        parent_depths = np.append(preorder_depths, -1)[parents]
+        positions = np.array([self._preorder[node] for node in nodes], dtype=np.int64)
+        depths = preorder_depths[positions]
+
+        for row, position in enumerate(positions):
+            low = np.minimum(positions, position) + 1
+            high = np.maximum(positions, position)
+            # Ranges are empty for the node itself, use a valid dummy range
+            same = low > high
+            low[same] = high[same]
+            size = high - low + 1
+            level = np.frexp(size)[1] - 1
+            left = table[level, low]
+            right = table[level, high - (1 << level) + 1]
+            child = np.where(
+                preorder_depths[left] <= preorder_depths[right], left, right
+            )
+            ancestor_depths = parent_depths[child]
+            distances = depths[row] + depths - 2 * ancestor_depths
+            distances[same] = 0
+            matrix[row] = np.where(same | (ancestor_depths >= 0), distances, missing)
+
+        return nodes, matrix
+
+    def _get_sparse_table(self) -> list[array]:
+        """Build a sparse table for range minimum queries over the preorder depths.
+
+        Row `k` contains the position of the shallowest node
+        in the range of length `2**k` starting at every position.
+        All rows have the same length, positions past the end are left unchanged.
+        """
+
+        if self._sparse_table is None:
+            depths = self._preorder_depths
+            size = len(depths)
+            table = [array(_POSITION_TYPE, range(size))]
+            width = 1
+
+            while 2 * width <= size:
+                previous = table[-1]
+                current = array(_POSITION_TYPE, previous)
+
+                for i in range(size - 2 * width + 1):
+                    left, right = previous[i], previous[i + width]
+                    current[i] = left if depths[left] <= depths[right] else right
+
+                table.append(current)
+                width *= 2
+
+            self._sparse_table = table
+
+        return self._sparse_table
+
+    def _min_depth_position(self, low: int, high: int) -> int:
+        table = self._get_sparse_table()
+        depths = self._preorder_depths
+        level = (high - low + 1).bit_length() - 1
+        left = table[level][low]
+        right = table[level][high - (1 << level) + 1]
+
+        return left if depths[left] <= depths[right] else right
+
+    def _require_forest(self) -> None:
+        if not self._is_forest:
+            raise ValueError(
+                "This operation is only supported for graphs where every node has"
+                " at most one parent and no cycles are present."
+            )
+
+
+def _import_numpy() -> t.Any:
+    try:
+        import numpy
+    except ModuleNotFoundError as e:
+        raise ModuleNotFoundError(
+            "Computing a distance matrix requires 'numpy' to be installed."
+        ) from e
+
+    return numpy
+
+
+def _shortest_depths(
+    roots: t.Iterable[AbstractNode],
+    children: t.Callable[[AbstractNode], t.Iterable[AbstractNode]],
+) -> dict[AbstractNode, int]:
+    depths = {root: 0 for root in roots}
+    queue = deque(depths)
+
+    while queue:
+        node = queue.popleft()
+        depth = depths[node] + 1
+
+        for child in children(node):
+            if child not in depths:
+                depths[child] = depth
+                queue.append(child)
+
+    return depths
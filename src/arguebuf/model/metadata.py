@@ -1,21 +1,59 @@
 import pendulum
 
+from arguebuf import dt
+from arguebuf.model import utils
+
 __all__ = ("Metadata",)
 
 
 class Metadata:
-    created: pendulum.DateTime
-    updated: pendulum.DateTime
+    """Timestamps of an element.
+
+    The timestamps may be passed as `pendulum.DateTime` objects or as raw values
+    (see `arguebuf.dt.RawDateTime`) that are only converted when first accessed.
+    This way, loading a graph does not construct two `pendulum.DateTime` objects
+    for every node and edge.
+    """
+
+    __slots__ = ("_created", "_updated")
+
+    _created: dt.RawDateTime
+    _updated: dt.RawDateTime
 
     def __init__(
         self,
-        created: pendulum.DateTime | None = None,
-        updated: pendulum.DateTime | None = None,
+        created: dt.RawDateTime | None = None,
+        updated: dt.RawDateTime | None = None,
     ) -> None:
-        now = pendulum.now()
+        now = dt.now() if created is None or updated is None else None
+
+        self._created = now if created is None else created  # type: ignore
+        self._updated = now if updated is None else updated  # type: ignore
+
+    @property
+    def created(self) -> pendulum.DateTime:
+        if not isinstance(self._created, pendulum.DateTime):
+            self._created = dt.materialize(self._created)
 
-        self.created = created or now
-        self.updated = updated or now
+        return self._created
+
+    @created.setter
+    def created(self, value: dt.RawDateTime) -> None:
+        self._created = value
+
+    @property
+    def updated(self) -> pendulum.DateTime:
+        if not isinstance(self._updated, pendulum.DateTime):
+            self._updated = dt.materialize(self._updated)
+
+        return self._updated
+
+    @updated.setter
+    def updated(self, value: dt.RawDateTime) -> None:
+        self._updated = value
 
     def update(self) -> None:
-        self.updated = pendulum.now()
+        self._updated = dt.now()
+
+    def __reduce__(self):
+        return utils.reduce_slots(self)
@@ -19,6 +19,7 @@ __all__ = (
     "AtomOrSchemeNode",
     "NO_SCHEME_LABEL",
     "NodeType",
+    "scheme_label",
 )
 
 
@@ -54,6 +55,8 @@ scheme2color: dict[type[Scheme], Color] = {
 class AbstractNode(ABC):
     """Node in the AIF format."""
 
+    __slots__ = ("_id", "metadata", "userdata")
+
     _id: str
     metadata: Metadata
     userdata: Userdata
@@ -74,13 +77,20 @@ class AbstractNode(ABC):
         pass
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+
         if other is None or not isinstance(other, AbstractNode):
             return False
 
-        return self.id == other.id
+        return self._id == other._id
 
     def __hash__(self) -> int:
-        return hash(self.id)
+        # Strings cache their hash, so this does not need to be stored separately
+        return hash(self._id)
+
+    def __reduce__(self):
+        return utils.reduce_slots(self)
 
     def __str__(self) -> str:
         return str(self.id)
@@ -104,9 +114,6 @@ class AbstractNode(ABC):
 
 class AtomNode(AbstractNode, t.Generic[TextType]):
     __slots__ = (
-        "_id",
-        "metadata",
-        "userdata",
         "text",
         "_reference",
         "_participant",
@@ -161,10 +168,6 @@ class AtomNode(AbstractNode, t.Generic[TextType]):
 
 class SchemeNode(AbstractNode):
     __slots__ = (
-        "_id",
-        "created",
-        "updated",
-        "userdata",
         "scheme",
         "premise_descriptors",
     )
@@ -196,15 +199,7 @@ class SchemeNode(AbstractNode):
 
     @property
     def label(self) -> str:
-        label = NO_SCHEME_LABEL
-
-        if self.scheme:
-            label = type(self.scheme).__name__
-
-            if self.scheme.value != "Default":
-                label = f"{label}: {self.scheme.value}"
-
-        return label
+        return scheme_label(self.scheme)
 
     def color(self, major_claim: bool, monochrome: bool) -> Color:
         """Get the color used in OVA based on `category`."""
@@ -216,3 +211,17 @@ class SchemeNode(AbstractNode):
 
 AtomOrSchemeNode = AtomNode | SchemeNode
 NodeType = t.TypeVar("NodeType", AtomNode, SchemeNode, AbstractNode)
+
+
+def scheme_label(scheme: Scheme | None) -> str:
+    """Generate the label of a scheme node with the given scheme (e.g., `Support: Example`)."""
+
+    label = NO_SCHEME_LABEL
+
+    if scheme:
+        label = type(scheme).__name__
+
+        if scheme.value != "Default":
+            label = f"{label}: {scheme.value}"
+
+    return label
@@ -6,6 +6,18 @@ __all__ = ("Participant",)
 
 
 class Participant:
+    __slots__ = (
+        "_id",
+        "description",
+        "email",
+        "location",
+        "metadata",
+        "name",
+        "url",
+        "userdata",
+        "username",
+    )
+
     name: str | None
     username: str | None
     email: str | None
@@ -41,3 +53,6 @@ class Participant:
     @property
     def id(self) -> str:
         return self._id
+
+    def __reduce__(self):
+        return utils.reduce_slots(self)
@@ -7,6 +7,8 @@ __all__ = ("Reference",)
 
 
 class Reference:
+    __slots__ = ("_resource", "offset", "text")
+
     _resource: Resource | None
     offset: int | None
     text: t.Any
@@ -29,3 +31,6 @@ class Reference:
     @property
     def resource(self) -> Resource | None:
         return self._resource
+
+    def __reduce__(self):
+        return utils.reduce_slots(self)
@@ -10,7 +10,7 @@ from arguebuf.model.userdata import Userdata
 __all__ = ("Resource",)
 
 
-@dataclass()
+@dataclass(slots=True)
 class Resource:
     text: t.Any
     title: str | None = None
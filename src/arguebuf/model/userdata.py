@@ -1,5 +1,199 @@
+import copy
+import math
 import typing as t
+from collections import abc
 
-__all__ = ("Userdata",)
+from arguebuf.model.utils import protobuf_map_order, protobuf_string
 
-Userdata = dict[str, t.Any]
+__all__ = ("CopyOnWriteDict", "Userdata", "copy_userdata", "userdata_to_json")
+
+Userdata = t.MutableMapping[str, t.Any]
+"""Arbitrary JSON-like data attached to graph elements.
+
+Usually a plain `dict`, but deep copies created with `copy_on_write`
+hold a `CopyOnWriteDict` instead.
+Use `dict(userdata)` where a real `dict` is required (e.g., for `json.dumps`).
+"""
+
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+def copy_userdata(userdata: Userdata, copy_on_write: bool = False) -> Userdata:
+    """Deep copy userdata, optionally deferring the copy of nested values.
+
+    Args:
+        userdata: Userdata to copy.
+        copy_on_write: Return a `CopyOnWriteDict` instead of copying nested values eagerly.
+    """
+
+    if not userdata:
+        return {}
+
+    if copy_on_write:
+        return CopyOnWriteDict(userdata)
+
+    return copy.deepcopy(userdata)
+
+
+def userdata_to_json(
+    userdata: t.Mapping[str, t.Any], sequences: tuple[type, ...] = (list, tuple)
+) -> dict[str, t.Any]:
+    """Convert userdata to JSON as if it was stored in a protobuf `Struct`.
+
+    The result is the same as `MessageToDict` of a `Struct` filled with `userdata`:
+    Numbers are converted to floats and the keys are ordered like the protobuf map.
+
+    Args:
+        userdata: Mapping to convert.
+        sequences: Types converted to lists (`ParseDict` only accepts lists).
+
+    Raises:
+        TypeError: If a value cannot be stored in a `Struct`.
+        ValueError: If a number or string cannot be represented in JSON.
+    """
+
+    # The values are converted into new objects, so shared values need no copy
+    if isinstance(userdata, CopyOnWriteDict):
+        userdata = userdata._data
+
+    return {
+        key: _value_to_json(userdata[key], sequences)
+        for key in protobuf_map_order(_check_keys(userdata))
+    }
+
+
+def _check_keys(userdata: t.Mapping[str, t.Any]) -> t.Iterable[str]:
+    if not isinstance(userdata, dict):
+        raise TypeError(f"Unexpected userdata type '{type(userdata)}'.")
+
+    for key in userdata:
+        protobuf_string(key)
+
+    return userdata
+
+
+def _value_to_json(value: t.Any, sequences: tuple[type, ...]) -> t.Any:
+    if value is None or value is True or value is False:
+        return value
+
+    if type(value) is str:
+        return protobuf_string(value)
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        number = float(value)
+
+        if math.isinf(number) or math.isnan(number):
+            raise ValueError(f"Userdata number '{number}' cannot be converted to JSON.")
+
+        return number
+
+    if isinstance(value, dict):
+        return userdata_to_json(value, sequences)
+
+    if isinstance(value, sequences):
+        return [_value_to_json(item, sequences) for item in value]
+
+    raise TypeError(f"Unexpected userdata value type '{type(value)}'.")
+
+
+class CopyOnWriteDict(abc.MutableMapping[str, t.Any]):
+    """Userdata sharing its nested values with another dict until they are accessed.
+
+    The top-level keys are copied eagerly, which is cheap.
+    Values that may be mutable (e.g., nested dicts and lists) are deep-copied
+    the first time they are retrieved, so modifying them does not affect the original.
+    Immutable values are always shared.
+    The original must not modify nested values while they are still shared.
+
+    The mapping wraps a plain dict instead of subclassing it:
+    C fast paths like `dict(userdata)` or `{**userdata}` would otherwise
+    bypass the methods below and return the shared values.
+    For the same reason, it is not a `dict` and cannot be passed to `json.dumps` directly.
+
+    Examples:
+        >>> original = {"name": "Graph", "tags": ["a"]}
+        >>> userdata = CopyOnWriteDict(original)
+        >>> userdata["tags"].append("b")
+        >>> original["tags"], userdata["tags"]
+        (['a'], ['a', 'b'])
+        >>> dict(userdata)["tags"] is original["tags"]
+        False
+    """
+
+    __slots__ = ("_data", "_shared")
+
+    _data: dict[str, t.Any]
+    _shared: set[str]
+
+    def __init__(self, source: t.Mapping[str, t.Any]):
+        if isinstance(source, CopyOnWriteDict):
+            # Values owned by `source` may still be modified in place by it
+            self._data = {
+                key: value
+                if key in source._shared or isinstance(value, _IMMUTABLE_TYPES)
+                else copy.deepcopy(value)
+                for key, value in source._data.items()
+            }
+            self._shared = set(source._shared)
+            return
+
+        self._data = dict(source)
+        self._shared = {
+            key
+            for key, value in self._data.items()
+            if not isinstance(value, _IMMUTABLE_TYPES)
+        }
+
+    def _unshare(self, key: str) -> None:
+        if key in self._shared:
+            self._shared.discard(key)
+            self._data[key] = copy.deepcopy(self._data[key])
+
+    def __getitem__(self, key: str) -> t.Any:
+        self._unshare(key)
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: t.Any) -> None:
+        self._shared.discard(key)
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        self._shared.discard(key)
+        del self._data[key]
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CopyOnWriteDict):
+            other = other._data
+
+        return self._data == other
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return repr(self._data)
+
+    def clear(self) -> None:
+        self._shared.clear()
+        self._data.clear()
+
+    def copy(self) -> "CopyOnWriteDict":
+        return CopyOnWriteDict(self)
+
+    def __copy__(self) -> "CopyOnWriteDict":
+        return CopyOnWriteDict(self)
+
+    def __deepcopy__(self, memo: dict[int, t.Any]) -> dict[str, t.Any]:
+        return copy.deepcopy(self._data, memo)
+
+    def __reduce__(self):
+        # Pickle as a plain dict, the shared values are copied anyway
+        return dict, (self._data,)
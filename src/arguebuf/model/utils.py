@@ -1,12 +1,165 @@
+import enum
+import functools
+import gc
 import typing as t
 from collections import abc
+from contextlib import contextmanager
 from uuid import uuid1
 
+from google.protobuf import struct_pb2
+
+_T = t.TypeVar("_T")
+_U = t.TypeVar("_U")
+
 
 def uuid() -> str:
     return str(uuid1())
 
 
+@contextmanager
+def gc_paused() -> t.Iterator[None]:
+    """Pause the cyclic garbage collector while creating many long-lived objects.
+
+    Otherwise, the allocations would repeatedly trigger full collections.
+    """
+
+    enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def clone(obj: _T, **overrides: t.Any) -> _T:
+    """Create a shallow copy of a slotted object without calling its constructor.
+
+    Attributes passed as keyword arguments replace the copied values.
+    """
+
+    new = object.__new__(type(obj))
+
+    for name in _slot_names(type(obj)):
+        if name not in overrides:
+            try:
+                setattr(new, name, getattr(obj, name))
+            except AttributeError:
+                pass
+
+    if hasattr(obj, "__dict__"):
+        new.__dict__.update(obj.__dict__)
+
+    for name, value in overrides.items():
+        setattr(new, name, value)
+
+    return new
+
+
+class _Slot(enum.Enum):
+    UNSET = enum.auto()
+
+
+UNSET_SLOT = _Slot.UNSET
+"""Value stored by `reduce_slots` for slots that were never assigned."""
+
+
+def reduce_slots(obj: t.Any) -> tuple[t.Callable[..., t.Any], tuple[t.Any, ...]]:
+    """Reduce a slotted object to its class and a flat tuple of its slot values.
+
+    Compared to the default protocol, the names of the slots are not pickled.
+    Slots that were never assigned (e.g., added by a subclass) are stored as `UNSET_SLOT`.
+    The `__dict__` of subclasses without `__slots__` is stored like a slot.
+    Meant to be returned from `__reduce__`.
+    """
+
+    cls = type(obj)
+
+    return restore_slots, (
+        cls,
+        tuple(getattr(obj, name, UNSET_SLOT) for name in state_names(cls)),
+    )
+
+
+def restore_slots(cls: type[_T], values: tuple[t.Any, ...]) -> _T:
+    """Inverse of `reduce_slots`."""
+
+    obj = object.__new__(cls)
+
+    for name, value in zip(state_names(cls), values):
+        if value is not UNSET_SLOT:
+            setattr(obj, name, value)
+
+    return obj
+
+
+@functools.cache
+def state_names(cls: type) -> tuple[str, ...]:
+    """Names of the slots of `cls` followed by `__dict__` if its instances have one."""
+
+    names = _slot_names(cls)
+
+    # Subclasses without `__slots__` store their additional attributes in a dict
+    return (*names, "__dict__") if cls.__dictoffset__ else names
+
+
+@functools.cache
+def _slot_names(cls: type) -> tuple[str, ...]:
+    names: dict[str, None] = {}
+
+    for base in reversed(cls.__mro__):
+        slots = base.__dict__.get("__slots__", ())
+
+        if isinstance(slots, str):
+            slots = (slots,)
+
+        names.update(
+            (name, None) for name in slots if name not in ("__dict__", "__weakref__")
+        )
+
+    return tuple(names)
+
+
+def protobuf_map_order(keys: t.Iterable[str]) -> list[str]:
+    """Get the order in which a protobuf map iterates over `keys` inserted in the given order.
+
+    Maps of the `upb` backend iterate in the order of their hash table,
+    which `MessageToDict` and `ParseDict` expose when converting from and to JSON.
+    The order only depends on the inserted keys, so it can be reproduced
+    by inserting them (without values) into an empty map.
+    """
+
+    keys = list(keys)
+
+    if len(keys) <= 1:
+        return keys
+
+    fields = struct_pb2.Struct().fields
+
+    for key in keys:
+        fields[key]
+
+    return list(fields)
+
+
+def protobuf_string(value: t.Any) -> str:
+    """Check that `value` can be assigned to a protobuf string field and return it.
+
+    Raises:
+        TypeError: If `value` is not a string.
+        ValueError: If `value` cannot be encoded as UTF-8 (e.g., lone surrogates).
+    """
+
+    if type(value) is not str:
+        raise TypeError(f"Unexpected string value '{value!r}'.")
+
+    if not value.isascii():
+        value.encode()
+
+    return value
+
+
 def _class_name(obj) -> str:
     return obj.__class__.__name__
 
@@ -55,10 +208,6 @@ def missing_key_error(name: str, key: str) -> str:
     )
 
 
-_T = t.TypeVar("_T")
-_U = t.TypeVar("_U")
-
-
 class ImmutableList(abc.Sequence[_T]):
     """Read-only view."""
 
@@ -143,3 +292,116 @@ class ImmutableDict(t.Mapping[_T, _U]):
 
     def __str__(self) -> str:
         return self._store.__str__()
+
+
+class TupleSet(abc.Set[_T]):
+    """Read-only set backed by a tuple.
+
+    Membership is checked by a linear scan, so the items are never hashed.
+    This is cheaper than building a real set for small collections like
+    the neighbors of a node.
+    """
+
+    __slots__ = ("_store",)
+
+    _store: tuple[_T, ...]
+
+    def __init__(self, items: t.Iterable[_T] = ()):
+        self._store = tuple(items)
+
+    @classmethod
+    def _from_iterable(cls, it: t.Iterable[_T]) -> frozenset[_T]:
+        return frozenset(it)
+
+    def __len__(self) -> int:
+        return self._store.__len__()
+
+    def __contains__(self, item: object) -> bool:
+        return self._store.__contains__(item)
+
+    def __iter__(self) -> t.Iterator[_T]:
+        return self._store.__iter__()
+
+    def __repr__(self) -> str:
+        return set(self._store).__repr__()
+
+    def __str__(self) -> str:
+        return set(self._store).__str__()
+
+
+class FilteredSet(abc.Set[_T]):
+    """Read-only view containing the items of a set that satisfy a predicate.
+
+    The predicate is evaluated on access, so changes of the underlying set
+    are reflected immediately.
+    """
+
+    __slots__ = ("_predicate", "_store")
+
+    _store: t.AbstractSet[_T]
+    _predicate: t.Callable[[_T], bool]
+
+    def __init__(self, items: t.AbstractSet[_T], predicate: t.Callable[[_T], bool]):
+        self._store = items
+        self._predicate = predicate
+
+    @classmethod
+    def _from_iterable(cls, it: t.Iterable[_T]) -> frozenset[_T]:
+        return frozenset(it)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._store and self._predicate(item)  # type: ignore
+
+    def __iter__(self) -> t.Iterator[_T]:
+        return filter(self._predicate, self._store)
+
+    def __repr__(self) -> str:
+        return set(self).__repr__()
+
+    def __str__(self) -> str:
+        return set(self).__str__()
+
+
+class FilteredDict(t.Mapping[_T, _U]):
+    """Read-only view containing the items of a mapping whose value satisfies a predicate.
+
+    The predicate is evaluated on access, so changes of the underlying mapping
+    are reflected immediately.
+    """
+
+    __slots__ = ("_predicate", "_store")
+
+    _store: t.Mapping[_T, _U]
+    _predicate: t.Callable[[_U], bool]
+
+    def __init__(self, items: t.Mapping[_T, _U], predicate: t.Callable[[_U], bool]):
+        self._store = items
+        self._predicate = predicate
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __getitem__(self, key: _T) -> _U:
+        value = self._store[key]
+
+        if not self._predicate(value):
+            raise KeyError(key)
+
+        return value
+
+    def __contains__(self, key) -> bool:
+        return key in self._store and self._predicate(self._store[key])
+
+    def __iter__(self) -> t.Iterator[_T]:
+        predicate = self._predicate
+
+        return (key for key, value in self._store.items() if predicate(value))
+
+    def __repr__(self) -> str:
+        return dict(self.items()).__repr__()
+
+    def __str__(self) -> str:
+        return dict(self.items()).__str__()
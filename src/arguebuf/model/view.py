@@ -0,0 +1,227 @@
+import typing as t
+
+from arguebuf.model import utils
+from arguebuf.model.analyst import Analyst
+from arguebuf.model.edge import Edge
+from arguebuf.model.metadata import Metadata
+from arguebuf.model.node import AbstractNode, AtomNode, SchemeNode
+from arguebuf.model.participant import Participant
+from arguebuf.model.resource import Resource
+from arguebuf.model.typing import TextType
+from arguebuf.model.userdata import Userdata
+from arguebuf.model.utils import FilteredDict, FilteredSet
+
+if t.TYPE_CHECKING:
+    from arguebuf.model.graph import Graph
+
+__all__ = ("GraphView",)
+
+
+class GraphView(t.Generic[TextType]):
+    """Read-only view of the nodes of a graph that satisfy a predicate.
+
+    The view contains all edges between its nodes (i.e., it is an induced subgraph).
+    Instead of copying the graph, the indexes of the parent graph are filtered
+    on access, so changes of the parent are reflected immediately.
+    Use `Graph.subgraph` or `Graph.view` to create a view
+    and `materialize` to turn it into an independent graph.
+
+    Examples:
+        >>> from arguebuf import Graph, AtomNode, SchemeNode, Edge
+        >>> g = Graph()
+        >>> n1, n2, n3 = AtomNode("Premise"), SchemeNode(), AtomNode("Claim")
+        >>> g.add_edges([Edge(n1, n2), Edge(n2, n3)])
+        >>> view = g.subgraph([n2, n3])
+        >>> len(view.nodes), len(view.edges)
+        (2, 1)
+        >>> view.incoming_nodes(n2)
+        set()
+        >>> len(view.materialize().nodes)
+        2
+    """
+
+    __slots__ = ("_contains", "_graph")
+
+    _graph: "Graph[TextType]"
+    _contains: t.Callable[[AbstractNode], bool]
+
+    def __init__(
+        self, graph: "Graph[TextType]", contains: t.Callable[[AbstractNode], bool]
+    ):
+        """Create a view of the nodes of `graph` for which `contains` returns `True`."""
+
+        self._graph = graph
+        self._contains = contains
+
+    def __repr__(self):
+        return utils.class_repr(self, [self._graph.name])
+
+    @property
+    def graph(self) -> "Graph[TextType]":
+        """Parent graph of the view."""
+
+        return self._graph
+
+    @property
+    def name(self) -> str:
+        return self._graph.name
+
+    @property
+    def metadata(self) -> Metadata:
+        return self._graph.metadata
+
+    @property
+    def userdata(self) -> Userdata:
+        return self._graph.userdata
+
+    @property
+    def library_version(self) -> str | None:
+        return self._graph.library_version
+
+    @property
+    def schema_version(self) -> int | None:
+        return self._graph.schema_version
+
+    @property
+    def version(self) -> int:
+        """Structural version of the parent graph."""
+
+        return self._graph.version
+
+    @property
+    def resources(self) -> t.Mapping[str, Resource]:
+        return self._graph.resources
+
+    @property
+    def participants(self) -> t.Mapping[str, Participant]:
+        return self._graph.participants
+
+    @property
+    def analysts(self) -> t.Mapping[str, Analyst]:
+        return self._graph.analysts
+
+    @property
+    def nodes(self) -> t.Mapping[str, AbstractNode]:
+        return FilteredDict(self._graph.nodes, self._contains)
+
+    @property
+    def atom_nodes(self) -> t.Mapping[str, AtomNode]:
+        return FilteredDict(self._graph.atom_nodes, self._contains)
+
+    @property
+    def scheme_nodes(self) -> t.Mapping[str, SchemeNode]:
+        return FilteredDict(self._graph.scheme_nodes, self._contains)
+
+    @property
+    def edges(self) -> t.Mapping[str, Edge]:
+        return FilteredDict(self._graph.edges, self._contains_edge)
+
+    @property
+    def major_claim(self) -> AtomNode | None:
+        major_claim = self._graph.major_claim
+
+        if major_claim is not None and self._contains(major_claim):
+            return major_claim
+
+        return None
+
+    @property
+    def root_node(self) -> AtomNode | None:
+        """If there is a single node with no outgoing edges, return it, otherwise None"""
+        candidates = self.root_nodes
+
+        if len(candidates) == 1:
+            return next(iter(candidates))
+
+        return None
+
+    @property
+    def root_nodes(self) -> t.AbstractSet[AtomNode]:
+        """Find all nodes with no outgoing edges"""
+        return frozenset(
+            node
+            for node in self.atom_nodes.values()
+            if len(self.outgoing_nodes(node)) == 0
+        )
+
+    @property
+    def leaf_nodes(self) -> t.AbstractSet[AtomNode]:
+        """Find all nodes with no incoming edges"""
+        return frozenset(
+            node
+            for node in self.atom_nodes.values()
+            if len(self.incoming_nodes(node)) == 0
+        )
+
+    def incoming_nodes(self, node: str | AbstractNode) -> t.AbstractSet[AbstractNode]:
+        return FilteredSet(self._graph.incoming_nodes(self._node(node)), self._contains)
+
+    def outgoing_nodes(self, node: str | AbstractNode) -> t.AbstractSet[AbstractNode]:
+        return FilteredSet(self._graph.outgoing_nodes(self._node(node)), self._contains)
+
+    def incoming_edges(self, node: str | AbstractNode) -> t.AbstractSet[Edge]:
+        return FilteredSet(
+            self._graph.incoming_edges(self._node(node)),
+            lambda edge: self._contains(edge.source),
+        )
+
+    def outgoing_edges(self, node: str | AbstractNode) -> t.AbstractSet[Edge]:
+        return FilteredSet(
+            self._graph.outgoing_edges(self._node(node)),
+            lambda edge: self._contains(edge.target),
+        )
+
+    def incoming_atom_nodes(self, node: str | AbstractNode) -> t.AbstractSet[AtomNode]:
+        """Find the nearest atom nodes of the view reachable via incoming edges."""
+
+        return self._graph._atom_neighbors(self._node(node), self.incoming_nodes)
+
+    def outgoing_atom_nodes(self, node: str | AbstractNode) -> t.AbstractSet[AtomNode]:
+        """Find the nearest atom nodes of the view reachable via outgoing edges."""
+
+        return self._graph._atom_neighbors(self._node(node), self.outgoing_nodes)
+
+    def subgraph(self, nodes: t.Iterable[str | AbstractNode]) -> "GraphView[TextType]":
+        """Create a view of the given nodes that are also part of this view."""
+
+        return self._graph.subgraph(
+            node for node in map(self._graph._node, nodes) if self._contains(node)
+        )
+
+    def view(
+        self, predicate: t.Callable[[AbstractNode], bool]
+    ) -> "GraphView[TextType]":
+        """Create a view of the nodes of this view that satisfy `predicate`."""
+
+        contains = self._contains
+
+        return GraphView(self._graph, lambda node: contains(node) and predicate(node))
+
+    def materialize(self) -> "Graph[TextType]":
+        """Create a graph of the same class as the parent containing the nodes and edges of this view.
+
+        The new graph can be modified independently of the parent,
+        but shares the node and edge objects with it.
+        """
+
+        g = self._graph._derive()
+        g.add_nodes(self.nodes.values())
+        g.add_edges(self.edges.values())
+
+        major_claim = self.major_claim
+
+        if major_claim is not None:
+            g.major_claim = major_claim
+
+        return g
+
+    def _node(self, node: str | AbstractNode) -> AbstractNode:
+        node = self._graph._node(node)
+
+        if not self._contains(node):
+            raise KeyError(node.id)
+
+        return node
+
+    def _contains_edge(self, edge: Edge) -> bool:
+        return self._contains(edge.source) and self._contains(edge.target)
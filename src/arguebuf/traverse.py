@@ -1,53 +1,130 @@
 import typing as t
+from collections import deque
 
-from arguebuf.model import AbstractNode, NodeType
+from arguebuf.model.node import AbstractNode, NodeType
 
-__all__ = ("dfs", "bfs", "node_distance")
+__all__ = ("bfs", "dfs", "iter_bfs", "iter_dfs", "node_distance")
 
 
-# https://eddmann.com/posts/depth-first-search-and-breadth-first-search-in-python/
-def dfs(
+def iter_dfs(
     start: NodeType,
-    connections: t.Callable[[AbstractNode], t.AbstractSet[NodeType]],
+    connections: t.Callable[[NodeType], t.Iterable[NodeType]],
     include_start: bool = True,
-) -> list[NodeType]:
-    # Need to use a dict since a set does not preserve order
-    visited: dict[NodeType, None] = {}
-    stack: list[NodeType] = [start]
+    max_depth: int | None = None,
+) -> t.Iterator[NodeType]:
+    """Lazily visit all nodes reachable from `start` in depth-first order.
+
+    Every node is yielded once, so the traversal can be stopped early
+    (e.g., by breaking out of a loop) without visiting the remaining nodes.
+
+    Args:
+        start: Node to start the traversal from.
+        connections: Callable returning the neighbors of a node
+            (e.g., `graph.outgoing_nodes`).
+        include_start: Whether to yield `start` itself.
+        max_depth: Do not visit nodes that are more than this number of steps
+            away from `start` (along the path taken by the traversal).
+
+    Examples:
+        >>> from arguebuf import Graph, AtomNode, SchemeNode, Edge
+        >>> g = Graph()
+        >>> n1, n2, n3 = AtomNode("Premise"), SchemeNode(), AtomNode("Claim")
+        >>> g.add_edges([Edge(n1, n2), Edge(n2, n3)])
+        >>> list(iter_dfs(n1, g.outgoing_nodes)) == [n1, n2, n3]
+        True
+        >>> list(iter_dfs(n1, g.outgoing_nodes, max_depth=1)) == [n1, n2]
+        True
+    """
+
+    visited: set[NodeType] = set()
+    stack: list[tuple[NodeType, int]] = [(start, 0)]
 
     while stack:
-        node = stack.pop()
+        node, depth = stack.pop()
+
+        if node in visited:
+            continue
 
-        if node not in visited:
-            visited[node] = None
-            stack.extend(set(connections(node)) - visited.keys())
+        visited.add(node)
 
-    if include_start:
-        return list(visited.keys())
+        if include_start or node is not start:
+            yield node
 
-    return [node for node in visited if node != start]
+        if max_depth is None or depth < max_depth:
+            stack.extend(
+                (neighbor, depth + 1)
+                for neighbor in connections(node)
+                if neighbor not in visited
+            )
 
 
-def bfs(
+def iter_bfs(
     start: NodeType,
-    connections: t.Callable[[AbstractNode], t.AbstractSet[NodeType]],
+    connections: t.Callable[[NodeType], t.Iterable[NodeType]],
     include_start: bool = True,
-) -> list[NodeType]:
-    # Need to use a dict since a set does not preserve order
-    visited: dict[NodeType, None] = {}
-    queue: list[NodeType] = [start]
+    max_depth: int | None = None,
+) -> t.Iterator[NodeType]:
+    """Lazily visit all nodes reachable from `start` in breadth-first order.
+
+    Nodes are yielded in order of their (shortest) distance to `start`,
+    so the traversal can be stopped early without visiting the remaining nodes.
+
+    Args:
+        start: Node to start the traversal from.
+        connections: Callable returning the neighbors of a node
+            (e.g., `graph.outgoing_nodes`).
+        include_start: Whether to yield `start` itself.
+        max_depth: Do not visit nodes that are more than this number of steps
+            away from `start`.
+
+    Examples:
+        >>> from arguebuf import Graph, AtomNode, SchemeNode, Edge
+        >>> g = Graph()
+        >>> n1, n2, n3 = AtomNode("Premise"), SchemeNode(), AtomNode("Claim")
+        >>> g.add_edges([Edge(n1, n2), Edge(n2, n3)])
+        >>> list(iter_bfs(n3, g.incoming_nodes, include_start=False)) == [n2, n1]
+        True
+    """
+
+    for node, _ in _iter_bfs_depths(start, connections, max_depth):
+        if include_start or node is not start:
+            yield node
+
+
+def _iter_bfs_depths(
+    start: NodeType,
+    connections: t.Callable[[NodeType], t.Iterable[NodeType]],
+    max_depth: int | None = None,
+) -> t.Iterator[tuple[NodeType, int]]:
+    # Nodes are marked as visited when enqueued, so each node is enqueued once
+    visited: set[NodeType] = {start}
+    queue: deque[tuple[NodeType, int]] = deque([(start, 0)])
 
     while queue:
-        node = queue.pop(0)
+        node, depth = queue.popleft()
+        yield node, depth
+
+        if max_depth is None or depth < max_depth:
+            for neighbor in connections(node):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append((neighbor, depth + 1))
 
-        if node not in visited:
-            visited[node] = None
-            queue.extend(set(connections(node)) - visited.keys())
 
-    if include_start:
-        return list(visited.keys())
+def dfs(
+    start: NodeType,
+    connections: t.Callable[[NodeType], t.Iterable[NodeType]],
+    include_start: bool = True,
+) -> list[NodeType]:
+    return list(iter_dfs(start, connections, include_start))
+
 
-    return [node for node in visited if node != start]
+def bfs(
+    start: NodeType,
+    connections: t.Callable[[NodeType], t.Iterable[NodeType]],
+    include_start: bool = True,
+) -> list[NodeType]:
+    return list(iter_bfs(start, connections, include_start))
 
 
 def node_distance(
@@ -57,7 +134,7 @@ def node_distance(
     max_distance: int | None = None,
     directed: bool = True,
 ) -> int | None:
-    """Get the distance between `start_node` and `end_node` in the graph.
+    """Get the length of the shortest path between `start_node` and `end_node`.
 
     Args:
         start_node: Node object that is part of the graph.
@@ -67,6 +144,7 @@ def node_distance(
         max_distance: Only search for nodes having at most a distance of this argument.
             Especially helpful when dealing with large graphs where shorts paths are searched for.
         directed: If `False`, also search for the direction `end_node` -> `start_node`.
+            Both directions are searched simultaneously and the shorter distance is returned.
 
     Returns:
         Number of nodes in between or `None` if no path between
@@ -90,17 +168,17 @@ def node_distance(
         >>> node_distance(n1, n3, g.outgoing_nodes)
         2
         >>> node_distance(n3, n1, g.outgoing_nodes)
+        >>> node_distance(n3, n1, g.outgoing_nodes, directed=False)
+        2
     """
 
     if start_node == end_node:
         return 0
 
-    dist = _directed_node_distance(start_node, end_node, connections, max_distance)
-
-    if dist is None and not directed:
-        dist = _directed_node_distance(end_node, start_node, connections, max_distance)
+    if directed:
+        return _directed_node_distance(start_node, end_node, connections, max_distance)
 
-    return dist
+    return _bidirectional_node_distance(start_node, end_node, connections, max_distance)
 
 
 def _directed_node_distance(
@@ -109,18 +187,70 @@ def _directed_node_distance(
     connections: t.Callable[[AbstractNode], t.Iterable[AbstractNode]],
     max_distance: int | None = None,
 ) -> int | None:
-    expansion: list[tuple[AbstractNode, int]] = [
-        (n, 1) for n in connections(start_node)
+    for node, distance in _iter_bfs_depths(start_node, connections, max_distance):
+        if node == end_node:
+            return distance
+
+    return None
+
+
+def _bidirectional_node_distance(
+    start_node: AbstractNode,
+    end_node: AbstractNode,
+    connections: t.Callable[[AbstractNode], t.Iterable[AbstractNode]],
+    max_distance: int | None = None,
+) -> int | None:
+    # Expand both searches one level at a time,
+    # so the cost is bounded by the shorter of the two directions.
+    searches = [
+        _BfsFrontier(start_node, end_node, connections),
+        _BfsFrontier(end_node, start_node, connections),
     ]
+    distance = 0
 
-    while len(expansion) > 0:
-        candidate, distance = expansion.pop()
+    while searches and (max_distance is None or distance < max_distance):
+        distance += 1
 
-        if max_distance is not None and distance > max_distance:
-            continue
-        elif candidate == end_node:
-            return distance
-        else:
-            expansion.extend((n, distance + 1) for n in connections(candidate))
+        for search in searches:
+            if search.expand():
+                return distance
+
+        searches = [search for search in searches if search.frontier]
 
     return None
+
+
+class _BfsFrontier:
+    """State of a breadth-first search that is expanded one level at a time."""
+
+    __slots__ = ("connections", "frontier", "target", "visited")
+
+    def __init__(
+        self,
+        start: AbstractNode,
+        target: AbstractNode,
+        connections: t.Callable[[AbstractNode], t.Iterable[AbstractNode]],
+    ) -> None:
+        self.target = target
+        self.connections = connections
+        self.visited = {start}
+        self.frontier = [start]
+
+    def expand(self) -> bool:
+        """Visit the next level and return whether the target has been found."""
+
+        visited = self.visited
+        frontier: list[AbstractNode] = []
+
+        for node in self.frontier:
+            for neighbor in self.connections(node):
+                if neighbor == self.target:
+                    return True
+
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    frontier.append(neighbor)
+
+        self.frontier = frontier
+
+        return False
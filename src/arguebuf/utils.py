@@ -1,10 +1,25 @@
 from arguebuf.dump import protobuf as dump_protobuf
 from arguebuf.load import protobuf as load_protobuf
-from arguebuf.load._config import Config, DefaultConfig
+from arguebuf.load._config import Config
 from arguebuf.model import Graph
 
 
-def copy(obj: Graph, config: Config = DefaultConfig) -> Graph:
-    """Contents of Graph instance are copied into new Graph object."""
+def copy(
+    obj: Graph,
+    config: Config | None = None,
+    deep: bool = True,
+    copy_on_write: bool = False,
+) -> Graph:
+    """Contents of Graph instance are copied into new Graph object.
 
-    return load_protobuf(dump_protobuf(obj), obj.name, config)
+    By default, the graph is copied natively via `Graph.copy`,
+    keeping the classes of all elements and sharing their (parsed) texts.
+    If a `config` is passed, the graph is converted via protobuf instead,
+    so the elements are created with the classes of `config`
+    and all texts are parsed again with `config.nlp`.
+    """
+
+    if config is not None:
+        return load_protobuf(dump_protobuf(obj), obj.name, config)
+
+    return obj.copy(deep, copy_on_write)
@@ -0,0 +1,26 @@
+from pathlib import Path
+
+import pytest
+
+import arguebuf as ag
+
+
+@pytest.fixture
+def casebase(tmp_path: Path) -> Path:
+    for name, lang in (("first", "en"), ("second", "de")):
+        folder = tmp_path / name / f"format=arguebuf,lang={lang}"
+        folder.mkdir(parents=True)
+
+        for i in range(4):
+            g = ag.Graph(f"{name}-{i}")
+            g.add_edges(
+                [
+                    ag.Edge(ag.AtomNode(f"premise {i}"), scheme := ag.SchemeNode()),
+                    ag.Edge(scheme, ag.AtomNode(f"claim {i}")),
+                ]
+            )
+            ag.dump.file(g, folder / f"{i}.json")
+
+    (tmp_path / "first" / "format=arguebuf,lang=en" / "broken.json").write_text("{")
+
+    return tmp_path
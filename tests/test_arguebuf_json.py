@@ -0,0 +1,275 @@
+import json
+import math
+import random
+import typing as t
+
+import pendulum
+import pytest
+from arg_services.graph.v1 import graph_pb2
+from google.protobuf.json_format import (
+    MessageToDict,
+    ParseDict,
+    ParseError,
+    SerializeToJsonError,
+)
+
+import arguebuf as ag
+from arguebuf import dt
+from arguebuf.dt import FormattedTimestamp
+from arguebuf.dump import _dump_arguebuf
+from arguebuf.load import _load_arguebuf
+
+
+def _random_graph(seed: int) -> ag.Graph:
+    rng = random.Random(seed)
+    g = ag.Graph(f"graph-{seed}")
+
+    timestamps: list[t.Any] = [
+        0,
+        1_700_000_000_123_456_789,
+        1_700_000_000_000_000_000,
+        -1_000_000_001,
+        1_700_000_000.25,
+        1_700_000_000.123456,
+        pendulum.datetime(2020, 2, 29, 12, 30, 15, 250000),
+        FormattedTimestamp("2021/03/04 05:06:07", "YYYY/MM/DD HH:mm:ss"),
+    ]
+    userdata: list[dict[str, t.Any]] = [
+        {},
+        {"a": 1, "b": "text", "c": None, "d": True, "e": 2.5},
+        {"nested": {"list": [1, "x", None, False, {"deep": [], "z": {}}]}},
+        {f"key{i}": i for i in range(20)},
+        {"unicode": "Ärger über Öl", "": ""},
+    ]
+
+    def metadata() -> ag.Metadata:
+        return ag.Metadata(rng.choice(timestamps), rng.choice(timestamps))
+
+    resources = [
+        ag.Resource(
+            "Resource text",
+            "Title",
+            "Source",
+            pendulum.datetime(2022, 1, 1, 8, 0, 0, 123000),
+            metadata(),
+            rng.choice(userdata),
+        ),
+        ag.Resource("", metadata=metadata(), _id="empty-resource"),
+    ]
+    participants = [
+        ag.Participant(
+            "Name",
+            "username",
+            "mail@example.com",
+            "https://example.com",
+            "Location",
+            "Description",
+            metadata(),
+            rng.choice(userdata),
+        ),
+        ag.Participant(metadata=metadata(), id="empty-participant"),
+    ]
+    analysts = [
+        ag.Analyst("Analyst", "analyst@example.com", rng.choice(userdata)),
+        ag.Analyst(id="empty-analyst"),
+    ]
+
+    for resource in resources:
+        g.add_resource(resource)
+
+    for participant in participants:
+        g.add_participant(participant)
+
+    for analyst in analysts:
+        g.add_analyst(analyst)
+
+    schemes = [
+        None,
+        *ag.Support,
+        ag.Attack.DEFAULT,
+        ag.Preference.DEFAULT,
+        ag.Rephrase.DEFAULT,
+    ]
+    references = [
+        None,
+        ag.Reference(resources[0], 0, "Reference"),
+        ag.Reference(resources[0], 42, "Reference with offset"),
+        ag.Reference(None, None, "Reference without resource"),
+    ]
+    atoms: list[ag.AtomNode] = []
+
+    for i in range(rng.randint(1, 50)):
+        atom = ag.AtomNode(
+            rng.choice(["", "Claim", f"Premise {i}", "Ünïcödé 🙂"]),
+            rng.choice(references),
+            rng.choice([None, *participants]),
+            metadata(),
+            rng.choice(userdata),
+        )
+        atoms.append(atom)
+        g.add_node(atom)
+
+    for _ in range(rng.randint(0, 50)):
+        scheme = ag.SchemeNode(
+            rng.choice(schemes),
+            rng.choice([[], ["first", "second"]]),
+            metadata(),
+            rng.choice(userdata),
+        )
+        g.add_edge(ag.Edge(rng.choice(atoms), scheme, metadata(), rng.choice(userdata)))
+        g.add_edge(ag.Edge(scheme, rng.choice(atoms), metadata()))
+
+    g.major_claim = rng.choice(atoms)
+    g.userdata = rng.choice(userdata)
+    g.metadata = metadata()
+
+    return g
+
+
+def _protobuf_dict(g: ag.Graph) -> dict[str, t.Any]:
+    return MessageToDict(ag.dump.protobuf(g))
+
+
+def _resource_id(reference: ag.Reference) -> str | None:
+    return reference.resource.id if reference.resource else None
+
+
+def _assert_equal_graphs(actual: ag.Graph, expected: ag.Graph) -> None:
+    assert json.dumps(_protobuf_dict(actual)) == json.dumps(_protobuf_dict(expected))
+
+    for attr in ("nodes", "edges", "resources", "participants", "analysts"):
+        assert list(getattr(actual, attr)) == list(getattr(expected, attr))
+
+    elements = [
+        (actual, expected),
+        *zip(actual.nodes.values(), expected.nodes.values()),
+        *zip(actual.edges.values(), expected.edges.values()),
+        *zip(actual.resources.values(), expected.resources.values()),
+        *zip(actual.participants.values(), expected.participants.values()),
+    ]
+
+    for actual_element, expected_element in elements:
+        assert actual_element.metadata._created == expected_element.metadata._created
+        assert actual_element.metadata._updated == expected_element.metadata._updated
+        assert list(actual_element.userdata.items()) == list(
+            expected_element.userdata.items()
+        )
+
+    for actual_node, expected_node in zip(
+        actual.atom_nodes.values(), expected.atom_nodes.values()
+    ):
+        actual_reference = actual_node.reference
+        expected_reference = expected_node.reference
+
+        if expected_reference is None:
+            assert actual_reference is None
+        else:
+            assert actual_reference is not None
+            assert _resource_id(actual_reference) == _resource_id(expected_reference)
+            assert actual_reference.offset == expected_reference.offset
+            assert actual_reference.text == expected_reference.text
+
+    for actual_resource, expected_resource in zip(
+        actual.resources.values(), expected.resources.values()
+    ):
+        assert actual_resource.timestamp == expected_resource.timestamp
+
+    assert actual.major_claim == expected.major_claim
+    assert actual.library_version == expected.library_version
+    assert actual.schema_version == expected.schema_version
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_dump_arguebuf_conformance(seed: int):
+    g = _random_graph(seed)
+
+    # The graph must not require the fallback to protobuf
+    assert json.dumps(_dump_arguebuf._graph(g)) == json.dumps(_protobuf_dict(g))
+    assert ag.dump.dict(g) == _protobuf_dict(g)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_load_arguebuf_conformance(seed: int):
+    obj = _protobuf_dict(_random_graph(seed))
+
+    # The object must not require the fallback to protobuf
+    _load_arguebuf._graph(obj)
+
+    _assert_equal_graphs(
+        ag.load.dict(obj, "graph"),
+        ag.load.protobuf(ParseDict(obj, graph_pb2.Graph()), "graph"),
+    )
+
+
+def test_arguebuf_fields():
+    messages = {
+        graph_pb2.Graph: _load_arguebuf._GRAPH_FIELDS,
+        graph_pb2.Node: _load_arguebuf._NODE_FIELDS,
+        graph_pb2.Atom: _load_arguebuf._ATOM_FIELDS,
+        graph_pb2.Scheme: _load_arguebuf._SCHEME_FIELDS,
+        graph_pb2.Edge: _load_arguebuf._EDGE_FIELDS,
+        graph_pb2.Metadata: _load_arguebuf._METADATA_FIELDS,
+        graph_pb2.Reference: _load_arguebuf._REFERENCE_FIELDS,
+        graph_pb2.Resource: _load_arguebuf._RESOURCE_FIELDS,
+        graph_pb2.Participant: _load_arguebuf._PARTICIPANT_FIELDS,
+        graph_pb2.Analyst: _load_arguebuf._ANALYST_FIELDS,
+    }
+
+    for message, fields in messages.items():
+        assert fields == {field.json_name for field in message.DESCRIPTOR.fields}
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"major_claim": "", "schema_version": 1},
+        {"nodes": {"a": {"atom": None, "metadata": {}}}},
+        {"nodes": {"a": {"scheme": {"support": 3}}}},
+        {"nodes": {"a": {"atom": {"text": "A", "reference": {"text": "R"}}}}},
+        {"nodes": {"a": {"atom": {"reference": {"text": "R", "offset": "5"}}}}},
+        {"metadata": {"created": "2020-01-01T01:00:00+01:00"}},
+        {"schemaVersion": "1", "libraryVersion": "1.0.0"},
+        {"userdata": {"tuple": [1, 2], "number": 10**20}},
+    ],
+)
+def test_load_arguebuf_fallback(obj: dict[str, t.Any]):
+    _assert_equal_graphs(
+        ag.load.dict(obj), ag.load.protobuf(ParseDict(obj, graph_pb2.Graph()))
+    )
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"unknown": 1},
+        {"nodes": {"a": {"atom": {}, "scheme": {}}}},
+        {"nodes": {"a": {"scheme": {"support": "SUPPORT_UNKNOWN"}}}},
+        {"nodes": {"a": {"atom": {"text": "\ud800"}}}},
+        {"metadata": {"created": "invalid"}},
+        {"schemaVersion": True},
+        {"userdata": []},
+    ],
+)
+def test_load_arguebuf_errors(obj: dict[str, t.Any]):
+    with pytest.raises(ParseError):
+        ag.load.dict(obj)
+
+
+def test_dump_arguebuf_errors():
+    g = ag.Graph()
+    g.add_node(ag.AtomNode("Claim", userdata={"number": math.inf}))
+
+    with pytest.raises(SerializeToJsonError):
+        ag.dump.dict(g)
+
+    g = ag.Graph()
+    g.add_node(ag.AtomNode("\ud800"))
+
+    with pytest.raises(UnicodeEncodeError):
+        ag.dump.dict(g)
+
+
+def test_timestamp_to_json():
+    # Integers are nanoseconds and floats are seconds, even if they compare equal
+    assert dt.to_json(1) == "1970-01-01T00:00:00.000000001Z"
+    assert dt.to_json(1.0) == "1970-01-01T00:00:01Z"
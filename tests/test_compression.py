@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import pytest
+
+import arguebuf as ag
+from arguebuf import _compression
+
+
+@pytest.mark.parametrize("compression", list(_compression.Compression))
+@pytest.mark.parametrize("suffix", [".json", ".pb"])
+def test_load_compressed(
+    casebase: Path, tmp_path: Path, compression: _compression.Compression, suffix: str
+):
+    if (
+        compression == _compression.Compression.ZSTD
+        and _compression.zstd is None
+        and _compression.zstandard is None
+    ):
+        pytest.skip("Zstandard is not available.")
+
+    folder = casebase / "first" / "format=arguebuf,lang=en"
+    g = ag.load.file(folder / "0.json")
+    file = folder / f"0{suffix}{compression.value}"
+
+    ag.dump.file(g, file)
+    (folder / "0.json").unlink()
+    (folder / "0.txt").write_text("Resource")
+    loaded = ag.load.file(file, text_file=False)
+
+    assert _compression.detect(file.read_bytes()) == compression
+    assert loaded.name == "0"
+    assert ag.dump.dict(loaded) == ag.dump.dict(g)
+    assert len(ag.load.file(file).resources) == 1
+
+    with file.open("rb") as fp:
+        assert ag.dump.dict(
+            ag.load.io(fp, f"{suffix}{compression.value}")
+        ) == ag.dump.dict(g)
+
+    # The compression is detected by the magic bytes as well
+    file.rename(tmp_path / f"graph{suffix}")
+    assert ag.dump.dict(ag.load.file(tmp_path / f"graph{suffix}")) == ag.dump.dict(g)
+    file = tmp_path / f"graph{suffix}"
+
+    if suffix == ".json":
+        file.rename(folder / f"0.json{compression.value}")
+        graphs = ag.load.casebase(
+            ag.load.CasebaseFilter(".*", format="arguebuf"),
+            basepath=casebase,
+            on_error=lambda *_: None,
+        )
+
+        assert folder / f"0.json{compression.value}" in graphs
+        assert len(graphs) == 8
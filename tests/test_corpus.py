@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import pendulum
+import pytest
+
+import arguebuf as ag
+
+
+def test_corpus(casebase: Path, tmp_path: Path):
+    folder = casebase / "first" / "format=arguebuf,lang=en"
+    graphs = ag.load.folder(folder, "[0-9].json")
+    resource = ag.Resource(
+        "Shared text", "Title", timestamp=pendulum.datetime(2020, 1, 1)
+    )
+    participant = ag.Participant("Name", "username")
+
+    for graph in graphs.values():
+        graph.add_resource(resource)
+        graph.add_participant(participant)
+
+        for node in graph.scheme_nodes.values():
+            node.premise_descriptors = list(graph.atom_nodes)[:1]
+
+    file = tmp_path / "corpus.agc"
+
+    with ag.dump.CorpusWriter(file) as writer:
+        for path, graph in graphs.items():
+            writer.add(graph, path.relative_to(casebase).with_suffix("").as_posix())
+
+        with pytest.raises(ValueError):
+            writer.add(graph, "first/format=arguebuf,lang=en/0")
+
+    with ag.load.Corpus(file) as corpus:
+        assert list(corpus) == [
+            f"first/format=arguebuf,lang=en/{i}" for i in range(len(graphs))
+        ]
+        # The strings of the resource are stored only once
+        assert file.read_bytes().count(b"Shared text") == 1
+
+        for path, graph in graphs.items():
+            name = path.relative_to(casebase).with_suffix("").as_posix()
+            loaded = corpus[name]
+
+            assert loaded.name == graph.name
+            assert ag.dump.dict(loaded) == ag.dump.dict(graph)
+            assert corpus.protobuf(name) == ag.dump.protobuf(graph)
+
+        assert "missing" not in corpus
+
+        with pytest.raises(KeyError):
+            corpus["missing"]
+
+    assert ag.load.corpus(file).keys() == corpus.keys()
+
+    (tmp_path / "invalid.agc").write_bytes(b"{}")
+
+    with pytest.raises(ValueError):
+        ag.load.Corpus(tmp_path / "invalid.agc")
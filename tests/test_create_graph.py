@@ -1,3 +1,10 @@
+import copy
+import json
+import os
+import pickle
+import random
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -5,9 +12,11 @@ from arg_services.graph.v1 import graph_pb2
 
 import arguebuf as ag
 
+graph_classes = pytest.mark.parametrize("graph_class", [ag.Graph, ag.CompactGraph])
 
-def generate_graph() -> ag.Graph:
-    g = ag.Graph()
+
+def generate_graph(graph_class: type[ag.Graph] = ag.Graph) -> ag.Graph:
+    g = graph_class()
     a1 = ag.AtomNode("", id="a1")
     a2 = ag.AtomNode("", id="a2")
     a3 = ag.AtomNode("", id="a3")
@@ -24,8 +33,9 @@ def generate_graph() -> ag.Graph:
     return g
 
 
-def test_strip_scheme_nodes():
-    g = generate_graph()
+@graph_classes
+def test_strip_scheme_nodes(graph_class: type[ag.Graph]):
+    g = generate_graph(graph_class)
     g.strip_scheme_nodes()
 
     assert len(g.nodes) == 4
@@ -33,16 +43,122 @@ def test_strip_scheme_nodes():
     assert len(g.edges) == 3
 
 
-def test_remove_branch():
-    g = generate_graph()
+@graph_classes
+def test_remove_branch(graph_class: type[ag.Graph]):
+    g = generate_graph(graph_class)
     g.remove_branch("s2")
 
     assert len(g.nodes) == 1
     assert len(g.edges) == 0
 
 
-def test_sibling_nodes():
-    g = ag.Graph()
+@graph_classes
+def test_atom_projection(graph_class: type[ag.Graph]):
+    g = generate_graph(graph_class)
+    g.add_edge(ag.Edge(g.atom_nodes["a2"], g.atom_nodes["a1"], id="direct"))
+    projection = g.atom_projection()
+
+    assert type(projection) is graph_class
+    assert len(g.nodes) == 6
+    assert len(g.edges) == 6
+
+    stripped = generate_graph(graph_class)
+    stripped.add_edge(ag.Edge(g.atom_nodes["a2"], g.atom_nodes["a1"], id="direct"))
+    stripped.strip_scheme_nodes()
+
+    assert projection.nodes.keys() == stripped.nodes.keys()
+    assert "direct" in projection.edges
+    assert {(e.source.id, e.target.id) for e in projection.edges.values()} == {
+        (e.source.id, e.target.id) for e in stripped.edges.values()
+    }
+
+    # Atoms connected directly and through schemes keep only the direct edge
+    g.add_edge(ag.Edge(g.atom_nodes["a2"], g.atom_nodes["a4"], id="shortcut"))
+    projection = g.atom_projection()
+
+    assert [
+        edge.id
+        for edge in projection.edges.values()
+        if (edge.source.id, edge.target.id) == ("a2", "a4")
+    ] == ["shortcut"]
+
+    # Cycles of scheme nodes are resolved without the single-pass search
+    g.add_edge(ag.Edge(g.scheme_nodes["s2"], g.scheme_nodes["s1"]))
+    g.add_edge(ag.Edge(g.scheme_nodes["s1"], g.atom_nodes["a3"]))
+    projection = g.atom_projection()
+
+    for atom in g.atom_nodes.values():
+        assert projection.outgoing_nodes(atom) == g.outgoing_atom_nodes(atom)
+        assert len(projection.outgoing_edges(atom)) == len(g.outgoing_atom_nodes(atom))
+
+
+@graph_classes
+def test_graph_view(graph_class: type[ag.Graph]):
+    g = generate_graph(graph_class)
+    g.major_claim = "a4"
+    view = g.subgraph(["a3", "s2", g.atom_nodes["a4"]])
+
+    assert view.nodes.keys() == {"a3", "s2", "a4"}
+    assert view.atom_nodes.keys() == {"a3", "a4"}
+    assert {(e.source.id, e.target.id) for e in view.edges.values()} == {
+        ("a3", "s2"),
+        ("s2", "a4"),
+    }
+    assert view.incoming_nodes("s2") == {g.nodes["a3"]}
+    assert len(view.incoming_edges("s2")) == 1
+    assert view.outgoing_atom_nodes("a3") == {g.nodes["a4"]}
+    assert view.root_node == view.major_claim == g.nodes["a4"]
+    assert "s1" not in view.nodes
+
+    with pytest.raises(KeyError):
+        view.incoming_nodes("s1")
+
+    # Views reflect changes of the parent graph
+    g.add_edge(ag.Edge(g.nodes["a3"], g.nodes["a4"], id="direct"))
+    assert "direct" in view.edges
+
+    schemes = g.view(lambda node: isinstance(node, ag.SchemeNode))
+    assert schemes.nodes.keys() == {"s1", "s2"}
+    assert len(schemes.edges) == 1
+    assert schemes.view(lambda node: node.id == "s1").nodes.keys() == {"s1"}
+    assert view.subgraph(["s1", "s2"]).nodes.keys() == {"s2"}
+
+    materialized = view.materialize()
+
+    assert type(materialized) is graph_class
+    assert materialized.nodes.keys() == view.nodes.keys()
+    assert materialized.edges.keys() == view.edges.keys()
+    assert materialized.major_claim == g.major_claim
+
+    materialized.remove_node(materialized.nodes["a3"])
+    assert len(g.nodes) == 6
+
+
+@graph_classes
+def test_remove_deep_branch(graph_class: type[ag.Graph]):
+    size = 20_000
+    atoms = [ag.AtomNode("", id=f"a{i}") for i in range(size)]
+    schemes = [ag.SchemeNode(id=f"s{i}") for i in range(size - 1)]
+
+    g = graph_class()
+    g.add_edges(
+        edge
+        for i, scheme in enumerate(schemes)
+        for edge in (ag.Edge(atoms[i + 1], scheme), ag.Edge(scheme, atoms[i]))
+    )
+
+    projection = g.atom_projection()
+    assert len(projection.edges) == size - 1
+
+    g.remove_branch("a1")
+
+    assert g.nodes.keys() == {"a0", "s0"}
+    assert len(g.edges) == 1
+
+
+@graph_classes
+def test_sibling_nodes(graph_class: type[ag.Graph]):
+    g = graph_class()
 
     a1 = ag.AtomNode("", id="a1")
     a2 = ag.AtomNode("", id="a2")
@@ -74,8 +190,9 @@ def test_sibling_nodes():
     assert siblings[a6] == 4
 
 
-def test_create_graph(tmp_path: Path):
-    g = ag.Graph("Test")
+@graph_classes
+def test_create_graph(tmp_path: Path, graph_class: type[ag.Graph]):
+    g = graph_class("Test")
 
     p1 = ag.Participant(
         name="Participant 1",
@@ -201,8 +318,421 @@ def test_create_graph(tmp_path: Path):
 
     assert isinstance(ag.dump.protobuf(g), graph_pb2.Graph)
 
-    gc = ag.copy(g)
+    gc = ag.copy(g, ag.load.Config(GraphClass=graph_class))
 
     assert len(g.nodes) == len(gc.nodes)
 
     ag.render.graphviz(ag.dump.graphviz(g), tmp_path / "test.pdf")
+
+
+@graph_classes
+def test_graph_copy(graph_class: type[ag.Graph]):
+    g = generate_graph(graph_class)
+    participant = ag.Participant("Participant")
+    resource = ag.Resource("Resource")
+    atom = ag.AtomNode(
+        "Text",
+        reference=ag.Reference(resource, 0, "Resource"),
+        participant=participant,
+        userdata={"tags": ["a"]},
+        id="a5",
+    )
+    g.add_edge(ag.Edge(atom, g.scheme_nodes["s2"]))
+    g.add_analyst(ag.Analyst("Analyst"))
+    g.major_claim = "a4"
+    g.userdata = {"nested": {"key": "value"}}
+
+    expected = ag.dump.protobuf(g)
+
+    for deep, copy_on_write in ((True, False), (True, True), (False, False)):
+        gc = ag.copy(g, deep=deep, copy_on_write=copy_on_write)
+
+        assert type(gc) is graph_class
+        assert ag.dump.protobuf(gc) == expected
+        assert gc.nodes.keys() == g.nodes.keys()
+        assert gc.incoming_nodes("s2") == g.incoming_nodes("s2")
+        assert gc.major_claim == g.major_claim
+
+        copied_atom = gc.atom_nodes["a5"]
+        assert copied_atom.text is atom.text
+        assert (copied_atom is atom) is not deep
+
+        gc.remove_node(gc.nodes["a1"])
+        assert "a1" in g.nodes
+
+    gc = g.copy(copy_on_write=True)
+    copied_atom = gc.atom_nodes["a5"]
+
+    assert isinstance(copied_atom.userdata, ag.model.userdata.CopyOnWriteDict)
+    assert copied_atom.participant is gc.participants[participant.id]
+    assert copied_atom.participant is not participant
+    assert copied_atom.reference is not None
+    assert copied_atom.reference.resource is gc.resources[resource.id]
+
+    copied_atom.userdata["tags"].append("b")
+    gc.userdata["nested"]["key"] = "changed"
+    copied_atom.metadata.update()
+
+    assert atom.userdata == {"tags": ["a"]}
+    assert g.userdata == {"nested": {"key": "value"}}
+    assert ag.dump.protobuf(g) == expected
+
+    # Copies made through C fast paths must not share values with the original
+    for unpack in (dict, lambda u: {**u}, copy.copy):
+        userdata = g.copy(copy_on_write=True).atom_nodes["a5"].userdata
+        unpack(userdata)["tags"].append("x")
+
+    assert atom.userdata == {"tags": ["a"]}
+    assert json.loads(json.dumps(dict(gc.userdata))) == {"nested": {"key": "changed"}}
+
+    # Values already owned by a copy-on-write mapping are not shared by its copies
+    for duplicate in (copy.copy, ag.model.userdata.CopyOnWriteDict.copy):
+        userdata = ag.model.userdata.CopyOnWriteDict({"tags": ["a"], "other": ["b"]})
+        userdata["tags"].append("c")
+        copied = duplicate(userdata)
+        userdata["tags"].append("d")
+
+        assert copied == {"tags": ["a", "c"], "other": ["b"]}
+
+
+class CustomAtomNode(ag.AtomNode):
+    __slots__ = ("extra",)
+
+
+@graph_classes
+def test_graph_pickle(graph_class: type[ag.Graph]):
+    g = generate_graph(graph_class)
+    atom = CustomAtomNode(
+        "Text",
+        reference=ag.Reference(ag.Resource("Resource"), 0, "Resource"),
+        participant=ag.Participant("Participant"),
+        userdata={"tags": ["a"]},
+        id="a5",
+    )
+    atom.extra = 42
+    g.add_edge(ag.Edge(atom, g.scheme_nodes["s2"]))
+    # Slots of subclasses may never be assigned
+    unset_atom = CustomAtomNode("Unset", id="a6")
+    g.add_edge(ag.Edge(unset_atom, g.scheme_nodes["s2"]))
+    g.atom_nodes["a1"].metadata.created  # noqa: B018
+    g.major_claim = "a4"
+
+    expected = ag.dump.protobuf(g)
+    data = pickle.dumps(g)
+    gc = pickle.loads(data)
+
+    assert type(gc) is graph_class
+    assert ag.dump.protobuf(gc) == expected
+    assert list(gc.nodes) == list(g.nodes)
+    assert list(gc.edges) == list(g.edges)
+    assert gc.major_claim == g.major_claim
+    assert gc.atom_nodes["a5"].extra == 42
+    assert not hasattr(gc.atom_nodes["a6"], "extra")
+    assert not hasattr(pickle.loads(pickle.dumps(unset_atom)), "extra")
+    assert gc.atom_nodes["a5"].participant is gc.participants[atom.participant.id]
+
+    for edge in gc.edges.values():
+        assert edge in gc.incoming_edges(edge.target)
+
+    # Hashes of strings differ between processes
+    code = (
+        "import pickle, sys; g = pickle.loads(sys.stdin.buffer.read());"
+        "assert all(e in g.outgoing_edges(e.source) for e in g.edges.values())"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        input=data,
+        check=True,
+        env=os.environ | {"PYTHONHASHSEED": "1"},
+        cwd=Path(__file__).parent.parent,
+    )
+
+
+class LabeledGraph(ag.Graph):
+    __slots__ = ("label",)
+
+
+class LabeledCompactGraph(ag.CompactGraph):
+    __slots__ = ("label",)
+
+
+# Subclasses without `__slots__` store their attributes in a `__dict__`
+class NotedGraph(LabeledGraph):
+    pass
+
+
+class NotedCompactGraph(LabeledCompactGraph):
+    pass
+
+
+class NotedAtomNode(ag.AtomNode):
+    pass
+
+
+class NotedEdge(ag.Edge):
+    pass
+
+
+class NotedParticipant(ag.Participant):
+    pass
+
+
+@pytest.mark.parametrize("graph_class", [NotedGraph, NotedCompactGraph])
+def test_graph_subclass_attributes(graph_class: type[NotedGraph]):
+    participant = NotedParticipant("Participant")
+    participant.note = "participant"
+    atom = NotedAtomNode("Premise", participant=participant, id="premise")
+    atom.note = "atom"
+    edge = NotedEdge(atom, ag.SchemeNode(id="scheme"), id="edge")
+    edge.note = "edge"
+
+    g = graph_class()
+    g.add_edge(edge)
+    g.label = "label"
+    g.note = ["graph"]
+
+    for restored, deep in (
+        (pickle.loads(pickle.dumps(g)), True),
+        (copy.deepcopy(g), True),
+        (g.copy(), True),
+        (copy.copy(g), False),
+    ):
+        assert type(restored) is graph_class
+        assert restored.label == "label"
+        assert restored.note == ["graph"]
+        assert (restored.note is g.note) is not deep
+        assert restored.atom_nodes["premise"].note == "atom"
+        assert restored.edges["edge"].note == "edge"
+        assert restored.participants[participant.id].note == "participant"
+        assert restored.outgoing_nodes("premise") == {restored.nodes["scheme"]}
+
+
+def test_compact_graph_mutations():
+    g = ag.CompactGraph()
+    claim = ag.AtomNode("Claim", id="claim")
+    previous: ag.AbstractNode = claim
+    edges: list[ag.Edge] = []
+
+    # Enough elements to trigger several compactions of the adjacency arrays
+    for i in range(500):
+        scheme = ag.SchemeNode(ag.Support.DEFAULT, id=f"s{i}")
+        premise = ag.AtomNode(f"Premise {i}", id=f"a{i}")
+        edges.append(ag.Edge(premise, scheme))
+        edges.append(ag.Edge(scheme, previous))
+        g.add_edge(edges[-2])
+        g.add_edge(edges[-1])
+        assert g.outgoing_atom_nodes(premise) == {previous}
+        previous = premise
+
+    assert g.root_node == claim
+    assert g.leaf_nodes == {previous}
+
+    for i in range(0, 500, 2):
+        g.remove_node(g.nodes[f"s{i}"])
+
+    g.compact()
+
+    assert len(g.edges) == 500
+    assert g.outgoing_nodes("a1") == {g.nodes["s1"]}
+    assert g.incoming_edges("s1") == {edges[2]}
+    assert g.outgoing_edges("a0") == set()
+    assert g.root_nodes == {g.nodes[f"a{i}"] for i in range(0, 500, 2)} | {claim}
+
+
+def test_model_slots():
+    participant = ag.Participant("Participant")
+    resource = ag.Resource("Resource")
+    atom = ag.AtomNode("Atom", ag.Reference(resource, 0, "Atom"), participant)
+    scheme = ag.SchemeNode(ag.Support.DEFAULT)
+    edge = ag.Edge(atom, scheme)
+
+    for obj in (
+        participant,
+        resource,
+        atom,
+        atom.reference,
+        atom.metadata,
+        scheme,
+        edge,
+        ag.Analyst("Analyst"),
+    ):
+        assert not hasattr(obj, "__dict__"), type(obj)
+
+    assert hash(edge) == hash(ag.Edge(atom, scheme, id=edge.id))
+    assert edge == ag.Edge(atom, scheme, id=edge.id)
+    assert edge != ag.Edge(scheme, atom, id=edge.id)
+
+
+@graph_classes
+def test_derived_cache(graph_class):
+    g = graph_class()
+    claim = ag.AtomNode("Claim")
+    premise = ag.AtomNode("Premise")
+    s1 = ag.SchemeNode(ag.Support.DEFAULT)
+    s2 = ag.SchemeNode(ag.Attack.DEFAULT)
+    g.add_edge(ag.Edge(premise, s1))
+    g.add_edge(ag.Edge(s1, s2))
+    g.add_edge(ag.Edge(s2, claim))
+
+    version = g.version
+    roots = g.root_nodes
+
+    # Repeated queries on an unchanged graph return the cached result
+    assert roots == {claim}
+    assert g.root_nodes is roots
+    assert g.outgoing_atom_nodes(premise) is g.outgoing_atom_nodes(premise)
+    assert g.incoming_atom_nodes(claim) == {premise}
+    assert g.version == version
+
+    other = ag.AtomNode("Other premise")
+    g.add_edge(ag.Edge(other, s2))
+
+    assert g.version > version
+    assert g.incoming_atom_nodes(claim) == {premise, other}
+    assert g.leaf_nodes == {premise, other}
+
+    g.remove_node(s2)
+
+    assert g.root_nodes == {claim, other}
+    assert g.root_node is None
+    assert g.outgoing_atom_nodes(premise) == set()
+
+
+@graph_classes
+def test_bulk_construction(graph_class):
+    atoms = [ag.AtomNode(f"Atom {i}", id=f"a{i}") for i in range(200)]
+    schemes = [ag.SchemeNode(ag.Support.DEFAULT, id=f"s{i}") for i in range(199)]
+    edges = [
+        edge
+        for i, scheme in enumerate(schemes)
+        for edge in (ag.Edge(atoms[i + 1], scheme), ag.Edge(scheme, atoms[i]))
+    ]
+
+    expected = graph_class()
+
+    for node in atoms[:100]:
+        expected.add_node(node)
+
+    for edge in edges:
+        expected.add_edge(edge)
+
+    g = graph_class()
+    g.add_nodes(atoms[:100])
+    g.add_edges(edges)
+
+    assert list(g.nodes) == list(expected.nodes)
+    assert list(g.edges) == list(expected.edges)
+
+    for node in expected.nodes.values():
+        assert g.incoming_edges(node) == expected.incoming_edges(node)
+        assert g.outgoing_nodes(node) == expected.outgoing_nodes(node)
+
+    # Invalid batches are rejected before modifying the graph
+    with pytest.raises(ValueError):
+        g.add_nodes([ag.AtomNode("New"), atoms[0]])
+
+    with pytest.raises(TypeError):
+        g.add_edges([ag.Edge(atoms[0], ag.SchemeNode()), "Edge"])
+
+    assert len(g.nodes) == len(expected.nodes)
+    assert len(g.edges) == len(expected.edges)
+
+
+def _random_tree(size: int, seed: int) -> ag.Graph:
+    rng = random.Random(seed)
+    g = ag.Graph()
+    atoms = [ag.AtomNode("Claim", id="a0")]
+    g.add_node(atoms[0])
+
+    for i in range(1, size):
+        premise = ag.AtomNode(f"Premise {i}", id=f"a{i}")
+        scheme = ag.SchemeNode(ag.Support.DEFAULT, id=f"s{i}")
+        g.add_edges([ag.Edge(premise, scheme), ag.Edge(scheme, rng.choice(atoms))])
+        atoms.append(premise)
+
+    return g
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_graph_index(seed):
+    g = _random_tree(100, seed)
+    index = g.index
+
+    assert index.is_forest
+    assert g.index is index
+    assert index.depths[g.nodes["a0"]] == 0
+
+    for max_levels in (None, 0, 2):
+        for node_type in (ag.AbstractNode, ag.AtomNode):
+            distances = index.all_sibling_node_distances(max_levels, node_type)
+
+            for node in g.nodes.values():
+                assert distances[node] == g._search_sibling_node_distances(
+                    node, max_levels, node_type
+                )
+
+    for node in g.atom_nodes.values():
+        ancestors = index.ancestors(node)
+        assert len(ancestors) == index.depths[node]
+        assert not ancestors or ancestors[-1] == g.nodes["a0"]
+
+    # Adding a second parent turns the tree into a DAG and rebuilds the index
+    g.add_edge(ag.Edge(g.nodes["a5"], ag.SchemeNode(), id="extra"))
+
+    assert not g.index.is_forest
+    assert g.sibling_node_distances("a5") == g._search_sibling_node_distances(
+        g.nodes["a5"], None, ag.AbstractNode
+    )
+
+    with pytest.raises(ValueError):
+        g.index.ancestors(g.nodes["a5"])
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_graph_index_distances(seed):
+    g = _random_tree(100, seed)
+    g.add_node(ag.AtomNode("Unconnected", id="u"))
+    index = g.index
+    nodes = list(g.nodes.values())
+    rng = random.Random(seed)
+
+    def neighbors(node):
+        return [*g.incoming_nodes(node), *g.outgoing_nodes(node)]
+
+    for node1, node2 in (rng.sample(nodes, 2) for _ in range(200)):
+        ancestor = index.lowest_common_ancestor(node1, node2)
+        distance = ag.traverse.node_distance(node1, node2, neighbors)
+
+        assert index.tree_distance(node1, node2) == distance
+        assert (ancestor is None) == (distance is None)
+
+        for directed in (True, False):
+            assert index.node_distance(
+                node1, node2, directed=directed
+            ) == ag.traverse.node_distance(
+                node1, node2, g.outgoing_nodes, directed=directed
+            )
+
+        if ancestor is not None:
+            assert ancestor in [node1, *index.ancestors(node1)]
+            assert ancestor in [node2, *index.ancestors(node2)]
+
+    assert index.node_distance(g.nodes["s1"], g.nodes["a0"], max_distance=0) is None
+
+    np = pytest.importorskip("numpy")
+    atoms, matrix = index.distance_matrix()
+
+    assert matrix.shape == (len(atoms), len(atoms))
+    assert np.array_equal(matrix, matrix.T)
+
+    for row, node1 in enumerate(atoms):
+        for column, node2 in enumerate(atoms):
+            expected = index.tree_distance(node1, node2)
+            assert matrix[row, column] == (-1 if expected is None else expected)
+
+    # Adding a second parent falls back to breadth-first searches
+    g.add_edge(ag.Edge(g.nodes["a5"], ag.SchemeNode(), id="extra"))
+    _, fallback = g.index.distance_matrix()
+
+    assert not g.index.is_forest
+    assert np.array_equal(fallback[: len(atoms), : len(atoms)], matrix)
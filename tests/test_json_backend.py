@@ -0,0 +1,71 @@
+import json
+import math
+from pathlib import Path
+
+import pytest
+
+import arguebuf as ag
+from arguebuf import json_backend
+
+
+@pytest.mark.parametrize("backend", list(ag.load.JsonBackend))
+def test_json_backend(tmp_path: Path, backend: ag.load.JsonBackend):
+    if backend == ag.load.JsonBackend.ORJSON:
+        pytest.importorskip("orjson")
+
+    g = ag.Graph("graph")
+    g.add_edges(
+        [
+            ag.Edge(ag.AtomNode("Prämisse 🙂"), scheme := ag.SchemeNode()),
+            ag.Edge(scheme, claim := ag.AtomNode("Claim")),
+        ]
+    )
+    g.major_claim = claim
+    g.userdata = {"number": 1, "nested": {"list": [1.5, "text", None, True]}}
+
+    for format in ag.dump.Format:
+        for prettify in (True, False):
+            file = tmp_path / f"{format.value}-{prettify}.json"
+            config = ag.dump.Config(format, prettify, backend)
+            ag.dump.file(g, file, config)
+            expected = ag.dump.dict(g, config)
+
+            assert json.loads(file.read_bytes()) == expected
+
+            if prettify:
+                # Without exponents, the numbers are formatted the same by all backends
+                assert file.read_text() == json.dumps(
+                    expected, ensure_ascii=False, indent=2
+                )
+
+    config = ag.load.Config(json_backend=backend)
+    loaded = ag.load.file(tmp_path / "arguebuf-True.json", config=config)
+
+    assert ag.dump.dict(loaded) == ag.dump.dict(g)
+    assert len(ag.load.file(tmp_path / "aif-False.json", config=config).nodes) == 3
+
+
+def test_json_backend_default(tmp_path: Path):
+    # The defaults must not change the data, even if `orjson` is installed
+    g = ag.Graph("graph")
+    g.add_node(ag.AtomNode("Claim"))
+    g.userdata = {"small": 1e-7}
+    file = tmp_path / "graph.json"
+    ag.dump.file(g, file)
+
+    assert file.read_text() == json.dumps(ag.dump.dict(g), ensure_ascii=False, indent=2)
+    assert json_backend.loads(b"1180591620717411303424") == 1180591620717411303424
+    assert math.isinf(json.loads(json_backend.dumps(math.inf)))
+
+
+@pytest.mark.parametrize("backend", list(ag.load.JsonBackend))
+def test_json_backend_fallback(backend: ag.load.JsonBackend):
+    if backend == ag.load.JsonBackend.ORJSON:
+        pytest.importorskip("orjson")
+
+    # Documents and objects that are only supported by the standard library
+    assert math.isnan(json_backend.loads(b'{"number": NaN}', backend)["number"])
+    assert json.loads(json_backend.dumps({1: "one"}, False, backend)) == {"1": "one"}
+
+    with pytest.raises(json.JSONDecodeError):
+        json_backend.loads(b"{", backend)
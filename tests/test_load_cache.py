@@ -0,0 +1,109 @@
+import functools
+import os
+from operator import add
+from pathlib import Path
+
+import arguebuf as ag
+
+
+def test_load_cache(tmp_path: Path):
+    calls: list[str] = []
+
+    def nlp(text: str) -> str:
+        calls.append(text)
+        return text.upper()
+
+    file = tmp_path / "graph.json"
+    g = ag.Graph()
+    g.add_node(ag.AtomNode("claim"))
+    ag.dump.file(g, file)
+
+    # Local functions have no stable name, so the entries are distinguished by `key`
+    cache = ag.load.Cache(tmp_path / "cache", key="upper")
+    config = ag.load.Config(nlp=nlp, cache=cache)
+
+    first = ag.load.file(file, config=config)
+    second = ag.load.file(file, config=config)
+
+    assert calls == ["claim"]
+    assert [node.text for node in second.atom_nodes.values()] == ["CLAIM"]
+    assert second.atom_nodes.keys() == first.atom_nodes.keys()
+    assert len(cache) == 1
+
+    # Changing the config or the files invalidates the entry
+    ag.load.file(file, config=ag.load.Config(cache=cache))
+    assert len(cache) == 2
+
+    (tmp_path / "graph.txt").write_text("resource")
+    assert len(ag.load.file(file, config=config).resources) == 1
+
+    g.add_node(ag.AtomNode("premise"))
+    ag.dump.file(g, file)
+    assert len(ag.load.file(file, config=config).nodes) == 2
+    assert sorted(calls) == ["claim", "claim", "claim", "premise"]
+
+    # Corrupt entries are replaced
+    for entry in (tmp_path / "cache").iterdir():
+        entry.write_bytes(b"")
+
+    assert len(ag.load.file(file, config=config).nodes) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_load_cache_json_backend(tmp_path: Path):
+    file = tmp_path / "graph.json"
+    g = ag.Graph()
+    g.add_node(ag.AtomNode("claim"))
+    ag.dump.file(g, file)
+
+    cache = ag.load.Cache(tmp_path / "cache")
+
+    for backend in ag.load.JsonBackend:
+        ag.load.file(file, config=ag.load.Config(cache=cache, json_backend=backend))
+
+    # Configs differing only in plain values must not share an entry
+    assert len(cache) == len(ag.load.JsonBackend)
+
+
+def test_load_cache_unstable_nlp(tmp_path: Path):
+    file = tmp_path / "graph.json"
+    g = ag.Graph()
+    g.add_node(ag.AtomNode("x"))
+    ag.dump.file(g, file)
+
+    cache = ag.load.Cache(tmp_path / "cache")
+    texts: list[str] = []
+
+    for nlp in (lambda s: s.upper(), lambda s: s * 2, functools.partial(add, "p")):
+        graph = ag.load.file(file, config=ag.load.Config(nlp=nlp, cache=cache))
+        texts.extend(node.text for node in graph.atom_nodes.values())
+
+    # Lambdas and partials cannot be told apart, so they are never cached
+    assert texts == ["X", "xx", "px"]
+    assert len(cache) == 0
+
+
+def test_load_cache_eviction(casebase: Path, tmp_path: Path):
+    folder = casebase / "first" / "format=arguebuf,lang=en"
+    cache = ag.load.Cache(tmp_path / "cache", max_size=None)
+    config = ag.load.Config(cache=cache)
+    entries: list[Path] = []
+
+    for i in range(3):
+        before = set(cache.directory.glob("*"))
+        ag.load.file(folder / f"{i}.json", config=config)
+        (entry,) = set(cache.directory.glob("*")) - before
+        # Explicit modification times, the file system may not be precise enough
+        os.utime(entry, ns=(i * 10**9, i * 10**9))
+        entries.append(entry)
+
+    # Using an entry marks it as recently used
+    ag.load.file(folder / "0.json", config=config)
+
+    cache.max_size = 3 * max(entry.stat().st_size for entry in entries)
+    ag.load.file(folder / "3.json", config=config)
+
+    assert len(cache) == 3
+    assert [entry.exists() for entry in entries] == [True, False, True]
@@ -1,14 +1,192 @@
 import json
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
 from deepdiff.diff import DeepDiff
 
 import arguebuf as ag
+from arguebuf.load import _load_casebase
 
 ARGUEBASE = Path("data", "arguebase")
 
 
+def _upper(text: str) -> str:
+    return text.upper()
+
+
+def _nlp_factory():
+    return _upper
+
+
+@pytest.mark.parametrize("jobs", [None, 2])
+def test_load_folder_parallel(casebase: Path, jobs: int | None):
+    errors: list[Path] = []
+    config = ag.load.Config(nlp_factory=_nlp_factory)
+
+    graphs = ag.load.folder(
+        casebase,
+        "**/*.json",
+        config=config,
+        jobs=jobs,
+        on_error=lambda path, _: errors.append(path),
+    )
+
+    assert list(graphs) == sorted(graphs)
+    assert len(graphs) == 8
+    assert [path.name for path in errors] == ["broken.json"]
+
+    for graph in graphs.values():
+        assert all(node.text.isupper() for node in graph.atom_nodes.values())
+
+    with pytest.raises(ValueError):
+        ag.load.folder(casebase, "**/*.json", jobs=jobs)
+
+
+def test_load_casebase_parallel(casebase: Path):
+    kwargs = {
+        "include": ag.load.CasebaseFilter(".*", lang="en"),
+        "basepath": casebase,
+        "on_error": lambda path, error: None,
+    }
+
+    graphs = ag.load.casebase(**kwargs)
+
+    assert len(graphs) == 4
+    assert list(ag.load.casebase(**kwargs, jobs=2)) == list(graphs)
+
+    with ThreadPoolExecutor(2) as executor:
+        assert list(ag.load.casebase(**kwargs, executor=executor)) == list(graphs)
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(2)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.mark.parametrize("jobs,prefetch", [(None, None), (None, 1), (2, None)])
+def test_iter_folder(casebase: Path, jobs: int | None, prefetch: int | None):
+    kwargs = {"on_error": lambda path, error: None}
+    graphs = ag.load.folder(casebase, "**/*.json", **kwargs)
+    iterator = ag.load.iter_folder(
+        casebase, "**/*.json", jobs=jobs, prefetch=prefetch, **kwargs
+    )
+
+    assert [(path, graph.name) for path, graph in iterator] == [
+        (path, graph.name) for path, graph in graphs.items()
+    ]
+
+    # Stopping early must not wait for the remaining files
+    for _ in ag.load.iter_folder(casebase, "**/*.json", jobs=jobs, prefetch=prefetch):
+        break
+
+
+def test_iter_casebase_prefetch(casebase: Path):
+    with _CountingExecutor() as executor:
+        iterator = ag.load.iter_casebase(
+            ag.load.CasebaseFilter(".*", lang="de"),
+            basepath=casebase,
+            executor=executor,
+            prefetch=2,
+        )
+
+        path, graph = next(iterator)
+
+        assert path.relative_to(casebase).parts[0] == "second"
+        assert graph.name == "0"
+        assert executor.submitted == 3
+
+        iterator.close()
+
+        assert executor.submitted == 3
+
+
+def test_casebase_exclude(casebase: Path):
+    include = ag.load.CasebaseFilter(".*")
+    kwargs = {"basepath": casebase, "on_error": lambda path, error: None}
+
+    assert len(ag.load.casebase(include, **kwargs)) == 8
+    assert {
+        path.parent.name
+        for path in ag.load.casebase(include, ag.load.CasebaseFilter("first"), **kwargs)
+    } == {"format=arguebuf,lang=de"}
+    assert [
+        path.name
+        for path in ag.load.casebase(
+            include, ag.load.CasebaseFilter(".*", r"[1-3]", lang="en"), **kwargs
+        )
+    ] == ["0.json", "0.json", "1.json", "2.json", "3.json"]
+
+
+def test_casebase_index(casebase: Path):
+    folder = casebase / "second" / "format=arguebuf,lang=de"
+    (folder / "1.txt").write_text("Resource text")
+    include = ag.load.CasebaseFilter("second")
+
+    index = ag.load.CasebaseIndex(casebase)
+
+    assert list(index.folders) == [
+        casebase / "first" / "format=arguebuf,lang=en",
+        folder,
+    ]
+    assert index.select([include]) == [
+        (folder / "0.json", False),
+        (folder / "1.json", folder / "1.txt"),
+        (folder / "2.json", False),
+        (folder / "3.json", False),
+    ]
+    assert not index.stale
+
+    graphs = ag.load.casebase(include, index=index)
+
+    assert len(graphs[folder / "0.json"].resources) == 0
+    assert len(graphs[folder / "1.json"].resources) == 1
+
+    # Adding a case invalidates the cached index
+    assert len(ag.load.casebase(include, basepath=casebase)) == 4
+    ag.dump.file(graphs[folder / "0.json"], folder / "4.json")
+
+    assert index.stale
+    assert len(ag.load.casebase(include, basepath=casebase)) == 5
+
+
+def test_casebase_index_recursive(casebase: Path):
+    include = ag.load.CasebaseFilter(".*", lang="en")
+    kwargs = {
+        "basepath": casebase,
+        "glob": "**/format=*",
+        "on_error": lambda path, error: None,
+    }
+    index = ag.load.CasebaseIndex(casebase, "**/format=*")
+
+    assert list(index.folders) == [
+        casebase / "first" / "format=arguebuf,lang=en",
+        casebase / "second" / "format=arguebuf,lang=de",
+    ]
+    assert len(ag.load.casebase(include, **kwargs)) == 4
+
+    # Adding a case folder at any depth invalidates the cached index
+    folder = casebase / "third" / "nested" / "format=arguebuf,lang=en"
+    folder.mkdir(parents=True)
+    ag.dump.file(ag.Graph("third"), folder / "0.json")
+
+    assert index.stale
+    assert len(ag.load.casebase(include, **kwargs)) == 5
+
+
+def test_casebase_index_cache_size(tmp_path: Path):
+    for i in range(2 * _load_casebase._INDEX_CACHE_SIZE):
+        _load_casebase._get_index(tmp_path, f"{i}/*")
+
+    assert len(_load_casebase._indexes) <= _load_casebase._INDEX_CACHE_SIZE
+
+
 # def test_convert_kialo():
 #     graphs = ag.load.casebase(
 #         ag.load.CasebaseFilter("kialo", r"^the-"),
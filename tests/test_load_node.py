@@ -1,15 +1,19 @@
+import io
 import json
 from xml.etree import ElementTree as ET
 
 import pendulum
 import pytest
+from arg_services.graph.v1 import graph_pb2
 
 import arguebuf as ag
+from arguebuf.dump._dump_protobuf import metadata_to_protobuf
 from arguebuf.load._config import DefaultConfig
 from arguebuf.load._load_aif import atom_from_aif
 from arguebuf.load._load_aml import atom_from_aml, scheme_from_aml
 from arguebuf.load._load_argdown import atom_from_argdown
-from arguebuf.load._load_ova import atom_from_ova
+from arguebuf.load._load_ova import _inject_original_text, atom_from_ova
+from arguebuf.load._load_protobuf import metadata_from_protobuf
 from arguebuf.load._load_sadface import atom_from_sadface, scheme_from_sadface
 from arguebuf.load._load_xaif import atom_from_xaif, scheme_from_xaif
 from arguebuf.model.node import Support
@@ -189,6 +193,22 @@ def test_aif_node_AN(data, id, text, type, date):
     assert node.userdata == {}
 
 
+def test_protobuf_metadata_lazy():
+    proto = graph_pb2.Metadata()
+    proto.created.FromDatetime(pendulum.datetime(2015, 12, 14, 12, 9, 15))
+    proto.updated.FromNanoseconds(1_450_095_000_123_456_789)
+
+    metadata = metadata_from_protobuf(proto, DefaultConfig)
+
+    # The raw values are passed through without constructing pendulum objects
+    assert metadata_to_protobuf(metadata) == proto
+    assert not isinstance(metadata._created, pendulum.DateTime)
+
+    assert metadata.created == pendulum.datetime(2015, 12, 14, 12, 9, 15)
+    assert metadata.updated == pendulum.datetime(2015, 12, 14, 12, 10, 0, 123456)
+    assert metadata_to_protobuf(metadata).created == proto.created
+
+
 @pytest.mark.parametrize("data,id,text,type", xaif_data_AtomNode)
 def test_xaif_node_AN(data, id, text, type):
     data_json = json.loads(data)
@@ -218,6 +238,51 @@ def test_ova_node_AN(data, id, text, type, date):
     assert node.userdata == {}
 
 
+ova_data_original_text = [
+    (
+        (
+            'Intro <span class="highlighted" id="node1">First claim</span> and'
+            '<br><span class="highlighted" id="node2">Second claim</span>'
+        ),
+        {"1": 6, "2": 22},
+    ),
+    (
+        (
+            '&lt;tag&gt; &amp; <span id="node1">Ärger über Öl 🙂</span><br/><br>'
+            "text <!-- comment --> <b>bold <i>nested</i> tail</b> after"
+            '<span id="node3">Third</span><span id="node4"></span>'
+        ),
+        {"1": 8, "3": 62, "4": 67},
+    ),
+    (
+        (
+            '<p>para <span id="node1">x</span></p><div>d<span id="node2">y'
+            '<span id="node3">z</span>w</span></div><?pi x?>q<span id="node4">k</span>'
+        ),
+        {"1": 5, "2": 7, "3": 8, "4": 17},
+    ),
+    ("", {}),
+]
+
+
+@pytest.mark.parametrize("raw_text,offsets", ova_data_original_text)
+def test_ova_original_text(raw_text: str, offsets: dict[str, int]):
+    nodes = {key: ag.AtomNode(f"Node {key}") for key in ("1", "2", "3", "4")}
+    resource = ag.Resource("Text")
+
+    _inject_original_text(raw_text, nodes, resource, DefaultConfig)
+
+    assert {
+        key: node.reference.offset
+        for key, node in nodes.items()
+        if node.reference is not None
+    } == offsets
+
+    for node in nodes.values():
+        if node.reference is not None:
+            assert node.reference.resource is resource
+
+
 sadface_data_SchemeNode = [
     (
         """
@@ -383,3 +448,41 @@ def test_ova_node_SN(data, id, text, type, date):
     assert node2.reference is None
     assert node2.metadata == {}
 '''
+
+
+kialo_export = """Discussion Title: Gold or silver?
+
+1. Gold is better than silver.
+  Most people agree.
+1.1. Pro: Gold does not \\(easily\\) tarnish.
+1.1.1. Con: See [this study](https://example.com).
+
+1.2. Con: Silver is cheaper.
+1.2.1. Pro: -> See 1.1.1.
+1.3. Both are metals.
+"""
+
+
+def test_load_kialo():
+    graph = ag.load.kialo(io.StringIO(kialo_export))
+
+    assert graph.name == "Gold or silver?"
+    assert graph.major_claim is not None
+    assert graph.major_claim.id == "1."
+    assert {id: node.plain_text for id, node in graph.atom_nodes.items()} == {
+        "1.": "Gold is better than silver.\nMost people agree.",
+        "1.1.": "Gold does not (easily) tarnish.",
+        "1.1.1.": "See this study.\n",
+        "1.2.": "Silver is cheaper.",
+        "1.3.": "Both are metals.",
+    }
+    assert {id: type(node.scheme) for id, node in graph.scheme_nodes.items()} == {
+        "1.1.scheme": ag.Support,
+        "1.1.1.scheme": ag.Attack,
+        "1.2.scheme": ag.Attack,
+        "1.2.1.scheme": ag.Support,
+        "1.3.scheme": ag.Rephrase,
+    }
+    # References reuse the atom node they point to
+    assert graph.outgoing_nodes("1.2.1.scheme") == {graph.atom_nodes["1.2."]}
+    assert graph.incoming_nodes("1.2.1.scheme") == {graph.atom_nodes["1.1.1."]}
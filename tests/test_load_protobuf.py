@@ -0,0 +1,21 @@
+from pathlib import Path
+
+import pytest
+
+import arguebuf as ag
+
+
+@pytest.mark.parametrize("suffix", [".pb", ".binpb"])
+def test_load_binary_protobuf(casebase: Path, tmp_path: Path, suffix: str):
+    g = ag.load.file(casebase / "first" / "format=arguebuf,lang=en" / "0.json")
+    file = tmp_path / f"graph{suffix}"
+
+    ag.dump.file(g, file)
+    loaded = ag.load.file(file)
+
+    assert file.read_bytes() == ag.dump.protobuf(g).SerializeToString()
+    assert loaded.name == "graph"
+    assert ag.dump.dict(loaded) == ag.dump.dict(g)
+
+    with pytest.raises(ValueError):
+        ag.dump.file(g, file, ag.dump.Config(format=ag.dump.Format.AIF))
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pytest
+
+import arguebuf as ag
+
+
+@pytest.mark.parametrize(
+    ("suffix", "output_format"),
+    [
+        (".json", ag.dump.Format.ARGUEBUF),
+        (".pb", ag.dump.Format.ARGUEBUF),
+        (".json.gz", ag.dump.Format.ARGUEBUF),
+        (".json", ag.dump.Format.AIF),
+    ],
+)
+def test_load_summary(tmp_path: Path, suffix: str, output_format: ag.dump.Format):
+    g = ag.Graph("graph")
+    participant = ag.Participant("Name")
+    claim = ag.AtomNode("Claim", participant=participant)
+    g.add_participant(participant)
+    g.major_claim = claim
+
+    for i, scheme in enumerate([ag.Support.DEFAULT, ag.Support.EXAMPLE, None]):
+        premise = ag.AtomNode(f"Premise {i}")
+        node = ag.SchemeNode(scheme)
+        g.add_edges([ag.Edge(premise, node), ag.Edge(node, claim)])
+
+        rebuttal = ag.AtomNode(f"Rebuttal {i}")
+        attack = ag.SchemeNode(ag.Attack.DEFAULT)
+        g.add_edges([ag.Edge(rebuttal, attack), ag.Edge(attack, premise)])
+
+    file = tmp_path / f"graph{suffix}"
+    ag.dump.file(g, file, ag.dump.Config(format=output_format))
+    summary = ag.load.summary(file)
+
+    assert summary == ag.load.Summary.from_graph(ag.load.file(file))
+    assert summary.name == "graph"
+    assert (summary.atom_nodes, summary.scheme_nodes, summary.edges) == (7, 6, 12)
+    assert summary.depth == 4
+    assert summary.mean_depth == 18 / 7
+
+    if output_format == ag.dump.Format.ARGUEBUF:
+        assert summary == ag.load.Summary.from_graph(g)
+        assert summary.schemes == {
+            "Support": 1,
+            "Support: Example": 1,
+            "Unknown": 1,
+            "Attack": 3,
+        }
+        assert summary.participants == 1
+        assert summary.major_claim
@@ -132,3 +132,49 @@ def test_preprocess_dialog_no_dialogue_nodes():
     assert len(result["edges"]) == len(original["edges"])
     assert all(n in result["nodes"] for n in original["nodes"])
     assert all(e in result["edges"] for e in original["edges"])
+
+
+def test_preprocess_dialog_rephrase_and_bypass():
+    """Test the rephrase nodes and bypass edges created for a small dialog."""
+    original: aif.Graph = {
+        "nodes": [
+            {"nodeID": "i1", "text": "Claim 1", "type": "I", "timestamp": "t1"},
+            {"nodeID": "i2", "text": "Claim 2", "type": "I", "timestamp": "t2"},
+            {"nodeID": "i3", "text": "Claim 3", "type": "I", "timestamp": ""},
+            {"nodeID": "ra", "text": "Support", "type": "RA", "timestamp": ""},
+            {"nodeID": "l1", "text": "Speaker 1", "type": "L", "timestamp": ""},
+            {"nodeID": "l2", "text": "Speaker 2", "type": "L", "timestamp": ""},
+            {"nodeID": "ya1", "text": "Asserting", "type": "YA", "timestamp": ""},
+            {"nodeID": "ya2", "text": "Asserting", "type": "YA", "timestamp": ""},
+            {"nodeID": "ya3", "text": "Arguing", "type": "YA", "timestamp": ""},
+            {"nodeID": "ta", "text": "Default Transition", "type": "TA"},
+        ],
+        "edges": [
+            {"edgeID": "e1", "fromID": "l1", "toID": "ya1", "formEdgeID": None},
+            {"edgeID": "e2", "fromID": "ya1", "toID": "i1", "formEdgeID": None},
+            {"edgeID": "e3", "fromID": "l2", "toID": "ya2", "formEdgeID": None},
+            {"edgeID": "e4", "fromID": "ya2", "toID": "i2", "formEdgeID": None},
+            {"edgeID": "e5", "fromID": "l1", "toID": "ta", "formEdgeID": None},
+            {"edgeID": "e6", "fromID": "ta", "toID": "l2", "formEdgeID": None},
+            {"edgeID": "e7", "fromID": "i3", "toID": "ya3", "formEdgeID": None},
+            {"edgeID": "e8", "fromID": "ya3", "toID": "ra", "formEdgeID": None},
+            {"edgeID": "e9", "fromID": "ra", "toID": "i1", "formEdgeID": None},
+        ],
+        "locutions": [],
+    }
+
+    result = preprocess_dialog(original)
+    nodes = {n["nodeID"]: n for n in result["nodes"]}
+    edges = {(e["fromID"], e["toID"]) for e in result["edges"]}
+
+    # i1 is supported by ra, so only i2 is connected to i1 via a rephrase node
+    rephrases = [n for n in result["nodes"] if n["type"] == "MA"]
+    assert len(rephrases) == 1
+    assert rephrases[0]["timestamp"] == "t2"
+    assert {("i2", rephrases[0]["nodeID"]), (rephrases[0]["nodeID"], "i1")} <= edges
+
+    # The assertion of the argument is bypassed
+    assert ("i3", "ra") in edges
+    assert ("ra", "i1") in edges
+    assert len(result["edges"]) == 4
+    assert set(nodes) == {"i1", "i2", "i3", "ra", rephrases[0]["nodeID"]}
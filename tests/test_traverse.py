@@ -0,0 +1,111 @@
+import itertools
+
+import pytest
+
+import arguebuf as ag
+
+SIZE = 100_000
+
+
+# Plain adjacency lists keep the setup of the large graphs cheap,
+# the traversal functions only depend on the `connections` callable.
+
+
+@pytest.fixture(scope="module")
+def chain():
+    """Chain `0 -> 1 -> ... -> SIZE - 1`."""
+
+    nodes = list(range(SIZE))
+    outgoing = {node: [node + 1] for node in nodes[:-1]} | {nodes[-1]: []}
+    incoming = {node: [node - 1] for node in nodes[1:]} | {nodes[0]: []}
+
+    return outgoing.__getitem__, incoming.__getitem__, nodes
+
+
+@pytest.fixture(scope="module")
+def ladder():
+    """DAG of `SIZE / 2` layers with two nodes each.
+
+    Both nodes of a layer are connected to both nodes of the next layer,
+    so the number of paths grows exponentially with the number of layers.
+    """
+
+    layers = [(2 * i, 2 * i + 1) for i in range(SIZE // 2)]
+    outgoing = {
+        node: list(current)
+        for previous, current in itertools.pairwise(layers)
+        for node in previous
+    } | {node: [] for node in layers[-1]}
+
+    return outgoing.__getitem__, layers
+
+
+def test_traversal_order(chain):
+    outgoing, incoming, nodes = chain
+
+    assert ag.traverse.bfs(nodes[0], outgoing) == nodes
+    assert ag.traverse.dfs(nodes[-1], incoming) == nodes[::-1]
+    assert ag.traverse.bfs(nodes[0], outgoing, include_start=False) == nodes[1:]
+    assert ag.traverse.dfs(nodes[0], incoming) == [nodes[0]]
+
+
+def test_traversal_early_termination(chain):
+    outgoing, _, nodes = chain
+    visited: list[int] = []
+
+    def connections(node: int):
+        visited.append(node)
+        return outgoing(node)
+
+    for iterator in (ag.traverse.iter_bfs, ag.traverse.iter_dfs):
+        visited.clear()
+        assert list(itertools.islice(iterator(nodes[0], connections), 5)) == nodes[:5]
+        assert len(visited) == 4
+
+
+def test_traversal_depth_limit(ladder):
+    outgoing, layers = ladder
+    start = layers[0][0]
+
+    bfs = list(ag.traverse.iter_bfs(start, outgoing, max_depth=3))
+    dfs = list(ag.traverse.iter_dfs(start, outgoing, max_depth=3))
+
+    assert bfs[0] == start
+    assert set(bfs[1:]) == {node for layer in layers[1:4] for node in layer}
+    assert set(dfs) == set(bfs)
+
+    assert len(ag.traverse.bfs(start, outgoing)) == SIZE - 1
+    assert len(ag.traverse.dfs(start, outgoing)) == SIZE - 1
+
+
+def test_node_distance(chain, ladder):
+    outgoing, _, nodes = chain
+
+    assert ag.traverse.node_distance(nodes[0], nodes[-1], outgoing) == SIZE - 1
+    assert ag.traverse.node_distance(nodes[-1], nodes[0], outgoing) is None
+    assert ag.traverse.node_distance(nodes[0], nodes[-1], outgoing, 10) is None
+    assert (
+        ag.traverse.node_distance(nodes[-1], nodes[0], outgoing, directed=False)
+        == SIZE - 1
+    )
+    assert (
+        ag.traverse.node_distance(
+            nodes[-1], nodes[-11], outgoing, max_distance=10, directed=False
+        )
+        == 10
+    )
+
+    outgoing, layers = ladder
+
+    # The shortest path has to be found without enumerating all paths
+    assert (
+        ag.traverse.node_distance(layers[0][0], layers[-1][1], outgoing)
+        == len(layers) - 1
+    )
+    assert ag.traverse.node_distance(layers[0][0], layers[0][1], outgoing) is None
+    assert (
+        ag.traverse.node_distance(
+            layers[-1][1], layers[-3][0], outgoing, directed=False
+        )
+        == 2
+    )